@@ -3,10 +3,11 @@ import logging
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
-from flask import Flask, g, jsonify
-from flask_sqlalchemy import SQLAlchemy
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+from flask import Flask, g, jsonify
+from flask_sqlalchemy import SQLAlchemy
 
 # Initialize extensions
 db = SQLAlchemy()
@@ -33,12 +34,12 @@ def create_app(config_name="development"):
 
     # Register blueprints
     from app.routes.auth import auth_bp
+    from app.routes.contacts import bp as contacts_bp
     from app.routes.dashboard import bp as dashboard_bp
-    from app.routes.tasks import bp as tasks_bp
     from app.routes.events import bp as events_bp
-    from app.routes.contacts import bp as contacts_bp
-    from app.routes.settings import bp as settings_bp
     from app.routes.health import bp as health_bp
+    from app.routes.settings import bp as settings_bp
+    from app.routes.tasks import bp as tasks_bp
 
     app.register_blueprint(auth_bp)
     app.register_blueprint(dashboard_bp, url_prefix="/dashboard")
@@ -71,6 +72,8 @@ def create_app(config_name="development"):
     # Initialize scheduler
     if not scheduler.running:
         from app.tasks.daily_digest import send_daily_digests
+        from app.tasks.event_occurrences import refresh_event_occurrences
+        from app.tasks.news_refresh import refresh_news_cache
 
         timezone = ZoneInfo(app.config.get("TIMEZONE", "Europe/Prague"))
         digest_hour = app.config.get("DIGEST_HOUR", 7)
@@ -86,6 +89,35 @@ def create_app(config_name="development"):
             replace_existing=True,
         )
 
+        # Keep the news cache warm so digest and UI readers never fetch feeds
+        news_refresh_minutes = app.config.get("NEWS_REFRESH_MINUTES", 60)
+        if news_refresh_minutes:
+            scheduler.add_job(
+                func=lambda: refresh_news_cache(app),
+                trigger=IntervalTrigger(minutes=news_refresh_minutes, timezone=timezone),
+                next_run_time=datetime.now(timezone),
+                id="news_refresh",
+                name="Refresh news cache",
+                max_instances=1,
+                coalesce=True,
+                replace_existing=True,
+            )
+
+        # Roll the materialized event occurrence window forward
+        if app.config.get("EVENT_OCCURRENCES_ENABLED"):
+            scheduler.add_job(
+                func=lambda: refresh_event_occurrences(app),
+                trigger=IntervalTrigger(
+                    hours=app.config.get("EVENT_OCCURRENCE_REFRESH_HOURS", 24), timezone=timezone
+                ),
+                next_run_time=datetime.now(timezone),
+                id="event_occurrences",
+                name="Refresh materialized event occurrences",
+                max_instances=1,
+                coalesce=True,
+                replace_existing=True,
+            )
+
         scheduler.start()
         logger.info(
             f"Scheduler started. Daily digest job scheduled for {digest_hour:02d}:{digest_minute:02d} {timezone}"
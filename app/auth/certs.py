@@ -0,0 +1,155 @@
+"""Cached Firebase public keys for ID token verification."""
+import logging
+import re
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+from cryptography.x509 import load_pem_x509_certificate
+from jwt.algorithms import RSAAlgorithm
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_CERTS_URL = "https://www.googleapis.com/robot/v1/metadata/x509/securetoken@system.gserviceaccount.com"
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+_caches: Dict[str, "PublicKeyCache"] = {}
+_caches_lock = threading.Lock()
+
+
+def parse_max_age(cache_control: str) -> Optional[int]:
+    """Return the max-age of a Cache-Control header, or None."""
+    match = _MAX_AGE_RE.search(cache_control or "")
+    return int(match.group(1)) if match else None
+
+
+def parse_keys(data: dict) -> Dict[str, object]:
+    """
+    Turn a certs response into public key objects by key id.
+
+    Accepts Google's x509 format ({kid: PEM certificate}) and JWKS
+    ({"keys": [jwk, ...]}, used by the emulator and local stubs).
+    """
+    if "keys" in data:
+        return {jwk["kid"]: RSAAlgorithm.from_jwk(jwk) for jwk in data["keys"] if jwk.get("kid")}
+    return {
+        kid: load_pem_x509_certificate(pem.encode()).public_key()
+        for kid, pem in data.items()
+    }
+
+
+class PublicKeyCache:
+    """
+    Public keys of one certs endpoint, cached for the response's max-age.
+
+    Keys are parsed once per download, so verification only does the RSA
+    check. Inside the last `refresh_margin` seconds before expiry a reader
+    starts a background refresh and keeps using the current keys. An
+    unknown key id (key rotation) forces a refresh, at most once every
+    `min_refresh_interval` seconds. If a refresh fails the old keys stay in
+    use until a download succeeds.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        timeout: float = 5,
+        default_ttl: int = 3600,
+        refresh_margin: int = 300,
+        min_refresh_interval: int = 30,
+    ):
+        self.url = url
+        self.timeout = timeout
+        self.default_ttl = default_ttl
+        self.refresh_margin = refresh_margin
+        self.min_refresh_interval = min_refresh_interval
+
+        self._keys: Dict[str, object] = {}
+        self._expires_at = 0.0
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self.stats = {"fetches": 0, "failures": 0, "background_refreshes": 0}
+
+    def _fetch(self):
+        """Download and parse the keys (caller holds the lock)."""
+        self.stats["fetches"] += 1
+        try:
+            response = requests.get(self.url, timeout=self.timeout)
+            response.raise_for_status()
+            keys = parse_keys(response.json())
+        except Exception as e:
+            self.stats["failures"] += 1
+            logger.warning(f"Failed to fetch public keys from {self.url}: {e}")
+            if not self._keys:
+                raise ValueError(f"Public keys unavailable: {e}") from e
+            # Keep serving the old keys and back off before retrying
+            self._expires_at = max(self._expires_at, time.time() + self.min_refresh_interval)
+            return
+
+        max_age = parse_max_age(response.headers.get("Cache-Control"))
+        now = time.time()
+        self._keys = keys
+        self._fetched_at = now
+        self._expires_at = now + (max_age if max_age is not None else self.default_ttl)
+
+    def _refresh_in_background(self):
+        """Refresh the keys in a daemon thread unless one is already running."""
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+            self.stats["background_refreshes"] += 1
+
+        def run():
+            try:
+                with self._lock:
+                    self._fetch()
+            except ValueError:
+                pass
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=run, name="certs-refresh", daemon=True).start()
+
+    def get_key(self, kid: str):
+        """
+        Public key for a token's key id.
+
+        Raises:
+            ValueError: If the key id is unknown or no keys can be loaded
+        """
+        now = time.time()
+        if now >= self._expires_at:
+            with self._lock:
+                if time.time() >= self._expires_at:
+                    self._fetch()
+        elif now >= self._expires_at - self.refresh_margin:
+            self._refresh_in_background()
+
+        key = self._keys.get(kid)
+        if key is None and time.time() - self._fetched_at >= self.min_refresh_interval:
+            # Possibly a rotated key we haven't seen yet
+            with self._lock:
+                if kid not in self._keys and time.time() - self._fetched_at >= self.min_refresh_interval:
+                    self._fetch()
+            key = self._keys.get(kid)
+
+        if key is None:
+            raise ValueError(f"Unknown key id: {kid}")
+        return key
+
+    @property
+    def expires_at(self) -> float:
+        return self._expires_at
+
+
+def get_key_cache(url: str) -> PublicKeyCache:
+    """Process-wide key cache for a certs URL."""
+    with _caches_lock:
+        cache = _caches.get(url)
+        if cache is None:
+            cache = _caches[url] = PublicKeyCache(url)
+        return cache
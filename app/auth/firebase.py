@@ -2,11 +2,18 @@
 import logging
 from functools import wraps
 
-import requests
+import jwt
 from flask import g, request, jsonify, current_app
 
+from app.auth.certs import GOOGLE_CERTS_URL, get_key_cache
+from app.auth.principal import Principal, get_principal_cache
+from app.auth.token_cache import get_token_cache
+
 logger = logging.getLogger(__name__)
 
+# Tolerated clock difference for iat/exp checks
+CLOCK_SKEW_SECONDS = 10
+
 
 def verify_id_token(id_token: str) -> dict:
     """
@@ -29,59 +36,96 @@ def verify_id_token(id_token: str) -> dict:
             if len(parts) == 2:
                 return {"uid": parts[0], "email": parts[1], "email_verified": True}
 
-    # Verify using Google's public keys
     try:
-        # Get Google's public keys
-        certs_url = "https://www.googleapis.com/robot/v1/metadata/x509/securetoken@system.gserviceaccount.com"
-        
+        header = jwt.get_unverified_header(id_token)
         if emulator_host:
-            # Use emulator endpoint
-            certs_url = f"http://{emulator_host}/emulator/v1/projects/{project_id}/jwks"
-
-        # For production, use PyJWT or similar library
-        # This is a simplified version for demonstration
-        
-        # Parse token header (simplified - in production use PyJWT)
-        import json
-        import base64
-        
-        parts = id_token.split(".")
-        if len(parts) != 3:
-            raise ValueError("Invalid token format")
-        
-        # Decode payload (add padding if needed)
-        payload_b64 = parts[1]
-        payload_b64 += "=" * (4 - len(payload_b64) % 4)
-        payload = json.loads(base64.urlsafe_b64decode(payload_b64))
-        
-        # Validate claims
-        if payload.get("iss") != allowed_issuer:
-            raise ValueError(f"Invalid issuer: {payload.get('iss')}")
-        
-        if payload.get("aud") != project_id:
-            raise ValueError(f"Invalid audience: {payload.get('aud')}")
-        
-        # Check expiration
-        import time
-        if payload.get("exp", 0) < time.time():
-            raise ValueError("Token expired")
+            # The Auth Emulator issues unsigned (alg: none) tokens: check the
+            # claims only, never outside emulator mode
+            key = None
+            options = {
+                "verify_signature": False,
+                "verify_aud": True,
+                "verify_iss": True,
+                "verify_exp": True,
+                "verify_iat": True,
+            }
+        else:
+            # Verify the RS256 signature with Google's public keys
+            if header.get("alg") != "RS256":
+                raise ValueError(f"Unsupported algorithm: {header.get('alg')}")
+            certs_url = current_app.config.get("FIREBASE_CERTS_URL") or GOOGLE_CERTS_URL
+            key = get_key_cache(certs_url).get_key(header.get("kid"))
+            options = {}
+        
+        payload = jwt.decode(
+            id_token,
+            key=key,
+            algorithms=["RS256"],
+            audience=project_id,
+            issuer=allowed_issuer,
+            leeway=CLOCK_SKEW_SECONDS,
+            options={**options, "require": ["exp", "iat", "sub"]},
+        )
+        
+        if not payload.get("sub"):
+            raise ValueError("Missing subject")
         
         return {
             "uid": payload.get("sub"),
             "email": payload.get("email"),
             "email_verified": payload.get("email_verified", False),
+            "exp": payload["exp"],
         }
         
-    except Exception as e:
+    except (jwt.PyJWTError, ValueError) as e:
         logger.error(f"Token verification failed: {e}")
-        raise ValueError(f"Invalid token: {e}")
+        raise ValueError(f"Invalid token: {e}") from e
+
+
+def _user_for_token(id_token: str) -> Principal:
+    """
+    Resolve a bearer token to its principal, creating the user on first login.
+    
+    Verified tokens are cached until they expire, so repeated requests with
+    the same token skip signature verification, the uid lookup and (within
+    the principal TTL) the users table entirely.
+    
+    Raises:
+        ValueError: If token is invalid
+    """
+    from app.models.user import User
+    from app import db
+    
+    cache = get_token_cache()
+    cached = cache.get(id_token)
+    if cached is not None:
+        principal = get_principal_cache().get(cached[1])
+        if principal is not None:
+            return principal
+    
+    token_data = verify_id_token(id_token)
+    user = User.query.filter_by(uid=token_data["uid"]).first()
+    
+    if not user:
+        user = User(
+            uid=token_data["uid"],
+            email=token_data["email"],
+            email_verified=token_data.get("email_verified", False),
+        )
+        db.session.add(user)
+        db.session.commit()
+        logger.info(f"Created new user: {user.uid}")
+    
+    cache.put(id_token, token_data, user.id)
+    return get_principal_cache().put(user)
 
 
 def require_auth(f):
     """
     Decorator to require Firebase authentication.
     
-    Sets g.current_user to the authenticated User model instance.
+    Sets g.current_user to a Principal for the authenticated user; the
+    full User model is loaded only when a handler needs it.
     """
     @wraps(f)
     def decorated_function(*args, **kwargs):
@@ -106,17 +150,15 @@ def require_auth(f):
                 db.session.commit()
                 logger.info("Created demo user for development")
             
-            g.current_user = demo_user
+            g.current_user = get_principal_cache().put(demo_user)
             session['user_id'] = demo_user.id
             return f(*args, **kwargs)
         
         # Check session for authenticated users (for page navigation)
         if not auth_header and request.method == "GET" and 'user_id' in session:
-            user_id = session['user_id']
-            from app.models.user import User
-            user = User.query.get(user_id)
-            if user:
-                g.current_user = user
+            principal = get_principal_cache().get(session['user_id'])
+            if principal:
+                g.current_user = principal
                 return f(*args, **kwargs)
         
         # Production mode: redirect to login if no token for GET requests to dashboard
@@ -126,30 +168,15 @@ def require_auth(f):
             if token_param:
                 # Verify the token from query parameter
                 try:
-                    token_data = verify_id_token(token_param)
-                    # Get or create user
-                    from app.models.user import User
-                    from app import db
-                    
-                    user = User.query.filter_by(uid=token_data["uid"]).first()
-                    
-                    if not user:
-                        user = User(
-                            uid=token_data["uid"],
-                            email=token_data["email"],
-                            email_verified=token_data.get("email_verified", False),
-                        )
-                        db.session.add(user)
-                        db.session.commit()
-                        logger.info(f"Created new user: {user.uid}")
-                    
-                    g.current_user = user
-                    session['user_id'] = user.id
-                    return f(*args, **kwargs)
+                    user = _user_for_token(token_param)
                 except ValueError as e:
                     logger.error(f"Token verification failed for query param: {e}")
                     from flask import redirect, url_for
                     return redirect(url_for("auth.login"))
+                
+                g.current_user = user
+                session['user_id'] = user.id
+                return f(*args, **kwargs)
             else:
                 from flask import redirect, url_for
                 return redirect(url_for("auth.login"))
@@ -166,7 +193,7 @@ def require_auth(f):
         id_token = auth_header.replace("Bearer ", "")
         
         try:
-            token_data = verify_id_token(id_token)
+            user = _user_for_token(id_token)
         except ValueError as e:
             # For API requests, return JSON error
             if request.path.startswith("/api/"):
@@ -176,22 +203,6 @@ def require_auth(f):
                 from flask import redirect, url_for
                 return redirect(url_for("auth.login"))
         
-        # Get or create user
-        from app.models.user import User
-        from app import db
-        
-        user = User.query.filter_by(uid=token_data["uid"]).first()
-        
-        if not user:
-            user = User(
-                uid=token_data["uid"],
-                email=token_data["email"],
-                email_verified=token_data.get("email_verified", False),
-            )
-            db.session.add(user)
-            db.session.commit()
-            logger.info(f"Created new user: {user.uid}")
-        
         g.current_user = user
         session['user_id'] = user.id
         
@@ -0,0 +1,107 @@
+"""Lightweight authenticated principal for request handlers."""
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from flask import current_app, has_app_context
+from sqlalchemy import event
+
+from app import db
+from app.models.user import User
+
+
+class Principal:
+    """
+    The authenticated user as seen by request handlers (g.current_user).
+
+    Carries only id, uid and email, which is all most handlers need. Any
+    other attribute (settings fields, to_dict(), ...) loads the ORM User on
+    first access, so handlers that only filter by user.id never touch the
+    users table. Handlers that modify the user should use `.user`
+    explicitly.
+    """
+
+    __slots__ = ("id", "uid", "email", "_user")
+
+    def __init__(self, id: int, uid: str, email: str, user: User = None):
+        self.id = id
+        self.uid = uid
+        self.email = email
+        self._user = user
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(user.id, user.uid, user.email, user=user)
+
+    @property
+    def user(self) -> User:
+        """The full ORM User, loaded on first access."""
+        if self._user is None:
+            self._user = db.session.get(User, self.id)
+        return self._user
+
+    def __getattr__(self, name):
+        return getattr(self.user, name)
+
+    def __repr__(self):
+        return f"<Principal {self.uid}>"
+
+
+class PrincipalCache:
+    """Per-process user id -> (id, uid, email) cache with a short TTL."""
+
+    def __init__(self, ttl: int = 60):
+        self.ttl = ttl
+        self._entries: Dict[int, Tuple[float, Tuple[int, str, str]]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def get(self, user_id: int) -> Optional[Principal]:
+        """Principal for a user id, loading its identity columns on a miss."""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] > time.time():
+                self.stats["hits"] += 1
+                return Principal(*entry[1])
+            self.stats["misses"] += 1
+
+        row = db.session.query(User.id, User.uid, User.email).filter(User.id == user_id).first()
+        if row is None:
+            self.invalidate(user_id)
+            return None
+        self._store(tuple(row))
+        return Principal(*row)
+
+    def put(self, user: User) -> Principal:
+        """Seed the cache from a loaded ORM User and wrap it."""
+        self._store((user.id, user.uid, user.email))
+        return Principal.from_user(user)
+
+    def _store(self, identity: Tuple[int, str, str]):
+        with self._lock:
+            self._entries[identity[0]] = (time.time() + self.ttl, identity)
+
+    def invalidate(self, user_id: int):
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+
+def get_principal_cache() -> PrincipalCache:
+    """Principal cache of the current app (created on first use)."""
+    cache = current_app.extensions.get("principal_cache")
+    if cache is None:
+        cache = current_app.extensions["principal_cache"] = PrincipalCache(
+            ttl=current_app.config.get("AUTH_PRINCIPAL_TTL", 60),
+        )
+    return cache
+
+
+def invalidate_principal(user_id: int):
+    """Drop a user's cached principal after its row changed."""
+    get_principal_cache().invalidate(user_id)
+
+
+@event.listens_for(User, "after_delete")
+def _invalidate_deleted_user(mapper, connection, user):
+    if has_app_context():
+        invalidate_principal(user.id)
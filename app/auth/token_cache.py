@@ -0,0 +1,99 @@
+"""Cache of verified ID tokens."""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from flask import current_app, has_app_context
+from sqlalchemy import event
+
+from app.models.user import User
+
+
+class TokenCache:
+    """
+    Bounded LRU of verified tokens -> (claims, user id).
+
+    Entries are keyed by the SHA-256 of the token, so raw bearer tokens are
+    never kept in memory, and expire at the token's `exp` or after
+    `max_ttl` seconds, whichever comes first.
+    """
+
+    def __init__(self, max_size: int = 1024, max_ttl: int = 300):
+        self.max_size = max(1, max_size)
+        self.max_ttl = max_ttl
+        self._entries: "OrderedDict[str, Tuple[float, Dict, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Optional[Tuple[Dict, int]]:
+        """Return (claims, user_id) for a cached, unexpired token."""
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.time():
+                if entry is not None:
+                    del self._entries[key]
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry[1], entry[2]
+
+    def put(self, token: str, claims: Dict, user_id: int):
+        """Cache a verified token until its exp (capped at max_ttl)."""
+        expires_at = time.time() + self.max_ttl
+        if claims.get("exp"):
+            expires_at = min(expires_at, claims["exp"])
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (expires_at, claims, user_id)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def invalidate_user(self, user_id: int) -> int:
+        """Drop all tokens resolved to a user; returns the number removed."""
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if entry[2] == user_id]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict:
+        """Hit/miss counters, hit rate and current size."""
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"]
+            return {
+                **self.stats,
+                "size": len(self._entries),
+                "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+            }
+
+
+def get_token_cache() -> TokenCache:
+    """Token cache of the current app (created on first use)."""
+    cache = current_app.extensions.get("token_cache")
+    if cache is None:
+        cache = current_app.extensions["token_cache"] = TokenCache(
+            max_size=current_app.config.get("AUTH_TOKEN_CACHE_SIZE", 1024),
+            max_ttl=current_app.config.get("AUTH_TOKEN_CACHE_TTL", 300),
+        )
+    return cache
+
+
+@event.listens_for(User, "after_delete")
+def _invalidate_deleted_user(mapper, connection, user):
+    """Tokens of a deleted user must not resolve to its id any more."""
+    if has_app_context():
+        get_token_cache().invalidate_user(user.id)
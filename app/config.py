@@ -31,6 +31,9 @@ class BaseConfig:
     SMTP_USER = os.getenv("SMTP_USER", "")
     SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "")
     EMAIL_FROM = os.getenv("EMAIL_FROM", "PlannerX <no-reply@example.com>")
+    SMTP_TIMEOUT = float(os.getenv("SMTP_TIMEOUT", "30"))
+    SMTP_POOL_SIZE = int(os.getenv("SMTP_POOL_SIZE", "4"))
+    SMTP_MAX_MESSAGES_PER_CONNECTION = int(os.getenv("SMTP_MAX_MESSAGES_PER_CONNECTION", "100"))
 
     # Firebase
     FIREBASE_PROJECT_ID = os.getenv("FIREBASE_PROJECT_ID", "")
@@ -42,6 +45,12 @@ class BaseConfig:
         "FIREBASE_ALLOWED_ISSUER",
         f"https://securetoken.google.com/{os.getenv('FIREBASE_PROJECT_ID', '')}",
     )
+    # x509 certs or JWKS used to verify ID tokens (defaults to Google's securetoken certs)
+    FIREBASE_CERTS_URL = os.getenv("FIREBASE_CERTS_URL", "")
+    # Verified-token cache (entries also expire at the token's exp)
+    AUTH_TOKEN_CACHE_SIZE = int(os.getenv("AUTH_TOKEN_CACHE_SIZE", "1024"))
+    AUTH_TOKEN_CACHE_TTL = int(os.getenv("AUTH_TOKEN_CACHE_TTL", "300"))
+    AUTH_PRINCIPAL_TTL = int(os.getenv("AUTH_PRINCIPAL_TTL", "60"))  # cached id/uid/email per user
 
     # Twilio (SMS)
     TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID", "")
@@ -53,13 +62,51 @@ class BaseConfig:
     DIGEST_MINUTE = int(os.getenv("DIGEST_MINUTE", "0"))
     TIMEZONE = os.getenv("TIMEZONE", "Europe/Prague")
 
+    # Materialized event occurrences (event_occurrences table)
+    EVENT_OCCURRENCES_ENABLED = os.getenv("EVENT_OCCURRENCES_ENABLED", "false").lower() == "true"
+    EVENT_OCCURRENCE_HORIZON_DAYS = int(os.getenv("EVENT_OCCURRENCE_HORIZON_DAYS", "365"))
+    EVENT_OCCURRENCE_REFRESH_HOURS = int(os.getenv("EVENT_OCCURRENCE_REFRESH_HOURS", "24"))
+    EVENT_OCCURRENCES_LOCK_FILE = BASE_DIR / "data" / "event_occurrences.lock"  # one refreshing worker
+
+    # Digest delivery pool
+    DIGEST_WORKERS = int(os.getenv("DIGEST_WORKERS", "8"))
+    DIGEST_RENDER_CONCURRENCY = int(os.getenv("DIGEST_RENDER_CONCURRENCY", "4"))  # DB + template
+    DIGEST_SEND_CONCURRENCY = int(os.getenv("DIGEST_SEND_CONCURRENCY", "8"))  # SMTP + SMS
+    DIGEST_BATCH_SIZE = int(os.getenv("DIGEST_BATCH_SIZE", "50"))  # users loaded per query
+
+    # List pagination
+    PAGE_SIZE_DEFAULT = int(os.getenv("PAGE_SIZE_DEFAULT", "50"))
+    PAGE_SIZE_MAX = int(os.getenv("PAGE_SIZE_MAX", "200"))
+    STREAM_YIELD_PER = int(os.getenv("STREAM_YIELD_PER", "500"))  # rows per fetch for streamed lists
+    ETAG_SALT = os.getenv("ETAG_SALT", "")  # set per release so new templates invalidate cached pages
+
+    # Dashboard day snapshots: memory (per worker), file (shared by workers on the host) or none
+    DASHBOARD_CACHE_BACKEND = os.getenv("DASHBOARD_CACHE_BACKEND", "memory")
+    DASHBOARD_CACHE_DIR = Path(os.getenv("DASHBOARD_CACHE_DIR", str(BASE_DIR / "data" / "dashboard_cache")))
+    DASHBOARD_CACHE_SIZE = int(os.getenv("DASHBOARD_CACHE_SIZE", "1024"))  # snapshots kept by the memory backend
+    DASHBOARD_OVERDUE_LOOKBACK_DAYS = int(os.getenv("DASHBOARD_OVERDUE_LOOKBACK_DAYS", "90"))  # 0 = all overdue tasks
+
+    # Cache and feed statistics on /health/* (otherwise they only report ok/degraded)
+    HEALTH_DETAILS_ENABLED = os.getenv("HEALTH_DETAILS_ENABLED", "false").lower() == "true"
+
     # RSS News
     RSS_CACHE_FILE = BASE_DIR / "data" / "news_cache.json"
     RSS_FEEDS_FILE = BASE_DIR / "data" / "rss_feeds.yaml"
+    RSS_FEED_STORE_DIR = BASE_DIR / "data" / "feed_cache"
     NAME_DAYS_FILE = BASE_DIR / "data" / "name_days.sk.json"
+    NEWS_REFRESH_MINUTES = int(os.getenv("NEWS_REFRESH_MINUTES", "60"))  # 0 disables the job
+    NEWS_REVALIDATE_ON_READ = True  # stale reads trigger a background refresh
+    RSS_FETCH_WORKERS = int(os.getenv("RSS_FETCH_WORKERS", "8"))
+    RSS_FEED_TIMEOUT = float(os.getenv("RSS_FEED_TIMEOUT", "10"))  # seconds per feed
+    RSS_FETCH_DEADLINE = float(os.getenv("RSS_FETCH_DEADLINE", "30"))  # seconds for all feeds
 
     # OpenAI API
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
+    OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL", "")  # empty = api.openai.com
+    AI_CACHE_DIR = Path(os.getenv("AI_CACHE_DIR", str(BASE_DIR / "data" / "ai_cache")))
+    AI_RANKING_CACHE_TTL_HOURS = float(os.getenv("AI_RANKING_CACHE_TTL_HOURS", "24"))
+    AI_SUMMARY_CACHE_TTL_HOURS = float(os.getenv("AI_SUMMARY_CACHE_TTL_HOURS", "24"))
+    AI_CACHE_MAX_ENTRIES = int(os.getenv("AI_CACHE_MAX_ENTRIES", "200"))  # per tier
 
 
 class DevelopmentConfig(BaseConfig):
@@ -81,6 +128,9 @@ class TestingConfig(BaseConfig):
 
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    NEWS_REFRESH_MINUTES = 0
+    NEWS_REVALIDATE_ON_READ = False
+    DIGEST_WORKERS = 1  # in-memory SQLite shares a single connection
 
 
 def get_config(config_name="development"):
@@ -1,8 +1,16 @@
 """Contact model."""
 from datetime import datetime, date
+from sqlalchemy import event
 from app import db
 
 
+def month_day(value: date) -> int | None:
+    """Encode a date's month and day as MMDD (e.g. 5 Oct -> 1005), ignoring the year."""
+    if value is None:
+        return None
+    return value.month * 100 + value.day
+
+
 class Contact(db.Model):
     """Contact model - for tracking birthdays and name days."""
 
@@ -18,6 +26,14 @@ class Contact(db.Model):
     # Store as DATE (without year if unknown)
     birthday_date = db.Column(db.Date, nullable=True)
     name_day_date = db.Column(db.Date, nullable=True)  # MM-DD format
+    # True while the name day is filled from the first name (and follows
+    # renames); False once it was entered or cleared by hand
+    name_day_auto = db.Column(db.Boolean, nullable=False, server_default=db.false())
+
+    # Denormalized MMDD of the dates above, kept in sync on write so
+    # "who celebrates on day X" is an indexed lookup
+    birthday_md = db.Column(db.SmallInteger, nullable=True)
+    name_day_md = db.Column(db.SmallInteger, nullable=True)
     
     notes = db.Column(db.Text, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -26,6 +42,13 @@ class Contact(db.Model):
     # Relationships
     user = db.relationship("User", back_populates="contacts")
 
+    __table_args__ = (
+        db.Index("ix_contacts_user_birthday_md", "user_id", "birthday_md"),
+        db.Index("ix_contacts_user_name_day_md", "user_id", "name_day_md"),
+        # Contact list ordered by (name, id)
+        db.Index("ix_contacts_user_name", "user_id", "name", "id"),
+    )
+
     def __repr__(self):
         return f"<Contact {self.name}>"
 
@@ -65,3 +88,18 @@ class Contact(db.Model):
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
+
+
+@event.listens_for(Contact, "before_insert")
+@event.listens_for(Contact, "before_update")
+def _sync_month_day(mapper, connection, contact):
+    """Keep the MMDD columns in sync with the date columns."""
+    contact.birthday_md = month_day(contact.birthday_date)
+    contact.name_day_md = month_day(contact.name_day_date)
+
+
+@event.listens_for(Contact, "before_insert")
+def _default_name_day_auto(mapper, connection, contact):
+    """Contacts inserted without a name day may get one filled automatically."""
+    if contact.name_day_auto is None:
+        contact.name_day_auto = contact.name_day_date is None
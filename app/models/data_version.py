@@ -0,0 +1,18 @@
+"""Per-user data version model."""
+from app import db
+
+
+class DataVersion(db.Model):
+    """
+    Counter bumped whenever one of the user's tasks, events, contacts or
+    projects changes. Kept out of the users table so conditional GETs
+    don't touch (or lock) user rows.
+    """
+
+    __tablename__ = "data_versions"
+
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<DataVersion {self.user_id}={self.version}>"
@@ -27,6 +27,10 @@ class Event(db.Model):
     # Relationships
     user = db.relationship("User", back_populates="events")
 
+    __table_args__ = (
+        db.Index("ix_events_user_start", "user_id", "start_at"),
+    )
+
     def __repr__(self):
         return f"<Event {self.title}>"
 
@@ -0,0 +1,48 @@
+"""Materialized event occurrence model."""
+from datetime import datetime
+
+from app import db
+
+
+class EventOccurrence(db.Model):
+    """One occurrence of an event, materialized up to a rolling horizon."""
+
+    __tablename__ = "event_occurrences"
+
+    id = db.Column(db.Integer, primary_key=True)
+    event_id = db.Column(db.Integer, db.ForeignKey("events.id", ondelete="CASCADE"), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
+
+    occurrence_date = db.Column(db.Date, nullable=False)
+    starts_at = db.Column(db.DateTime, nullable=False)  # occurrence_date + the event's start time
+
+    # Relationships
+    event = db.relationship("Event")
+
+    __table_args__ = (
+        db.Index("ix_event_occurrences_user_date", "user_id", "occurrence_date"),
+        db.UniqueConstraint("event_id", "occurrence_date", name="uq_event_occurrences_event_date"),
+    )
+
+    def __repr__(self):
+        return f"<EventOccurrence {self.event_id} {self.occurrence_date}>"
+
+
+class EventOccurrenceState(db.Model):
+    """
+    Single row recording the date range event_occurrences is complete for.
+
+    Written in the same transaction as a refresh, and deleted when events
+    change while the table is not maintained. No row means the table was
+    never filled or is stale, and must be rebuilt before it is read.
+    """
+
+    __tablename__ = "event_occurrence_state"
+
+    id = db.Column(db.Integer, primary_key=True)
+    materialized_from = db.Column(db.Date, nullable=False)
+    materialized_through = db.Column(db.Date, nullable=False)
+    refreshed_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<EventOccurrenceState {self.materialized_from}..{self.materialized_through}>"
@@ -30,6 +30,11 @@ class Task(db.Model):
     user = db.relationship("User", back_populates="tasks")
     project = db.relationship("Project", back_populates="tasks")
 
+    __table_args__ = (
+        # Tasks by due date: dashboard, digest, overdue and task list queries
+        db.Index("ix_tasks_user_due", "user_id", "due_at"),
+    )
+
     def __repr__(self):
         return f"<Task {self.title}>"
 
@@ -5,22 +5,43 @@ from flask import Blueprint, render_template, request, jsonify, g
 from app import db
 from app.auth.firebase import require_auth
 from app.models.contact import Contact
+from app.services.contact_name_days import autofill_name_day
+from app.services.serializers import CONTACT_SERIALIZER
+from app.services.dashboard_cache import invalidate_after_write
+from app.services.http_cache import conditional
+from app.services.pagination import add_page_headers, keyset_paginate, next_page_url
+from app.services.streaming import stream_query, wants_stream
 
 bp = Blueprint("contacts", __name__)
+bp.after_request(invalidate_after_write)
 
 
 @bp.route("/")
 @require_auth
+@conditional()
 def list_contacts():
     """List all contacts for current user."""
     user = g.current_user
-    
-    contacts = Contact.query.filter_by(user_id=user.id).order_by(Contact.name.asc()).all()
+    query = CONTACT_SERIALIZER.query().filter(Contact.user_id == user.id)
+    
+    if wants_stream():
+        return stream_query(query.order_by(Contact.name.asc(), Contact.id.asc()), CONTACT_SERIALIZER.to_dict)
+    
+    try:
+        page = keyset_paginate(
+            query,
+            Contact.name,
+            Contact.id,
+            cursor=request.args.get("cursor"),
+            limit=request.args.get("limit", type=int),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     
     if request.headers.get("Accept") == "application/json":
-        return jsonify([contact.to_dict() for contact in contacts])
+        return add_page_headers(CONTACT_SERIALIZER.response(page.items), page)
     
-    return render_template("contacts.html", contacts=contacts)
+    return render_template("contacts.html", contacts=page.items, next_url=next_page_url(page))
 
 
 @bp.route("/create", methods=["POST"])
@@ -46,13 +67,17 @@ def create_contact():
         except (ValueError, AttributeError):
             pass
     
-    # Parse name day
-    nameday_str = data.get("name_day_date")
-    if nameday_str:
-        try:
-            contact.name_day_date = date.fromisoformat(nameday_str)
-        except (ValueError, AttributeError):
-            pass
+    # Parse name day (an explicit empty value means no name day)
+    if "name_day_date" in data:
+        contact.name_day_auto = False
+        nameday_str = data["name_day_date"]
+        if nameday_str:
+            try:
+                contact.name_day_date = date.fromisoformat(nameday_str)
+            except (ValueError, AttributeError):
+                pass
+    else:
+        autofill_name_day(contact)
     
     db.session.add(contact)
     db.session.commit()
@@ -65,6 +90,7 @@ def create_contact():
 
 @bp.route("/<int:contact_id>", methods=["GET"])
 @require_auth
+@conditional()
 def get_contact(contact_id):
     """Get a specific contact."""
     user = g.current_user
@@ -81,6 +107,7 @@ def update_contact(contact_id):
     contact = Contact.query.filter_by(id=contact_id, user_id=user.id).first_or_404()
     
     data = request.get_json() if request.is_json else request.form
+    previous_name = contact.name
     
     if "name" in data:
         contact.name = data["name"]
@@ -106,10 +133,14 @@ def update_contact(contact_id):
         if nameday_str:
             try:
                 contact.name_day_date = date.fromisoformat(nameday_str)
+                contact.name_day_auto = False
             except (ValueError, AttributeError):
                 pass
         else:
             contact.name_day_date = None
+            contact.name_day_auto = False
+    else:
+        autofill_name_day(contact, previous_name=previous_name)
     
     db.session.commit()
     
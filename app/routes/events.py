@@ -5,39 +5,58 @@ from flask import Blueprint, render_template, request, jsonify, g
 from app import db
 from app.auth.firebase import require_auth
 from app.models.event import Event
-from app.services.calendar import get_week_range, expand_recurring_events
+from app.services.calendar import get_week_range
+from app.services.serializers import EVENT_SERIALIZER, json_response
+from app.services.dashboard_cache import invalidate_after_write
+from app.services.http_cache import conditional
+from app.services.pagination import add_page_headers, keyset_paginate, next_page_url
+from app.services.occurrences import load_occurrences, remove_event, sync_event
 
 bp = Blueprint("events", __name__)
+bp.after_request(invalidate_after_write)
 
 
 @bp.route("/")
 @require_auth
+@conditional()
 def list_events():
     """List all events for current user."""
     user = g.current_user
     view = request.args.get("view", "week")  # week, month, day
     
-    query = Event.query.filter_by(user_id=user.id)
+    page = None
     
     if view == "week":
         week_start, week_end = get_week_range()
-        events_raw = query.filter(
-            Event.start_at >= datetime.combine(week_start, datetime.min.time()),
-            Event.start_at < datetime.combine(week_end, datetime.max.time())
-        ).order_by(Event.start_at.asc()).all()
-        
-        events = expand_recurring_events(events_raw, week_start, week_end)
+        events = load_occurrences([user.id], week_start, week_end)[user.id]
     else:
-        events_raw = query.order_by(Event.start_at.asc()).limit(50).all()
-        events = [{"event": e, "occurrence_date": e.start_at.date()} for e in events_raw]
+        try:
+            page = keyset_paginate(
+                EVENT_SERIALIZER.query().filter(Event.user_id == user.id),
+                Event.start_at,
+                Event.id,
+                cursor=request.args.get("cursor"),
+                limit=request.args.get("limit", type=int),
+            )
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        events = [{"event": e, "occurrence_date": e.start_at.date()} for e in page.items]
     
     if request.headers.get("Accept") == "application/json":
-        return jsonify([{
-            **e["event"].to_dict(),
+        # Listed events are projected rows, week occurrences are ORM events
+        serialize = EVENT_SERIALIZER.to_dict if page else Event.to_dict
+        response = json_response([{
+            **serialize(e["event"]),
             "occurrence_date": e["occurrence_date"].isoformat()
         } for e in events])
+        return add_page_headers(response, page) if page else response
     
-    return render_template("events.html", events=events, view=view)
+    return render_template(
+        "events.html",
+        events=events,
+        view=view,
+        next_url=next_page_url(page) if page else None,
+    )
 
 
 @bp.route("/create", methods=["POST"])
@@ -71,6 +90,8 @@ def create_event():
             pass
     
     db.session.add(event)
+    db.session.flush()
+    sync_event(event)
     db.session.commit()
     
     if request.is_json:
@@ -81,6 +102,7 @@ def create_event():
 
 @bp.route("/<int:event_id>", methods=["GET"])
 @require_auth
+@conditional()
 def get_event(event_id):
     """Get a specific event."""
     user = g.current_user
@@ -123,6 +145,7 @@ def update_event(event_id):
             except (ValueError, AttributeError):
                 pass
     
+    sync_event(event)
     db.session.commit()
     
     return jsonify(event.to_dict())
@@ -135,6 +158,7 @@ def delete_event(event_id):
     user = g.current_user
     event = Event.query.filter_by(id=event_id, user_id=user.id).first_or_404()
     
+    remove_event(event.id)
     db.session.delete(event)
     db.session.commit()
     
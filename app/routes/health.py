@@ -1,5 +1,9 @@
 """Health check and version endpoint."""
-from flask import Blueprint, jsonify
+from flask import Blueprint, current_app, jsonify
+
+from app.auth.token_cache import get_token_cache
+from app.services.dashboard_cache import get_dashboard_cache
+from app.services.feeds import get_feed_stats
 from app.version import get_version_info
 
 bp = Blueprint("health", __name__)
@@ -19,3 +23,35 @@ def health_check():
 def version():
     """Version information endpoint."""
     return jsonify(get_version_info())
+
+
+def details_enabled() -> bool:
+    """Whether the unauthenticated /health/* endpoints may expose internal statistics."""
+    return current_app.config.get("HEALTH_DETAILS_ENABLED", False)
+
+
+@bp.route("/health/feeds")
+def feed_health():
+    """Per-feed fetch latency and failure counters (only "degraded" if a feed fails, without details)."""
+    stats = get_feed_stats()
+    if not details_enabled():
+        failing = any(feed["last_error"] for feed in stats.values())
+        return jsonify({"status": "degraded" if failing else "ok"})
+    return jsonify(stats)
+
+
+@bp.route("/health/auth")
+def auth_health():
+    """Verified-token cache hit rate and size."""
+    if not details_enabled():
+        return jsonify({"status": "ok"})
+    return jsonify(get_token_cache().get_stats())
+
+
+@bp.route("/health/dashboard")
+def dashboard_health():
+    """Dashboard snapshot cache hit rate and size."""
+    if not details_enabled():
+        return jsonify({"status": "ok"})
+    cache = get_dashboard_cache()
+    return jsonify(cache.get_stats() if cache else {"backend": None})
@@ -3,6 +3,7 @@ from flask import Blueprint, render_template, request, jsonify, g
 
 from app import db
 from app.auth.firebase import require_auth
+from app.auth.principal import invalidate_principal
 
 bp = Blueprint("settings", __name__)
 
@@ -11,7 +12,7 @@ bp = Blueprint("settings", __name__)
 @require_auth
 def index():
     """Settings page."""
-    user = g.current_user
+    user = g.current_user.user
     
     if request.headers.get("Accept") == "application/json":
         return jsonify(user.to_dict())
@@ -23,7 +24,7 @@ def index():
 @require_auth
 def update():
     """Update user settings."""
-    user = g.current_user
+    user = g.current_user.user
     data = request.get_json() if request.is_json else request.form
     
     if "digest_enabled" in data:
@@ -39,5 +40,6 @@ def update():
         user.phone_number = data["phone_number"]
     
     db.session.commit()
+    invalidate_principal(user.id)
     
     return jsonify(user.to_dict())
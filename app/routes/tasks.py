@@ -1,48 +1,65 @@
 """Tasks routes."""
-from datetime import datetime, timedelta
+from datetime import datetime
 from flask import Blueprint, render_template, request, jsonify, g
 
 from app import db
 from app.auth.firebase import require_auth
 from app.models.task import Task
 from app.models.project import Project
+from app.services.bulk_tasks import apply_bulk_operations, filter_tasks
+from app.services.serializers import TASK_SERIALIZER
+from app.services.dashboard_cache import invalidate_after_write
+from app.services.http_cache import conditional, minute_key, today_key
+from app.services.pagination import add_page_headers, keyset_paginate, next_page_url
+from app.services.streaming import stream_query, wants_stream
 
 bp = Blueprint("tasks", __name__)
+bp.after_request(invalidate_after_write)
+
+
+def _tasks_time_key() -> str:
+    """Overdue lists change as tasks pass their due time, other filters daily."""
+    return minute_key() if request.args.get("filter") == "overdue" else today_key()
 
 
 @bp.route("/")
 @require_auth
+@conditional(time_key=_tasks_time_key)
 def list_tasks():
     """List all tasks for current user."""
     user = g.current_user
     filter_by = request.args.get("filter", "all")
     
-    query = Task.query.filter_by(user_id=user.id)
+    query = TASK_SERIALIZER.query().filter(Task.user_id == user.id)
     
-    if filter_by == "today":
-        today = datetime.now().date()
-        tomorrow = today + timedelta(days=1)
-        query = query.filter(
-            Task.due_at >= datetime.combine(today, datetime.min.time()),
-            Task.due_at < datetime.combine(tomorrow, datetime.min.time())
-        )
-    elif filter_by == "week":
-        from app.services.calendar import get_week_range
-        week_start, week_end = get_week_range()
-        query = query.filter(
-            Task.due_at >= datetime.combine(week_start, datetime.min.time()),
-            Task.due_at < datetime.combine(week_end, datetime.max.time())
-        )
-    elif filter_by == "overdue":
-        query = query.filter(Task.due_at < datetime.now()).filter(Task.status != "DONE")
+    query = filter_tasks(query, filter_by)
     
-    tasks = query.order_by(Task.due_at.asc()).all()
-    projects = Project.query.filter_by(user_id=user.id).all()
+    if wants_stream():
+        return stream_query(query.order_by(Task.due_at.asc().nulls_last(), Task.id.asc()), TASK_SERIALIZER.to_dict)
+    
+    try:
+        page = keyset_paginate(
+            query,
+            Task.due_at,
+            Task.id,
+            cursor=request.args.get("cursor"),
+            limit=request.args.get("limit", type=int),
+            nullable=True,
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     
     if request.headers.get("Accept") == "application/json":
-        return jsonify([task.to_dict() for task in tasks])
+        return add_page_headers(TASK_SERIALIZER.response(page.items), page)
     
-    return render_template("tasks.html", tasks=tasks, projects=projects, filter=filter_by)
+    projects = Project.query.filter_by(user_id=user.id).all()
+    return render_template(
+        "tasks.html",
+        tasks=page.items,
+        projects=projects,
+        filter=filter_by,
+        next_url=next_page_url(page),
+    )
 
 
 @bp.route("/create", methods=["POST"])
@@ -78,8 +95,33 @@ def create_task():
     return jsonify({"success": True, "id": task.id})
 
 
+@bp.route("/bulk", methods=["POST"])
+@require_auth
+def bulk_tasks():
+    """
+    Apply many task operations in one transaction.
+    
+    Body: {"operations": [{"action": "status" | "snooze" | "move" | "delete",
+    "ids": [...] or "filter": "overdue" | ..., "status" / "days" / "project_id"}]}.
+    Each operation is a single set-based UPDATE or DELETE.
+    """
+    user = g.current_user
+    data = request.get_json(silent=True) or {}
+    
+    try:
+        results = apply_bulk_operations(user.id, data.get("operations"))
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 400
+    
+    db.session.commit()
+    
+    return jsonify({"success": True, "results": results})
+
+
 @bp.route("/<int:task_id>", methods=["GET"])
 @require_auth
+@conditional()
 def get_task(task_id):
     """Get a specific task."""
     user = g.current_user
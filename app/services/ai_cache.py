@@ -0,0 +1,116 @@
+"""Persistent cache of AI completions keyed by input hash."""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from flask import current_app
+
+from app.services.cache_files import atomic_write_json, read_json
+
+logger = logging.getLogger(__name__)
+
+# Cache tiers: AI ranking of headlines and the final summary
+RANKING = "ranking"
+SUMMARY = "summary"
+
+
+def content_key(prompt_version: str, model: str, payload: Any) -> str:
+    """
+    Hash of everything that determines a completion.
+
+    Args:
+        prompt_version: Version of the prompt template (bump it when the prompt changes)
+        model: Model name
+        payload: JSON-serializable input the prompt is built from
+    """
+    raw = json.dumps([prompt_version, model, payload], ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class AICache:
+    """
+    Directory of one JSON file per completion, shared by all processes.
+
+    Entries expire `ttl` seconds after they were written, judged by the
+    file's mtime like eviction. When a write pushes the number of files
+    above `max_entries`, expired entries and then the oldest ones are
+    removed. Only successful completions should be stored, never the
+    non-AI fallbacks.
+    """
+
+    def __init__(self, directory, ttl: int = 86400, max_entries: int = 200):
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _count(self, name: str, n: int = 1):
+        with self._lock:
+            self.stats[name] += n
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached value for a key, or None if missing or expired."""
+        path = self._path(key)
+        try:
+            fresh = path.stat().st_mtime + self.ttl > time.time()
+        except OSError:
+            fresh = False
+        entry = read_json(path) if fresh else None
+        if not isinstance(entry, dict) or "value" not in entry:
+            self._count("misses")
+            return None
+        self._count("hits")
+        return entry["value"]
+
+    def put(self, key: str, value: Any):
+        """Store a value and evict entries beyond the size bound."""
+        atomic_write_json(self._path(key), {"value": value})
+        self._evict()
+
+    def _evict(self):
+        try:
+            files = [(path.stat().st_mtime, path) for path in self.directory.glob("*.json")]
+        except OSError as e:
+            logger.warning(f"AI cache eviction skipped: {e}")
+            return
+        if len(files) <= self.max_entries:
+            return
+
+        files.sort()
+        cutoff = time.time() - self.ttl
+        expired = [path for mtime, path in files if mtime <= cutoff]
+        live = [path for mtime, path in files if mtime > cutoff]
+        doomed = expired + live[:max(0, len(live) - self.max_entries)]
+        for path in doomed:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+        self._count("evictions", len(doomed))
+
+    def get_stats(self) -> Dict:
+        """Hit/miss/eviction counters of this process."""
+        with self._lock:
+            return dict(self.stats)
+
+
+def get_ai_cache(tier: str) -> AICache:
+    """AI cache tier (RANKING or SUMMARY) of the current app (created on first use)."""
+    caches = current_app.extensions.setdefault("ai_cache", {})
+    if tier not in caches:
+        config = current_app.config
+        caches[tier] = AICache(
+            Path(config["AI_CACHE_DIR"]) / tier,
+            ttl=int(config.get(f"AI_{tier.upper()}_CACHE_TTL_HOURS", 24) * 3600),
+            max_entries=config.get("AI_CACHE_MAX_ENTRIES", 200),
+        )
+    return caches[tier]
@@ -0,0 +1,160 @@
+"""Set-based bulk operations on tasks."""
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from sqlalchemy import case, delete, func, update
+
+from app import db
+from app.models.project import Project
+from app.models.task import Task
+from app.services.data_version import bump_data_version
+
+ACTIONS = ("status", "snooze", "move", "delete")
+STATUSES = ("TODO", "DOING", "DONE")
+MAX_SNOOZE_DAYS = 3650
+
+
+def filter_tasks(query, filter_by: str, now: datetime = None):
+    """
+    Apply a task list filter (all, today, week, overdue) to a query.
+
+    Shared by the task list and bulk operations so "overdue" means the
+    same set of tasks in both. "today", "week" and "overdue" all use the
+    configured timezone's clock.
+    """
+    from app.services.calendar import get_now, get_week_range
+
+    if now is None:
+        now = get_now()
+    today = now.date()
+
+    if filter_by == "today":
+        tomorrow = today + timedelta(days=1)
+        query = query.filter(
+            Task.due_at >= datetime.combine(today, datetime.min.time()),
+            Task.due_at < datetime.combine(tomorrow, datetime.min.time())
+        )
+    elif filter_by == "week":
+        week_start, week_end = get_week_range(today)
+        query = query.filter(
+            Task.due_at >= datetime.combine(week_start, datetime.min.time()),
+            Task.due_at < datetime.combine(week_end, datetime.max.time())
+        )
+    elif filter_by == "overdue":
+        query = query.filter(Task.due_at < now).filter(Task.status != "DONE")
+    return query
+
+
+def shift_days(column, days: int):
+    """
+    SQL expression adding whole days to a DateTime column.
+
+    SQLite has no interval type, so it uses datetime(col, '+N days') and
+    re-appends the fractional seconds SQLAlchemy stores ('.000000') to keep
+    the stored format comparable with bound datetimes. Other databases
+    add an interval.
+    """
+    if db.session.get_bind().dialect.name == "sqlite":
+        return func.datetime(column, f"{days:+d} days").op("||")(func.substr(column, 20))
+    return column + timedelta(days=days)
+
+
+def _conditions(user_id: int, operation: Dict, now: datetime) -> List:
+    """WHERE conditions selecting the tasks of one operation."""
+    conditions = [Task.user_id == user_id]
+
+    if "ids" in operation:
+        ids = operation["ids"]
+        # bool is an int subclass: reject it so [true] does not select task 1
+        if not isinstance(ids, list) or not all(isinstance(i, int) and not isinstance(i, bool) for i in ids):
+            raise ValueError("ids must be a list of task ids")
+        conditions.append(Task.id.in_(ids))
+    elif "filter" in operation:
+        if operation["filter"] not in ("all", "today", "week", "overdue"):
+            raise ValueError(f"Unknown filter: {operation['filter']}")
+        query = filter_tasks(db.session.query(Task.id), operation["filter"], now=now)
+        if query.whereclause is not None:
+            conditions.append(query.whereclause)
+    else:
+        raise ValueError("Operation needs ids or filter")
+
+    return conditions
+
+
+def _values(user_id: int, operation: Dict) -> Dict:
+    """SET values of an update operation (validated)."""
+    action = operation["action"]
+
+    if action == "status":
+        status = operation.get("status")
+        if status not in STATUSES:
+            raise ValueError(f"Invalid status: {status}")
+        if status == "DONE":
+            completed_at = case((Task.completed_at.is_(None), datetime.utcnow()), else_=Task.completed_at)
+        else:
+            completed_at = None
+        return {"status": status, "completed_at": completed_at}
+
+    if action == "snooze":
+        days = operation.get("days", 1)
+        if not isinstance(days, int) or isinstance(days, bool) or not 0 < abs(days) <= MAX_SNOOZE_DAYS:
+            raise ValueError("days must be a non-zero integer")
+        return {"due_at": shift_days(Task.due_at, days)}
+
+    # move
+    project_id = operation.get("project_id")
+    if project_id is not None:
+        if not db.session.query(Project.id).filter_by(id=project_id, user_id=user_id).first():
+            raise ValueError(f"Unknown project: {project_id}")
+    return {"project_id": project_id}
+
+
+def apply_bulk_operations(user_id: int, operations: List[Dict]) -> List[Dict]:
+    """
+    Apply task operations with one UPDATE/DELETE statement each.
+
+    Every operation is validated before any SQL runs; the caller commits
+    (or rolls back) the whole batch as one transaction.
+
+    Args:
+        user_id: Owner of the tasks (operations never touch other users' tasks)
+        operations: Dicts with an action (status, snooze, move, delete), a
+            selector (ids or filter) and the action's arguments
+            (status / days / project_id)
+
+    Returns:
+        One {"action", "matched"} dict per operation
+
+    Raises:
+        ValueError: If an operation is invalid
+    """
+    if not isinstance(operations, list) or not operations:
+        raise ValueError("operations must be a non-empty list")
+
+    from app.services.calendar import get_now
+
+    now = get_now()
+    statements = []
+    for operation in operations:
+        if not isinstance(operation, dict) or operation.get("action") not in ACTIONS:
+            raise ValueError(f"Unknown action: {operation.get('action') if isinstance(operation, dict) else operation}")
+
+        conditions = _conditions(user_id, operation, now)
+        if operation["action"] == "delete":
+            statement = delete(Task).where(*conditions)
+        else:
+            values = _values(user_id, operation)
+            if operation["action"] == "snooze":
+                conditions.append(Task.due_at.isnot(None))
+            statement = update(Task).where(*conditions).values(**values, updated_at=datetime.utcnow())
+        statements.append((operation["action"], statement))
+
+    results = []
+    for action, statement in statements:
+        result = db.session.execute(statement, execution_options={"synchronize_session": False})
+        results.append({"action": action, "matched": result.rowcount})
+
+    # Core statements bypass the flush hook
+    if any(r["matched"] for r in results):
+        bump_data_version([user_id])
+    return results
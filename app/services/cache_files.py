@@ -0,0 +1,111 @@
+"""Process-safe file primitives for on-disk caches."""
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from app.services import fastjson
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+
+def atomic_write_bytes(path, data: bytes):
+    """
+    Write a file so readers only ever see the old or the new content.
+
+    Data goes to a temporary file in the same directory which then replaces
+    the target in a single rename.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_json(path, obj: Any):
+    """Atomically write obj as compact JSON."""
+    atomic_write_bytes(path, fastjson.dumps(obj))
+
+
+def read_json(path, default: Any = None) -> Any:
+    """Read a JSON file, returning default if it is missing or unreadable."""
+    try:
+        with open(path, "rb") as f:
+            return fastjson.loads(f.read())
+    except FileNotFoundError:
+        return default
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable cache file {path}: {e}")
+        return default
+
+
+class FileLock:
+    """
+    Exclusive advisory lock on a file, shared by all processes on the host.
+
+    Used as a single-flight guard: the worker that gets the lock does the
+    work, the others skip it (acquire(blocking=False)) or wait for it.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._fd = None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """Take the lock; return False if non-blocking and already held."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+                fcntl.flock(fd, flags)
+            else:
+                mode = msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK
+                msvcrt.locking(fd, mode, 1)
+        except OSError:
+            os.close(fd)
+            if blocking:
+                raise
+            return False
+        self._fd = fd
+        return True
+
+    def release(self):
+        """Release the lock if held."""
+        if self._fd is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
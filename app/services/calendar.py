@@ -1,8 +1,13 @@
 """Calendar service for event recurrence and date calculations."""
+from calendar import monthrange
 from datetime import datetime, date, timedelta
-from typing import List
+from typing import Iterator, List
 from zoneinfo import ZoneInfo
 
+from sqlalchemy import and_, or_
+
+from app.models.event import Event
+
 
 def get_timezone() -> ZoneInfo:
     """Get the configured timezone."""
@@ -16,6 +21,13 @@ def get_today(tz: ZoneInfo = None) -> date:
     return datetime.now(tz).date()
 
 
+def get_now(tz: ZoneInfo = None) -> datetime:
+    """Current wall-clock time in the configured timezone, naive like the stored DateTime columns."""
+    if tz is None:
+        tz = get_timezone()
+    return datetime.now(tz).replace(tzinfo=None)
+
+
 def get_week_range(target_date: date = None) -> tuple[date, date]:
     """
     Get the start and end dates of the week containing target_date.
@@ -37,96 +49,97 @@ def get_week_range(target_date: date = None) -> tuple[date, date]:
     return start, end
 
 
+RECURRING_RULES = ("DAILY", "WEEKLY", "MONTHLY")
+
+
+def _add_months(origin: date, months: int) -> date:
+    """Shift a date by whole months, clamping to the month's last day (Jan 31 -> Feb 28)."""
+    month_index = origin.month - 1 + months
+    year = origin.year + month_index // 12
+    month = month_index % 12 + 1
+    return date(year, month, min(origin.day, monthrange(year, month)[1]))
+
+
+def occurrence_dates(start: date, repeat_rule: str, start_date: date, end_date: date) -> Iterator[date]:
+    """
+    Yield the occurrences of a series within [start_date, end_date].
+    
+    Jumps arithmetically to the first occurrence inside the window, so the
+    cost is proportional to the number of occurrences returned, not to the
+    age of the series. Monthly series keep the original day of month and
+    clamp it in shorter months (31st -> 28th/29th Feb -> 31st Mar).
+    
+    Args:
+        start: First occurrence of the series
+        repeat_rule: NONE, DAILY, WEEKLY or MONTHLY
+        start_date: Start of date range
+        end_date: End of date range (inclusive)
+    """
+    if end_date < start:
+        return
+    
+    if repeat_rule not in RECURRING_RULES:
+        if start_date <= start:
+            yield start
+        return
+    
+    if repeat_rule == "MONTHLY":
+        months = max(0, (start_date.year - start.year) * 12 + start_date.month - start.month)
+        current = _add_months(start, months)
+        if current < start_date:
+            months += 1
+            current = _add_months(start, months)
+        while current <= end_date:
+            yield current
+            months += 1
+            current = _add_months(start, months)
+        return
+    
+    step = 1 if repeat_rule == "DAILY" else 7
+    skipped = max(0, -(-(start_date - start).days // step))  # ceil division
+    current = start + timedelta(days=skipped * step)
+    while current <= end_date:
+        yield current
+        current += timedelta(days=step)
+
+
 def expand_recurring_events(events: List, start_date: date, end_date: date) -> List[dict]:
     """
     Expand recurring events to individual occurrences within a date range.
     
     Args:
-        events: List of Event objects
+        events: List of Event objects (see occurring_between for the query)
         start_date: Start of date range
         end_date: End of date range
     
     Returns:
-        List of expanded event dictionaries with actual dates
+        List of expanded event dictionaries with actual dates, in chronological order
     """
-    expanded = []
-    
-    for event in events:
-        if event.repeat_rule == "NONE":
-            # Single occurrence
-            if start_date <= event.start_at.date() <= end_date:
-                expanded.append({
-                    "event": event,
-                    "occurrence_date": event.start_at.date(),
-                })
-        
-        elif event.repeat_rule == "DAILY":
-            # Daily recurrence
-            current = event.start_at.date()
-            while current <= end_date:
-                if current >= start_date:
-                    expanded.append({
-                        "event": event,
-                        "occurrence_date": current,
-                    })
-                current += timedelta(days=1)
-        
-        elif event.repeat_rule == "WEEKLY":
-            # Weekly recurrence (same day of week)
-            current = event.start_at.date()
-            while current <= end_date:
-                if current >= start_date:
-                    expanded.append({
-                        "event": event,
-                        "occurrence_date": current,
-                    })
-                current += timedelta(weeks=1)
-        
-        elif event.repeat_rule == "MONTHLY":
-            # Monthly recurrence (same day of month)
-            current = event.start_at.date()
-            while current <= end_date:
-                if current >= start_date:
-                    expanded.append({
-                        "event": event,
-                        "occurrence_date": current,
-                    })
-                
-                # Next month, same day
-                try:
-                    if current.month == 12:
-                        current = current.replace(year=current.year + 1, month=1)
-                    else:
-                        current = current.replace(month=current.month + 1)
-                except ValueError:
-                    # Day doesn't exist in next month (e.g., Jan 31 -> Feb 31)
-                    # Move to last day of next month
-                    if current.month == 12:
-                        next_month = 1
-                        next_year = current.year + 1
-                    else:
-                        next_month = current.month + 1
-                        next_year = current.year
-                    
-                    # Last day of next month
-                    if next_month == 12:
-                        last_day = 31
-                    elif next_month in [4, 6, 9, 11]:
-                        last_day = 30
-                    elif next_month == 2:
-                        # Check for leap year
-                        if next_year % 4 == 0 and (next_year % 100 != 0 or next_year % 400 == 0):
-                            last_day = 29
-                        else:
-                            last_day = 28
-                    else:
-                        last_day = 31
-                    
-                    current = date(next_year, next_month, last_day)
-    
+    expanded = [
+        {"event": event, "occurrence_date": occurrence}
+        for event in events
+        for occurrence in occurrence_dates(event.start_at.date(), event.repeat_rule, start_date, end_date)
+    ]
+    expanded.sort(key=lambda item: (item["occurrence_date"], item["event"].start_at.time()))
     return expanded
 
 
+def occurring_between(start_date: date, end_date: date):
+    """
+    SQL filter for events that may occur within [start_date, end_date].
+    
+    Selects single events starting inside the range plus every recurring
+    series that started before its end, including series that started
+    long before the range. Pass the result to expand_recurring_events.
+    """
+    range_start = datetime.combine(start_date, datetime.min.time())
+    range_end = datetime.combine(end_date + timedelta(days=1), datetime.min.time())
+    return and_(
+        Event.start_at < range_end,
+        or_(Event.start_at >= range_start, Event.repeat_rule.in_(RECURRING_RULES)),
+    )
+
+
 def is_overdue(due_date: datetime) -> bool:
     """Check if a task is overdue."""
     if due_date is None:
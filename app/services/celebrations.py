@@ -0,0 +1,75 @@
+"""Birthday and name day queries backed by the indexed MMDD columns."""
+from datetime import date, timedelta
+from typing import Dict, List
+
+from sqlalchemy import and_, or_
+
+from app.models.contact import Contact, month_day
+from app.services.calendar import get_today
+
+
+def _md_window(column, start: date, days: int):
+    """Filter for MMDD values within [start, start + days], wrapping over New Year."""
+    if days >= 365:
+        return column.isnot(None)
+
+    first = month_day(start)
+    last = month_day(start + timedelta(days=days))
+    if first <= last:
+        return column.between(first, last)
+    # Window crosses 31 Dec -> two index ranges
+    return or_(column >= first, column <= last)
+
+
+def celebrants_query(user_ids: List[int], day: date):
+    """Query contacts of the given users with a birthday or name day on day."""
+    md = month_day(day)
+    # One (user_id, *_md) term per branch so each side can use its own index
+    return Contact.query.filter(
+        or_(
+            and_(Contact.user_id.in_(user_ids), Contact.birthday_md == md),
+            and_(Contact.user_id.in_(user_ids), Contact.name_day_md == md),
+        )
+    )
+
+
+def upcoming_celebrations(user_id: int, days: int = 7, today: date = None) -> List[Dict]:
+    """
+    List birthdays and name days of a user's contacts in the next days.
+
+    Uses range conditions on (user_id, birthday_md) / (user_id, name_day_md),
+    so only matching contacts are read.
+
+    Args:
+        user_id: Owner of the contacts
+        days: Size of the window after today (inclusive)
+        today: Start of the window (defaults to today in the configured timezone)
+
+    Returns:
+        List of {"contact", "kind" ("birthday" / "name_day"), "date"} sorted by date
+    """
+    if today is None:
+        today = get_today()
+
+    contacts = Contact.query.filter(
+        Contact.user_id == user_id,
+        or_(
+            and_(Contact.birthday_md.isnot(None), _md_window(Contact.birthday_md, today, days)),
+            and_(Contact.name_day_md.isnot(None), _md_window(Contact.name_day_md, today, days)),
+        ),
+    ).all()
+
+    # Map each MMDD in the window to its actual date
+    window = {}
+    for offset in range(min(days, 365) + 1):
+        day = today + timedelta(days=offset)
+        window.setdefault(month_day(day), day)
+
+    upcoming = []
+    for contact in contacts:
+        for kind, md in (("birthday", contact.birthday_md), ("name_day", contact.name_day_md)):
+            if md in window:
+                upcoming.append({"contact": contact, "kind": kind, "date": window[md]})
+
+    upcoming.sort(key=lambda item: (item["date"], item["contact"].name))
+    return upcoming
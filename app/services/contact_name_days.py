@@ -0,0 +1,100 @@
+"""Fill contact name days from the name-day calendar."""
+import logging
+from datetime import datetime
+from typing import Dict
+
+from sqlalchemy import bindparam, select, update
+
+from app import db
+from app.models.contact import Contact, month_day
+from app.services.data_version import bump_data_version
+from app.services.meniny import resolve_name_day
+
+logger = logging.getLogger(__name__)
+
+_contacts = Contact.__table__
+
+
+def autofill_name_day(contact: Contact, previous_name: str = None):
+    """
+    Set a contact's name day from its first name.
+
+    Call it on create when no name day was given, and on updates that do
+    not set one: a rename then re-resolves the name day if it is filled
+    automatically (name_day_auto). Name days entered or cleared by hand
+    are left alone.
+
+    Args:
+        contact: New or modified contact (not flushed yet)
+        previous_name: Name before an update (None on create)
+    """
+    if previous_name is not None and (previous_name == contact.name or not contact.name_day_auto):
+        return
+
+    contact.name_day_date = resolve_name_day(contact.name)
+    contact.name_day_auto = True
+
+
+def backfill_name_days(batch_size: int = 1000, overwrite: bool = False) -> Dict[str, int]:
+    """
+    Resolve automatic name days for existing contacts in batches.
+
+    Walks contacts by id, resolves each batch in memory through the
+    name-day registry and writes it with one executemany UPDATE, which
+    also sets name_day_md (Core statements skip the ORM listener that
+    normally does). Each batch is committed on its own.
+
+    Args:
+        batch_size: Contacts read and updated per round trip
+        overwrite: Also replace name days that are already set, including
+            ones entered or cleared by hand
+
+    Returns:
+        Counters: scanned, updated, unresolved
+    """
+    stats = {"scanned": 0, "updated": 0, "unresolved": 0}
+    statement = (
+        update(_contacts)
+        .where(_contacts.c.id == bindparam("contact_id"))
+        .values(
+            name_day_date=bindparam("name_day_date"),
+            name_day_md=bindparam("name_day_md"),
+            name_day_auto=True,
+            updated_at=bindparam("updated_at"),
+        )
+    )
+
+    last_id = 0
+    while True:
+        query = select(_contacts.c.id, _contacts.c.user_id, _contacts.c.name).where(_contacts.c.id > last_id)
+        if not overwrite:
+            query = query.where(_contacts.c.name_day_date.is_(None), _contacts.c.name_day_auto.is_(True))
+        rows = db.session.execute(query.order_by(_contacts.c.id).limit(batch_size)).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+        stats["scanned"] += len(rows)
+
+        now = datetime.utcnow()
+        params, user_ids = [], set()
+        for row in rows:
+            name_day = resolve_name_day(row.name)
+            if name_day is None:
+                stats["unresolved"] += 1
+                continue
+            params.append({
+                "contact_id": row.id,
+                "name_day_date": name_day,
+                "name_day_md": month_day(name_day),
+                "updated_at": now,
+            })
+            user_ids.add(row.user_id)
+
+        if params:
+            db.session.execute(statement, params)
+            bump_data_version(user_ids)
+        db.session.commit()
+        stats["updated"] += len(params)
+        logger.info(f"Name day backfill: {stats['scanned']} scanned, {stats['updated']} updated")
+
+    return stats
@@ -0,0 +1,290 @@
+"""Per-user dashboard day snapshots."""
+import logging
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from datetime import time as dt_time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from flask import current_app, g, request
+
+from app import db
+from app.models.task import Task
+from app.services.cache_files import atomic_write_bytes
+from app.services.calendar import get_timezone, get_today, get_week_range
+from app.services.data_version import get_data_version
+from app.services.occurrences import load_occurrences
+
+logger = logging.getLogger(__name__)
+
+# Attributes the dashboard template reads; snapshots hold plain dicts, not ORM objects
+TASK_FIELDS = ("id", "project_id", "title", "priority", "status", "due_at")
+EVENT_FIELDS = ("id", "title", "location", "start_at", "end_at", "repeat_rule")
+
+WRITE_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+
+
+def _plain(obj, fields) -> Dict:
+    return {field: getattr(obj, field) for field in fields}
+
+
+OVERDUE_LIMIT = 10
+
+
+def open_tasks_query(user_id: int, start: Optional[datetime], end: datetime):
+    """Open tasks of a user due in [start, end) as TASK_FIELDS tuples, ordered by due_at."""
+    query = (
+        db.session.query(*[getattr(Task, field) for field in TASK_FIELDS])
+        .filter(Task.user_id == user_id)
+        .filter(Task.status != "DONE")
+        .filter(Task.due_at < end)
+    )
+    if start is not None:
+        query = query.filter(Task.due_at >= start)
+    return query.order_by(Task.due_at.asc(), Task.id.asc())
+
+
+def dashboard_tasks(user_id: int, today: date) -> Dict[str, List[Dict]]:
+    """
+    Today's, this week's and overdue open tasks from one range scan of ix_tasks_user_due.
+
+    Reads the user's open tasks due between the overdue cutoff
+    (DASHBOARD_OVERDUE_LOOKBACK_DAYS before today, 0 = no cutoff) and the
+    end of the week once, in due_at order, and partitions them in a single
+    pass. Overdue tasks due before the cutoff are not shown.
+
+    Returns:
+        Dict with tasks_today (priority desc, then due_at), tasks_week
+        (due_at) and overdue_tasks (oldest OVERDUE_LIMIT)
+    """
+    day_start = datetime.combine(today, datetime.min.time())
+    day_end = day_start + timedelta(days=1)
+    week_start, week_end = get_week_range(today)
+    week_start = datetime.combine(week_start, datetime.min.time())
+    week_end = datetime.combine(week_end, datetime.max.time())
+
+    lookback = current_app.config.get("DASHBOARD_OVERDUE_LOOKBACK_DAYS", 90)
+    start = min(day_start - timedelta(days=lookback), week_start) if lookback else None
+
+    tasks_today, tasks_week, overdue_tasks = [], [], []
+    for row in open_tasks_query(user_id, start, week_end):
+        task = dict(zip(TASK_FIELDS, row, strict=True))
+        due_at = task["due_at"]
+        if due_at < day_start:
+            if len(overdue_tasks) < OVERDUE_LIMIT:
+                overdue_tasks.append(task)
+        elif due_at < day_end:
+            tasks_today.append(task)
+        if due_at >= week_start:
+            tasks_week.append(task)
+
+    # Stable sort keeps due_at order within a priority
+    tasks_today.sort(key=lambda task: task["priority"] or "", reverse=True)
+
+    return {"tasks_today": tasks_today, "tasks_week": tasks_week, "overdue_tasks": overdue_tasks}
+
+
+def build_dashboard(user_id: int, today: date) -> Dict[str, List[Dict]]:
+    """
+    Compute the dashboard lists of one user for a day.
+
+    Returns:
+        Dict with tasks_today, tasks_week, overdue_tasks and events_today
+    """
+    events_today = load_occurrences([user_id], today, today)[user_id]
+
+    return {
+        **dashboard_tasks(user_id, today),
+        "events_today": [
+            {"event": _plain(item["event"], EVENT_FIELDS), "occurrence_date": item["occurrence_date"]}
+            for item in events_today
+        ],
+    }
+
+
+def next_local_midnight(today: date) -> float:
+    """Timestamp of the midnight that ends `today` in the configured timezone."""
+    return datetime.combine(today + timedelta(days=1), dt_time(), tzinfo=get_timezone()).timestamp()
+
+
+class MemorySnapshotBackend:
+    """Bounded in-process LRU of snapshots (one worker only)."""
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max(1, max_size)
+        self._entries: "OrderedDict[int, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> Optional[Dict]:
+        with self._lock:
+            snapshot = self._entries.get(user_id)
+            if snapshot is not None:
+                self._entries.move_to_end(user_id)
+            return snapshot
+
+    def set(self, user_id: int, snapshot: Dict):
+        with self._lock:
+            self._entries[user_id] = snapshot
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, user_id: int):
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class FileSnapshotBackend:
+    """
+    One pickle file per user in a directory shared by all workers on the host.
+
+    Files are replaced atomically, so a worker never reads a half-written
+    snapshot; unreadable files count as misses.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+
+    def _path(self, user_id: int) -> Path:
+        return self.directory / f"{user_id}.pickle"
+
+    def get(self, user_id: int) -> Optional[Dict]:
+        try:
+            with open(self._path(user_id), "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable dashboard snapshot for user {user_id}: {e}")
+            return None
+
+    def set(self, user_id: int, snapshot: Dict):
+        atomic_write_bytes(self._path(user_id), pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def delete(self, user_id: int):
+        try:
+            self._path(user_id).unlink()
+        except FileNotFoundError:
+            pass
+
+    def __len__(self):
+        return len(list(self.directory.glob("*.pickle"))) if self.directory.exists() else 0
+
+
+class DashboardCache:
+    """
+    Day snapshots of the dashboard lists, one per user.
+
+    A snapshot is valid for the day it was built for (it expires at local
+    midnight) and for the user's data version at build time, so a write
+    from any worker makes it stale even before the explicit invalidation
+    reaches the shared backend. Hit counters are per process.
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def _count(self, name: str):
+        with self._lock:
+            self.stats[name] += 1
+
+    def get(self, user_id: int, today: date, version: int) -> Optional[Dict]:
+        """Cached lists for the user's day and data version, or None."""
+        snapshot = self.backend.get(user_id)
+        if (
+            snapshot is None
+            or snapshot["day"] != today
+            or snapshot["version"] != version
+            or snapshot["expires_at"] <= time.time()
+        ):
+            self._count("misses")
+            return None
+        self._count("hits")
+        return snapshot["data"]
+
+    def put(self, user_id: int, today: date, version: int, data: Dict):
+        """Store the lists built for a day until local midnight."""
+        self.backend.set(user_id, {
+            "day": today,
+            "version": version,
+            "expires_at": next_local_midnight(today),
+            "data": data,
+        })
+
+    def invalidate(self, user_id: int):
+        """Drop a user's snapshot after a write."""
+        self.backend.delete(user_id)
+        self._count("invalidations")
+
+    def get_stats(self) -> Dict:
+        """Hit/miss counters, hit ratio and number of stored snapshots."""
+        with self._lock:
+            stats = dict(self.stats)
+        lookups = stats["hits"] + stats["misses"]
+        return {
+            **stats,
+            "backend": type(self.backend).__name__,
+            "size": len(self.backend),
+            "hit_rate": stats["hits"] / lookups if lookups else 0.0,
+        }
+
+
+def get_dashboard_cache() -> Optional[DashboardCache]:
+    """Dashboard cache of the current app, or None if DASHBOARD_CACHE_BACKEND is "none"."""
+    if "dashboard_cache" not in current_app.extensions:
+        kind = current_app.config.get("DASHBOARD_CACHE_BACKEND", "memory")
+        if kind == "file":
+            backend = FileSnapshotBackend(current_app.config["DASHBOARD_CACHE_DIR"])
+        elif kind == "memory":
+            backend = MemorySnapshotBackend(current_app.config.get("DASHBOARD_CACHE_SIZE", 1024))
+        else:
+            backend = None
+        current_app.extensions["dashboard_cache"] = DashboardCache(backend) if backend is not None else None
+    return current_app.extensions["dashboard_cache"]
+
+
+def get_dashboard(user_id: int, today: date = None, version: int = None) -> Dict[str, List[Dict]]:
+    """
+    Dashboard lists of a user, from the day snapshot when it is current.
+
+    Args:
+        user_id: User ID
+        today: Day to show (defaults to today in the configured timezone)
+        version: User's data version if the caller already read it
+    """
+    if today is None:
+        today = get_today()
+
+    cache = get_dashboard_cache()
+    if cache is None:
+        return build_dashboard(user_id, today)
+
+    if version is None:
+        version = get_data_version(user_id)
+    data = cache.get(user_id, today, version)
+    if data is None:
+        data = build_dashboard(user_id, today)
+        cache.put(user_id, today, version, data)
+    return data
+
+
+def invalidate_dashboard(user_id: int):
+    """Drop a user's dashboard snapshot."""
+    cache = get_dashboard_cache()
+    if cache is not None:
+        cache.invalidate(user_id)
+
+
+def invalidate_after_write(response):
+    """after_request hook for blueprints whose writes change the dashboard."""
+    if request.method in WRITE_METHODS and response.status_code < 400 and "current_user" in g:
+        invalidate_dashboard(g.current_user.id)
+    return response
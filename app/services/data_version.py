@@ -0,0 +1,78 @@
+"""Per-user data version counter bumped on every write."""
+from typing import Iterable
+
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.orm import Session
+
+from app import db
+from app.models.contact import Contact
+from app.models.data_version import DataVersion
+from app.models.event import Event
+from app.models.project import Project
+from app.models.task import Task
+from app.models.user import User
+
+# Rows whose writes change what the user's pages show
+TRACKED_MODELS = (Task, Event, Contact, Project)
+
+_versions = DataVersion.__table__
+
+
+def bump_data_version(user_ids: Iterable[int], session: Session = None):
+    """
+    Increment the data version of the given users in the current transaction.
+
+    ORM writes to tracked models are picked up automatically at flush time;
+    code that writes with Core/bulk statements calls this itself.
+    """
+    user_ids = sorted(set(user_ids))
+    if not user_ids:
+        return
+    connection = (session or db.session).connection()
+    result = connection.execute(
+        update(_versions)
+        .where(_versions.c.user_id.in_(user_ids))
+        .values(version=_versions.c.version + 1)
+    )
+    if result.rowcount < len(user_ids):
+        # Users created outside the ORM have no row yet
+        existing = set(connection.execute(
+            select(_versions.c.user_id).where(_versions.c.user_id.in_(user_ids))
+        ).scalars())
+        connection.execute(
+            insert(_versions),
+            [{"user_id": user_id, "version": 1} for user_id in user_ids if user_id not in existing],
+        )
+
+
+def get_data_version(user_id: int) -> int:
+    """Current data version of a user (0 before the first write)."""
+    version = db.session.query(DataVersion.version).filter(DataVersion.user_id == user_id).scalar()
+    return version or 0
+
+
+@event.listens_for(Session, "before_flush")
+def _bump_on_flush(session, flush_context, instances):
+    user_ids = set()
+    for obj in session.new:
+        if isinstance(obj, TRACKED_MODELS):
+            user_ids.add(obj.user_id)
+    for obj in session.dirty:
+        if isinstance(obj, TRACKED_MODELS) and session.is_modified(obj, include_collections=False):
+            user_ids.add(obj.user_id)
+    for obj in session.deleted:
+        if isinstance(obj, TRACKED_MODELS):
+            user_ids.add(obj.user_id)
+    user_ids.discard(None)
+    bump_data_version(user_ids, session=session)
+
+
+@event.listens_for(User, "after_insert")
+def _create_data_version(mapper, connection, user):
+    connection.execute(insert(_versions).values(user_id=user.id, version=0))
+
+
+@event.listens_for(User, "after_delete")
+def _delete_data_version(mapper, connection, user):
+    # SQLite doesn't enforce ON DELETE CASCADE without PRAGMA foreign_keys
+    connection.execute(_versions.delete().where(_versions.c.user_id == user.id))
@@ -0,0 +1,188 @@
+"""Parallel delivery engine for the daily digest."""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from flask import Flask
+
+from app.models.user import User
+from app.services.digest import generate_digest_batch, render_digest_html, should_send_digest
+from app.services.emailer import SMTPPool, send_email
+from app.services.sms import send_sms
+
+logger = logging.getLogger(__name__)
+
+
+class DigestDelivery:
+    """
+    Build and send digests for many users on a bounded worker pool.
+
+    Users are processed in batches. Each batch goes through two stages with
+    separate concurrency limits: the DB/render stage (one query per table
+    for the whole batch + templates) and the network stage (SMTP + SMS). A
+    slow mail server therefore can't starve rendering and a burst of renders
+    can't open more DB connections than the pool allows.
+    """
+
+    def __init__(
+        self,
+        app: Flask,
+        news_bundle: Dict,
+        workers: int = 8,
+        render_concurrency: int = 4,
+        send_concurrency: int = 8,
+        batch_size: int = 50,
+    ):
+        self.app = app
+        self.news_bundle = news_bundle
+        self.workers = max(1, workers)
+        self.send_concurrency = max(1, send_concurrency)
+        self.batch_size = max(1, batch_size)
+        self._render_slots = threading.BoundedSemaphore(max(1, render_concurrency))
+        self._send_slots = threading.BoundedSemaphore(self.send_concurrency)
+        self._lock = threading.Lock()
+        self._smtp_pool = None
+        self.stats = {"success": 0, "errors": 0, "skipped": 0, "rendered": 0}
+
+    @classmethod
+    def from_config(cls, app: Flask, news_bundle: Dict) -> "DigestDelivery":
+        """Create an engine with pool sizes from the app configuration."""
+        return cls(
+            app,
+            news_bundle,
+            workers=app.config.get("DIGEST_WORKERS", 8),
+            render_concurrency=app.config.get("DIGEST_RENDER_CONCURRENCY", 4),
+            send_concurrency=app.config.get("DIGEST_SEND_CONCURRENCY", 8),
+            batch_size=app.config.get("DIGEST_BATCH_SIZE", 50),
+        )
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _render_batch(self, user_ids: List[int]) -> List[Dict]:
+        """
+        DB/render stage: load a batch of users and render their digests.
+
+        Every user is counted once: skipped, an error here, or (through the
+        returned messages) by the send stage. Only failures before the
+        skipped count propagate, so the caller can count the whole batch as
+        errors.
+        """
+        users = User.query.filter(User.id.in_(user_ids)).order_by(User.id).all()
+        recipients = [user for user in users if should_send_digest(user)]
+
+        skipped = len(user_ids) - len(recipients)
+        for _ in range(skipped):
+            self._count("skipped")
+
+        try:
+            digests = generate_digest_batch(recipients, news_bundle=self.news_bundle)
+        except Exception as e:
+            for _ in recipients:
+                self._count("errors")
+            logger.error(f"Error loading digests for users {[user.id for user in recipients]}: {e}", exc_info=True)
+            return []
+
+        messages = []
+        for user in recipients:
+            try:
+                digest_data = digests[user.id]
+                message = {
+                    "email": user.email,
+                    "subject": f"Dobrý deň! Váš denný prehľad pre {digest_data['today'].strftime('%d.%m.%Y')}",
+                    "html": render_digest_html(digest_data),
+                    "sms_to": None,
+                    "sms_text": None,
+                }
+
+                if user.sms_enabled and user.phone_number:
+                    tasks_count = len(digest_data["tasks_today"])
+                    events_count = len(digest_data["events_today"])
+                    message["sms_to"] = user.phone_number
+                    message["sms_text"] = f"PlannerX: Dnes máte {tasks_count} úloh a {events_count} udalostí."
+
+                messages.append(message)
+                self._count("rendered")
+
+            except Exception as e:
+                self._count("errors")
+                logger.error(f"Error rendering digest for {user.email}: {e}", exc_info=True)
+
+        return messages
+
+    def _send(self, message: Dict) -> bool:
+        """Network stage: send the email and, if it went out, the SMS."""
+        if not send_email(message["email"], message["subject"], message["html"], pool=self._smtp_pool):
+            return False
+
+        if message["sms_to"]:
+            send_sms(message["sms_to"], message["sms_text"])
+        return True
+
+    def deliver_batch(self, user_ids: List[int]):
+        """Run both stages for one batch of users and update the counters."""
+        with self.app.app_context():
+            try:
+                with self._render_slots:
+                    messages = self._render_batch(user_ids)
+            except Exception as e:
+                for _ in user_ids:
+                    self._count("errors")
+                logger.error(f"Error building digests for users {user_ids}: {e}", exc_info=True)
+                return
+
+            for message in messages:
+                try:
+                    with self._send_slots:
+                        sent = self._send(message)
+
+                    if sent:
+                        self._count("success")
+                        logger.info(f"Digest sent to {message['email']}")
+                    else:
+                        self._count("errors")
+                        logger.error(f"Failed to send digest to {message['email']}")
+
+                except Exception as e:
+                    self._count("errors")
+                    logger.error(f"Error sending digest to {message['email']}: {e}", exc_info=True)
+
+    def run(self, user_ids: List[int]) -> Dict:
+        """
+        Deliver digests to all given users.
+
+        Returns:
+            Dictionary with success, errors, skipped, rendered, total,
+            seconds and digests_per_second
+        """
+        started = time.monotonic()
+        batches = [
+            user_ids[i:i + self.batch_size]
+            for i in range(0, len(user_ids), self.batch_size)
+        ]
+
+        # One authenticated SMTP session per send slot, kept open for the batch
+        pool_size = min(self.workers, self.send_concurrency)
+        with SMTPPool.from_config(self.app.config, size=pool_size) as pool:
+            self._smtp_pool = pool
+            try:
+                if self.workers == 1:
+                    for batch in batches:
+                        self.deliver_batch(batch)
+                else:
+                    with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="digest") as executor:
+                        # Consume the iterator so worker exceptions surface here
+                        list(executor.map(self.deliver_batch, batches))
+            finally:
+                self._smtp_pool = None
+
+        seconds = time.monotonic() - started
+        return {
+            **self.stats,
+            "total": len(user_ids),
+            "seconds": seconds,
+            "digests_per_second": self.stats["success"] / seconds if seconds > 0 else 0.0,
+        }
@@ -1,92 +1,168 @@
 """Daily digest generation service."""
 import logging
+import time
 from datetime import datetime, date, timedelta
-from typing import Dict, List
+from typing import Dict, List, Optional
 from flask import render_template
+from sqlalchemy import func
 
+from app import db
 from app.models.user import User
 from app.models.task import Task
-from app.models.event import Event
 from app.models.contact import Contact
-from app.services.calendar import get_today, expand_recurring_events
+from app.services.calendar import get_today
+from app.services.celebrations import celebrants_query
 from app.services.meniny import get_name_day
-from app.services.news import fetch_news, summarize_news_with_ai
+from app.services.occurrences import load_occurrences
+from app.services.news import fetch_news, select_headlines, summarize_news_with_ai
 
 logger = logging.getLogger(__name__)
 
 
-def generate_digest_data(user: User) -> Dict:
+def build_news_bundle(max_items: int = 5, max_summary_items: int = 5) -> Dict:
     """
-    Generate digest data for a user.
+    Read, rank and summarize news once for a whole digest run.
+    
+    The news section is identical for every recipient, so the digest job
+    builds it a single time and passes it to generate_digest_data. Items come
+    from the warm news cache kept by the news_refresh job.
     
     Args:
-        user: User object
+        max_items: Number of headlines to list under the summary
+        max_summary_items: How many top stories the AI summary covers
     
     Returns:
-        Dictionary with all digest sections
+        Dictionary with news_items, news_summary and build_seconds
     """
-    today = get_today()
+    started = time.monotonic()
+    
+    all_items = fetch_news(max_items=50, fetch_all=True)
+    news_summary = summarize_news_with_ai(all_items, max_summary_items=max_summary_items)
+    
+    return {
+        "news_items": select_headlines(all_items, max_items),
+        "news_summary": news_summary,
+        "build_seconds": time.monotonic() - started,
+    }
+
+
+def _group_by_user(rows: List, user_ids: List[int]) -> Dict[int, List]:
+    """Group ORM rows by user_id, keeping query order within each group."""
+    grouped = {user_id: [] for user_id in user_ids}
+    for row in rows:
+        grouped[row.user_id].append(row)
+    return grouped
+
+
+def generate_digest_batch(users: List[User], news_bundle: Optional[Dict] = None, today: date = None) -> Dict[int, Dict]:
+    """
+    Generate digest data for a batch of users.
+    
+    Every section is loaded for the whole batch with a single query per
+    table and grouped by user_id in memory, so the number of round trips
+    depends on the number of batches, not the number of users.
+    
+    Args:
+        users: User objects of the batch
+        news_bundle: Shared news section from build_news_bundle (built on demand if omitted)
+        today: Digest date (defaults to today in the configured timezone)
+    
+    Returns:
+        Dictionary mapping user id to that user's digest data
+    """
+    if not users:
+        return {}
+    
+    if today is None:
+        today = get_today()
     tomorrow = today + timedelta(days=1)
+    day_start = datetime.combine(today, datetime.min.time())
+    day_end = datetime.combine(tomorrow, datetime.min.time())
+    user_ids = [user.id for user in users]
     
     # Tasks for today
-    tasks_today = (
-        Task.query.filter_by(user_id=user.id)
+    tasks_today = _group_by_user(
+        Task.query.filter(Task.user_id.in_(user_ids))
         .filter(Task.status != "DONE")
-        .filter(Task.due_at >= datetime.combine(today, datetime.min.time()))
-        .filter(Task.due_at < datetime.combine(tomorrow, datetime.min.time()))
+        .filter(Task.due_at >= day_start)
+        .filter(Task.due_at < day_end)
         .order_by(
+            Task.user_id,
             Task.priority.desc(),  # HIGH first
             Task.due_at.asc()
         )
-        .all()
+        .all(),
+        user_ids,
     )
     
-    # Overdue tasks
-    overdue_tasks = (
-        Task.query.filter_by(user_id=user.id)
+    # Overdue tasks (5 oldest per user)
+    overdue_ranked = (
+        db.session.query(
+            Task.id.label("id"),
+            func.row_number()
+            .over(partition_by=Task.user_id, order_by=(Task.due_at.asc(), Task.id.asc()))
+            .label("rank"),
+        )
+        .filter(Task.user_id.in_(user_ids))
         .filter(Task.status != "DONE")
-        .filter(Task.due_at < datetime.combine(today, datetime.min.time()))
-        .order_by(Task.due_at.asc())
-        .limit(5)
-        .all()
+        .filter(Task.due_at < day_start)
+        .subquery()
     )
-    
-    # Events for today
-    events_raw = (
-        Event.query.filter_by(user_id=user.id)
-        .filter(Event.start_at >= datetime.combine(today, datetime.min.time()))
-        .filter(Event.start_at < datetime.combine(tomorrow, datetime.min.time()))
-        .order_by(Event.start_at.asc())
-        .all()
+    overdue_tasks = _group_by_user(
+        Task.query.join(overdue_ranked, Task.id == overdue_ranked.c.id)
+        .filter(overdue_ranked.c.rank <= 5)
+        .order_by(Task.user_id, Task.due_at.asc(), Task.id.asc())
+        .all(),
+        user_ids,
     )
     
-    # Expand recurring events
-    events_today = expand_recurring_events(events_raw, today, today)
+    # Events for today (including recurring series started earlier)
+    events_today = load_occurrences(user_ids, today, today)
     
-    # Birthdays and name days
-    contacts = Contact.query.filter_by(user_id=user.id).all()
-    birthdays_today = [c for c in contacts if c.has_birthday_today(today)]
-    namedays_today = [c for c in contacts if c.has_name_day_today(today)]
+    # Birthdays and name days (only today's celebrants are loaded)
+    contacts = _group_by_user(
+        celebrants_query(user_ids, today).order_by(Contact.user_id, Contact.id).all(),
+        user_ids,
+    )
     
     # Get today's name day names
     nameday_names = get_name_day(today)
     
-    # News
-    news_items = fetch_news(max_items=5)
-    news_summary = summarize_news_with_ai(fetch_news(max_items=50, fetch_all=True), max_summary_items=5)
+    # News (shared by all users of a digest run)
+    if news_bundle is None:
+        news_bundle = build_news_bundle()
+    
+    digests = {}
+    for user in users:
+        user_contacts = contacts[user.id]
+        digests[user.id] = {
+            "user": user,
+            "today": today,
+            "tasks_today": tasks_today[user.id],
+            "overdue_tasks": overdue_tasks[user.id],
+            "events_today": events_today[user.id],
+            "birthdays_today": [c for c in user_contacts if c.has_birthday_today(today)],
+            "namedays_today": [c for c in user_contacts if c.has_name_day_today(today)],
+            "nameday_names": nameday_names,
+            "news_items": news_bundle["news_items"],
+            "news_summary": news_bundle["news_summary"],
+        }
+    
+    return digests
+
+
+def generate_digest_data(user: User, news_bundle: Optional[Dict] = None) -> Dict:
+    """
+    Generate digest data for a user.
+    
+    Args:
+        user: User object
+        news_bundle: Shared news section from build_news_bundle (built on demand if omitted)
     
-    return {
-        "user": user,
-        "today": today,
-        "tasks_today": tasks_today,
-        "overdue_tasks": overdue_tasks,
-        "events_today": events_today,
-        "birthdays_today": birthdays_today,
-        "namedays_today": namedays_today,
-        "nameday_names": nameday_names,
-        "news_items": news_items,
-        "news_summary": news_summary,
-    }
+    Returns:
+        Dictionary with all digest sections
+    """
+    return generate_digest_batch([user], news_bundle=news_bundle)[user.id]
 
 
 def render_digest_html(digest_data: Dict) -> str:
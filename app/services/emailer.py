@@ -1,23 +1,235 @@
 """Email service."""
 import logging
+import queue
 import smtplib
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from flask import current_app
 
 logger = logging.getLogger(__name__)
 
+# Server replies meaning "this session is done" (service closing, too many messages)
+RECONNECT_CODES = {421, 451, 452}
 
-def send_email(to: str, subject: str, html: str, text: str = None) -> bool:
+
+def build_message(to: str, subject: str, html: str, text: str = None, email_from: str = None) -> MIMEMultipart:
+    """Build a multipart email with an optional plain text part."""
+    msg = MIMEMultipart("alternative")
+    msg["Subject"] = subject
+    msg["From"] = email_from
+    msg["To"] = to
+
+    # Plain text fallback
+    if text:
+        msg.attach(MIMEText(text, "plain"))
+
+    # HTML content
+    msg.attach(MIMEText(html, "html"))
+    return msg
+
+
+class PooledSMTP(smtplib.SMTP):
+    """SMTP session that records whether the current message reached DATA."""
+
+    data_started = False
+
+    def data(self, msg):
+        self.data_started = True
+        return super().data(msg)
+
+
+class SMTPPool:
+    """
+    Pool of authenticated SMTP sessions for bulk sending.
+
+    Connections are opened lazily (up to `size`), reused for many messages
+    and replaced after `max_messages` or when the server closes them. Use it
+    as a context manager around a whole batch so every session is QUIT at
+    the end:
+
+        with SMTPPool.from_config(app.config) as pool:
+            send_email(to, subject, html, pool=pool)
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: str = "",
+        password: str = "",
+        starttls: bool = True,
+        size: int = 4,
+        max_messages: int = 100,
+        timeout: float = 30,
+    ):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.starttls = starttls
+        self.size = max(1, size)
+        self.max_messages = max(1, max_messages)
+        self.timeout = timeout
+
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._open = 0
+        self.stats = {"connections": 0, "messages": 0, "reconnects": 0}
+
+    @classmethod
+    def from_config(cls, config, size: int = None) -> "SMTPPool":
+        """Create a pool from the Flask app configuration."""
+        return cls(
+            host=config.get("SMTP_HOST"),
+            port=config.get("SMTP_PORT"),
+            user=config.get("SMTP_USER"),
+            password=config.get("SMTP_PASSWORD"),
+            starttls=config.get("SMTP_STARTTLS", True),
+            size=size or config.get("SMTP_POOL_SIZE", 4),
+            max_messages=config.get("SMTP_MAX_MESSAGES_PER_CONNECTION", 100),
+            timeout=config.get("SMTP_TIMEOUT", 30),
+        )
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open, secure and authenticate a new session."""
+        server = PooledSMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.starttls:
+                server.starttls()
+            if self.user:
+                server.login(self.user, self.password)
+        except Exception:
+            server.close()
+            raise
+        server.messages_sent = 0
+        with self._lock:
+            self.stats["connections"] += 1
+        return server
+
+    def _checkout(self) -> smtplib.SMTP:
+        """Take an idle session, open a new one, or wait for one to free up."""
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+
+            with self._lock:
+                can_open = self._open < self.size
+                if can_open:
+                    self._open += 1
+            if can_open:
+                try:
+                    return self._connect()
+                except Exception:
+                    with self._lock:
+                        self._open -= 1
+                    raise
+
+            # All sessions busy; a discarded one frees a slot, so poll
+            try:
+                return self._idle.get(timeout=1)
+            except queue.Empty:
+                continue
+
+    def _discard(self, server: smtplib.SMTP, quit: bool = True):
+        """Close a session and free its slot."""
+        try:
+            if quit:
+                server.quit()
+            else:
+                server.close()
+        except Exception:
+            server.close()
+        with self._lock:
+            self._open -= 1
+
+    def _checkin(self, server: smtplib.SMTP):
+        """Return a session to the pool, retiring it at the message limit."""
+        if server.messages_sent >= self.max_messages:
+            self._discard(server)
+        else:
+            self._idle.put(server)
+
+    def send(self, msg):
+        """
+        Send one message over a pooled session.
+
+        If the session was dropped by the server (idle timeout, message
+        limit) before the message was handed over, it is replaced and the
+        message is retried once. A disconnect or socket error after DATA
+        started, and any socket timeout, is raised instead: the server may
+        already have accepted the message, and a retry could deliver it twice.
+        """
+        for attempt in range(2):
+            server = self._checkout()
+            server.data_started = False
+            try:
+                server.send_message(msg)
+            except smtplib.SMTPResponseException as e:
+                if e.smtp_code not in RECONNECT_CODES:
+                    self._checkin(server)
+                    raise
+                retry = e
+            except smtplib.SMTPServerDisconnected as e:
+                if server.data_started:
+                    self._discard(server, quit=False)
+                    raise
+                retry = e
+            except smtplib.SMTPException:
+                self._discard(server, quit=False)
+                raise
+            except ConnectionError as e:
+                # Reset or broken pipe on a stale session
+                if server.data_started:
+                    self._discard(server, quit=False)
+                    raise
+                retry = e
+            except Exception:
+                self._discard(server, quit=False)
+                raise
+            else:
+                server.messages_sent += 1
+                with self._lock:
+                    self.stats["messages"] += 1
+                self._checkin(server)
+                return
+
+            self._discard(server, quit=False)
+            if attempt:
+                raise retry
+            with self._lock:
+                self.stats["reconnects"] += 1
+            logger.info(f"SMTP session closed by server ({retry}), reconnecting")
+
+    def close(self):
+        """QUIT all idle sessions."""
+        while True:
+            try:
+                server = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(server)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def send_email(to: str, subject: str, html: str, text: str = None, pool: SMTPPool = None) -> bool:
     """
     Send an email via SMTP.
-    
+
     Args:
         to: Recipient email address
         subject: Email subject
         html: HTML body
         text: Plain text body (optional, will be extracted from HTML if not provided)
-    
+        pool: Optional SMTPPool to reuse connections across many sends
+
     Returns:
         bool: True if sent successfully, False otherwise
     """
@@ -33,28 +245,18 @@ def send_email(to: str, subject: str, html: str, text: str = None) -> bool:
             logger.warning("SMTP not configured, email not sent")
             return False
 
-        # Create message
-        msg = MIMEMultipart("alternative")
-        msg["Subject"] = subject
-        msg["From"] = email_from
-        msg["To"] = to
-
-        # Plain text fallback
-        if text:
-            part1 = MIMEText(text, "plain")
-            msg.attach(part1)
-
-        # HTML content
-        part2 = MIMEText(html, "html")
-        msg.attach(part2)
+        msg = build_message(to, subject, html, text=text, email_from=email_from)
 
         # Send email
-        with smtplib.SMTP(smtp_host, smtp_port) as server:
-            server.set_debuglevel(0)
-            if use_starttls:
-                server.starttls()
-            server.login(smtp_user, smtp_password)
-            server.send_message(msg)
+        if pool is not None:
+            pool.send(msg)
+        else:
+            with smtplib.SMTP(smtp_host, smtp_port) as server:
+                server.set_debuglevel(0)
+                if use_starttls:
+                    server.starttls()
+                server.login(smtp_user, smtp_password)
+                server.send_message(msg)
 
         logger.info(f"Email sent to {to}: {subject}")
         return True
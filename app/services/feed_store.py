@@ -0,0 +1,39 @@
+"""Per-feed store of parsed entries and HTTP validators."""
+import hashlib
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from app.services.cache_files import atomic_write_json, read_json
+
+
+class FeedStore:
+    """
+    Directory of one JSON file per feed.
+
+    Each file keeps the feed's ETag / Last-Modified validators next to the
+    entries parsed from its last full response, so a 304 answer can be served
+    from disk without downloading or parsing the feed again.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+
+    def _path(self, url: str) -> Path:
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def load(self, url: str) -> Optional[Dict]:
+        """Load the stored record for a feed, or None if there is none."""
+        return read_json(self._path(url))
+
+    def save(self, url: str, entries: List[Dict], etag: Optional[str], last_modified: Optional[str]):
+        """Store parsed entries and validators after a full response."""
+        record = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.time(),
+            "entries": entries,
+        }
+        atomic_write_json(self._path(url), record)
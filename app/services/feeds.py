@@ -0,0 +1,212 @@
+"""Concurrent RSS feed download engine."""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Dict, Iterator, List, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "PlannerX/1.0 (+https://github.com/jaklooo/PlannerX)"
+CHUNK_SIZE = 64 * 1024
+
+# Per-feed fetch statistics, keyed by feed URL
+_stats: Dict[str, Dict] = {}
+_stats_lock = threading.Lock()
+
+
+class FeedTimeoutError(Exception):
+    """Raised when a single feed exceeds its download deadline."""
+
+
+def download_feed(
+    url: str,
+    timeout: float,
+    max_bytes: int,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+) -> Dict:
+    """
+    Download a feed body within a hard deadline.
+
+    The requests timeout only bounds each socket operation, so the body is
+    streamed in chunks and the total elapsed time is checked between them.
+    When validators from a previous fetch are given, the request is
+    conditional and a 304 response returns no body.
+
+    Args:
+        url: Feed URL
+        timeout: Total seconds allowed for connect + transfer
+        max_bytes: Maximum body size to accept
+        etag: ETag from the previous response, if any
+        last_modified: Last-Modified from the previous response, if any
+
+    Returns:
+        Dictionary with status, content (None on 304), etag and last_modified
+
+    Raises:
+        FeedTimeoutError: If the deadline passes during the transfer
+        requests.RequestException: On connection or HTTP errors
+    """
+    deadline = time.monotonic() + timeout
+
+    headers = {"User-Agent": USER_AGENT}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    with requests.get(
+        url,
+        timeout=(min(timeout, 5.0), timeout),
+        headers=headers,
+        stream=True,
+    ) as response:
+        result = {
+            "status": response.status_code,
+            "content": None,
+            "etag": response.headers.get("ETag", etag),
+            "last_modified": response.headers.get("Last-Modified", last_modified),
+        }
+        if response.status_code == 304:
+            return result
+
+        response.raise_for_status()
+
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(CHUNK_SIZE):
+            if time.monotonic() > deadline:
+                raise FeedTimeoutError(f"Feed exceeded {timeout:.0f}s deadline")
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > max_bytes:
+                raise ValueError(f"Feed larger than {max_bytes} bytes")
+
+        result["content"] = b"".join(chunks)
+        return result
+
+
+def _record(url: str, elapsed: float, error: Optional[str], not_modified: bool = False):
+    """Update fetch statistics for a feed."""
+    with _stats_lock:
+        stats = _stats.setdefault(url, {
+            "fetches": 0,
+            "failures": 0,
+            "not_modified": 0,
+            "last_latency_ms": None,
+            "last_error": None,
+            "last_fetched_at": None,
+        })
+        stats["fetches"] += 1
+        stats["last_latency_ms"] = round(elapsed * 1000, 1)
+        stats["last_fetched_at"] = time.time()
+        if not_modified:
+            stats["not_modified"] += 1
+        if error:
+            stats["failures"] += 1
+            stats["last_error"] = error
+        else:
+            stats["last_error"] = None
+
+
+def _timed_download(url: str, timeout: float, max_bytes: int, validators: Dict) -> Dict:
+    """Download a feed and wrap the outcome in a result dictionary."""
+    started = time.monotonic()
+    try:
+        result = download_feed(
+            url,
+            timeout,
+            max_bytes,
+            etag=validators.get("etag"),
+            last_modified=validators.get("last_modified"),
+        )
+        elapsed = time.monotonic() - started
+        _record(url, elapsed, None, not_modified=result["status"] == 304)
+        return {"url": url, "error": None, "elapsed": elapsed, **result}
+    except Exception as e:
+        elapsed = time.monotonic() - started
+        _record(url, elapsed, str(e))
+        return {
+            "url": url,
+            "status": None,
+            "content": None,
+            "etag": None,
+            "last_modified": None,
+            "error": str(e),
+            "elapsed": elapsed,
+        }
+
+
+def fetch_feeds(
+    urls: List[str],
+    max_workers: int = 8,
+    feed_timeout: float = 10.0,
+    overall_timeout: float = 30.0,
+    max_bytes: int = 5 * 1024 * 1024,
+    validators: Optional[Dict[str, Dict]] = None,
+) -> Iterator[Dict]:
+    """
+    Download feeds in parallel and yield results as they complete.
+
+    Results are yielded in completion order so the caller can parse one feed
+    while the others are still downloading. Feeds that have not finished when
+    the overall deadline passes are yielded as failures.
+
+    Args:
+        urls: Feed URLs to download
+        max_workers: Size of the download pool
+        feed_timeout: Deadline for a single feed in seconds
+        overall_timeout: Deadline for the whole batch in seconds
+        max_bytes: Maximum accepted body size per feed
+        validators: Optional {url: {"etag", "last_modified"}} for conditional requests
+
+    Yields:
+        Dictionaries with url, status, content (bytes, or None on 304 and
+        failure), etag, last_modified, error and elapsed
+    """
+    if not urls:
+        return
+
+    validators = validators or {}
+
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(urls))),
+        thread_name_prefix="feed-fetch",
+    )
+    futures = {
+        executor.submit(_timed_download, url, feed_timeout, max_bytes, validators.get(url, {})): url
+        for url in urls
+    }
+    pending = set(futures.values())
+
+    try:
+        for future in as_completed(futures, timeout=overall_timeout):
+            result = future.result()
+            pending.discard(result["url"])
+            yield result
+    except FuturesTimeoutError:
+        for url in pending:
+            logger.warning(f"Feed {url} did not finish within {overall_timeout:.0f}s")
+            _record(url, overall_timeout, "overall deadline exceeded")
+            yield {
+                "url": url,
+                "status": None,
+                "content": None,
+                "etag": None,
+                "last_modified": None,
+                "error": "overall deadline exceeded",
+                "elapsed": overall_timeout,
+            }
+    finally:
+        # Don't wait for stragglers; their own deadline bounds them
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def get_feed_stats() -> Dict[str, Dict]:
+    """Return a snapshot of per-feed latency and failure counters."""
+    with _stats_lock:
+        return {url: dict(stats) for url, stats in _stats.items()}
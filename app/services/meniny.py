@@ -1,68 +1,167 @@
 """Name days (meniny) lookup service."""
 import json
 import logging
+import os
+import threading
+import unicodedata
 from datetime import date
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
 from flask import current_app
 
 logger = logging.getLogger(__name__)
 
+# Year stored in name_day_date: name days have no year, and a leap year
+# keeps 02-29 representable
+NAME_DAY_YEAR = 2000
+
+
+def normalize_name(name: str) -> str:
+    """Fold case and diacritics so "Žofia", "zofia" and "ŽOFIA" compare equal."""
+    decomposed = unicodedata.normalize("NFKD", name.strip())
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+class NameDayRegistry:
+    """
+    Name-day calendar parsed once and re-read only when the file changes.
+
+    Keeps two indexes: "MM-DD" -> names and normalized name -> (month, day).
+    A name listed on several days maps to its first day in file order.
+    Every lookup costs one stat() of the file to notice edits.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._signature: Optional[Tuple[int, int]] = None
+        self._by_date: Dict[str, List[str]] = {}
+        self._by_name: Dict[str, Tuple[int, int]] = {}
+        self.loads = 0
+
+    def _current(self) -> Tuple[Dict[str, List[str]], Dict[str, Tuple[int, int]]]:
+        """Both indexes, reloading them if the file's mtime or size changed."""
+        try:
+            stat = os.stat(self.path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            signature = None
+
+        with self._lock:
+            if signature != self._signature:
+                self._load(signature)
+            return self._by_date, self._by_name
+
+    def _load(self, signature: Optional[Tuple[int, int]]):
+        self._signature = signature
+        self._by_date, self._by_name = {}, {}
+        if signature is None:
+            logger.warning(f"Name days file not found: {self.path}")
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+        except Exception as e:
+            logger.error(f"Failed to load name days: {e}")
+            return
+
+        for date_key, names in raw.items():
+            try:
+                month, day = map(int, date_key.split("-"))
+            except ValueError:
+                logger.warning(f"Skipping invalid name day key: {date_key}")
+                continue
+            names = names if isinstance(names, list) else [names]
+            self._by_date[date_key] = names
+            for name in names:
+                self._by_name.setdefault(normalize_name(name), (month, day))
+        self.loads += 1
+
+    @property
+    def by_date(self) -> Dict[str, List[str]]:
+        """"MM-DD" -> names (do not modify)."""
+        return self._current()[0]
+
+    def names_on(self, month: int, day: int) -> List[str]:
+        """Names celebrating on a month/day."""
+        return list(self._current()[0].get(f"{month:02d}-{day:02d}", []))
+
+    def month_day_of(self, name: str) -> Optional[Tuple[int, int]]:
+        """(month, day) of a name's name day, ignoring case and diacritics."""
+        return self._current()[1].get(normalize_name(name))
+
+
+def get_registry() -> NameDayRegistry:
+    """Name-day registry of the current app (created on first use)."""
+    path = Path(current_app.config.get("NAME_DAYS_FILE"))
+    registry = current_app.extensions.get("name_days")
+    if registry is None or registry.path != path:
+        registry = current_app.extensions["name_days"] = NameDayRegistry(path)
+    return registry
+
 
 def load_name_days() -> dict:
-    """Load name days from JSON file."""
-    try:
-        file_path = Path(current_app.config.get("NAME_DAYS_FILE"))
-        
-        if not file_path.exists():
-            logger.warning(f"Name days file not found: {file_path}")
-            return {}
-        
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    
-    except Exception as e:
-        logger.error(f"Failed to load name days: {e}")
-        return {}
+    """Name days as loaded from the JSON file ("MM-DD" -> names)."""
+    return get_registry().by_date
 
 
 def get_name_day(target_date: date = None) -> List[str]:
     """
     Get names celebrating on a specific date.
-    
+
     Args:
         target_date: Date to check (defaults to today)
-    
+
     Returns:
         List of names celebrating on that date
     """
     if target_date is None:
         target_date = date.today()
-    
-    name_days = load_name_days()
-    key = target_date.strftime("%m-%d")  # Format: "10-22"
-    
-    names = name_days.get(key, [])
-    return names if isinstance(names, list) else [names]
+
+    return get_registry().names_on(target_date.month, target_date.day)
 
 
 def find_name_day(name: str) -> date | None:
     """
     Find the date when a specific name is celebrated.
-    
+
     Args:
-        name: Name to search for
-    
+        name: Name to search for (case and diacritics are ignored)
+
     Returns:
         Date of celebration or None if not found
     """
-    name_days = load_name_days()
-    name_lower = name.lower()
-    
-    for date_key, names in name_days.items():
-        names_list = names if isinstance(names, list) else [names]
-        if any(n.lower() == name_lower for n in names_list):
-            month, day = map(int, date_key.split("-"))
-            return date(date.today().year, month, day)
-    
-    return None
+    month_day = get_registry().month_day_of(name)
+    if month_day is None:
+        return None
+
+    month, day = month_day
+    return date(date.today().year, month, day)
+
+
+def first_name(full_name: str) -> str:
+    """First name of "Ján Novák" or "Novák, Ján" ("" if there is none)."""
+    if not full_name:
+        return ""
+    if "," in full_name:
+        full_name = full_name.split(",", 1)[1]
+    parts = full_name.split()
+    return parts[0].strip(".") if parts else ""
+
+
+def resolve_name_day(full_name: str) -> date | None:
+    """
+    Name day of a contact from its first name, as a NAME_DAY_YEAR date.
+
+    Args:
+        full_name: Contact name ("Ján Novák" or "Novák, Ján")
+
+    Returns:
+        Date in NAME_DAY_YEAR, or None if the first name has no name day
+    """
+    name = first_name(full_name)
+    month_day = get_registry().month_day_of(name) if name else None
+    if month_day is None:
+        return None
+    return date(NAME_DAY_YEAR, *month_day)
@@ -1,13 +1,37 @@
 """News/RSS feed service with AI summarization."""
 import json
 import logging
+import re
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Dict, Optional
+
+import feedparser
 from flask import current_app
 
+from app.services.ai_cache import RANKING, SUMMARY, content_key, get_ai_cache
+from app.services.cache_files import FileLock, atomic_write_json, read_json
+from app.services.feed_store import FeedStore
+from app.services.feeds import fetch_feeds
+
 logger = logging.getLogger(__name__)
 
+# Entries kept per feed in the feed store and news cache
+MAX_ITEMS_PER_FEED = 50
+# Entries per feed in the short headline list
+HEADLINES_PER_FEED = 3
+
+# Models and prompt versions; bump a version when its prompt changes so
+# cached completions of the old prompt are no longer used
+RANKING_MODEL = "gpt-3.5-turbo"
+RANKING_PROMPT_VERSION = "1"
+SUMMARY_MODEL = "gpt-4o-mini"  # Better model for richer, more comprehensive summaries
+SUMMARY_PROMPT_VERSION = "1"
+
+# Guards against overlapping background refreshes in this process
+_refresh_lock = threading.Lock()
+
 
 def get_rss_feeds() -> List[Dict[str, str]]:
     """Load RSS feeds from YAML file."""
@@ -27,87 +51,112 @@ def get_rss_feeds() -> List[Dict[str, str]]:
         return []
 
 
-def fetch_news(max_items: int = 5, cache_hours: int = 12, fetch_all: bool = False) -> List[Dict[str, str]]:
+def _entry_to_item(entry, feed_info: Dict[str, str]) -> Dict[str, str]:
+    """Convert a parsed feed entry to a news item dictionary."""
+    link = entry.get("link", "")
+
+    # Extract summary (first sentence or description)
+    summary = entry.get("summary", entry.get("description", ""))
+    if summary:
+        # Remove HTML tags and keep the first sentence
+        summary = re.sub(r"<[^>]+>", "", summary)
+        sentences = re.split(r"(?<=[.!?])\s+", summary)
+        summary = sentences[0] if sentences else summary
+        summary = summary[:300] + "..." if len(summary) > 300 else summary
+
+    # Get full content if available (for AI processing)
+    full_content = ""
+    if hasattr(entry, 'content') and entry.content:
+        full_content = entry.content[0].value if isinstance(entry.content, list) else str(entry.content)
+        full_content = re.sub(r"<[^>]+>", "", full_content)[:5000]  # Increased limit for richer content
+
+    return {
+        "title": entry.get("title", "No title"),
+        "summary": summary,
+        "content": full_content,
+        "link": link,
+        "published": entry.get("published", ""),
+        "source": feed_info.get("name", feed_info.get("url", "")),
+    }
+
+
+def refresh_news() -> List[Dict[str, str]]:
     """
-    Fetch news from RSS feeds with caching.
+    Download all feeds and rewrite the news cache.
 
-    Args:
-        max_items: Maximum number of news items to return
-        cache_hours: Cache validity in hours
-        fetch_all: If True, fetch more items for AI processing
+    This is the only function that touches the network. It runs from the
+    news_refresh scheduler job (and from background revalidation) so readers
+    never have to wait for feeds.
+
+    Feeds are downloaded in parallel (see app.services.feeds) and parsed as
+    each download completes, so a slow or dead host only costs its own
+    deadline instead of stalling the other feeds. Requests are conditional on
+    the validators kept in the per-feed store; unchanged feeds (304) and
+    failed feeds reuse their stored entries.
 
     Returns:
-        List of news items with title, summary, link, published
+        Full list of cached news items, newest first
     """
-    try:
-        import feedparser
+    cache_file = Path(current_app.config.get("RSS_CACHE_FILE"))
 
-        cache_file = Path(current_app.config.get("RSS_CACHE_FILE"))
-        cache_file.parent.mkdir(parents=True, exist_ok=True)
+    # Single flight across gunicorn workers: whoever holds the lock refreshes,
+    # everyone else keeps serving the current cache
+    lock = FileLock(cache_file.with_suffix(".lock"))
+    if not lock.acquire(blocking=False):
+        logger.info("News refresh already running in another worker, skipping")
+        return read_json(cache_file, default=[])
 
-        # Check cache (but skip for fetch_all mode)
-        if not fetch_all and cache_file.exists():
-            cache_age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
-            if cache_age < timedelta(hours=cache_hours):
-                with open(cache_file, "r", encoding="utf-8") as f:
-                    cached = json.load(f)
-                    logger.info(f"Using cached news ({len(cached)} items)")
-                    return cached[:max_items]
-
-        # Fetch fresh news
-        feeds = get_rss_feeds()
+    try:
+        feeds = [f for f in get_rss_feeds() if f.get("url")]
+        feeds_by_url = {f["url"]: f for f in feeds}
         all_entries = []
         seen_urls = set()
 
-        # Fetch more items when doing AI processing
-        items_per_feed = 50 if fetch_all else 3
-
-        for feed_info in feeds:
-            url = feed_info.get("url")
-            if not url:
-                continue
-
-            try:
-                logger.info(f"Fetching RSS feed: {url}")
-                feed = feedparser.parse(url)
-
-                for entry in feed.entries[:items_per_feed]:
-                    link = entry.get("link", "")
-
-                    # Deduplicate by URL
-                    if link in seen_urls:
-                        continue
-                    seen_urls.add(link)
-
-                    # Extract summary (first sentence or description)
-                    summary = entry.get("summary", entry.get("description", ""))
-                    if summary:
-                        # Get first sentence
-                        import re
-                        # Remove HTML tags
-                        summary = re.sub(r"<[^>]+>", "", summary)
-                        sentences = re.split(r"(?<=[.!?])\s+", summary)
-                        summary = sentences[0] if sentences else summary
-                        summary = summary[:300] + "..." if len(summary) > 300 else summary
-
-                    # Get full content if available (for AI processing)
-                    full_content = ""
-                    if hasattr(entry, 'content') and entry.content:
-                        full_content = entry.content[0].value if isinstance(entry.content, list) else str(entry.content)
-                        full_content = re.sub(r"<[^>]+>", "", full_content)[:5000]  # Increased limit for richer content
-
-                    all_entries.append({
-                        "title": entry.get("title", "No title"),
-                        "summary": summary,
-                        "content": full_content,
-                        "link": link,
-                        "published": entry.get("published", ""),
-                        "source": feed_info.get("name", url),
-                    })
-
-            except Exception as e:
-                logger.error(f"Failed to fetch feed {url}: {e}")
-                continue
+        # Previously stored entries and validators, one record per feed
+        store = FeedStore(current_app.config.get("RSS_FEED_STORE_DIR"))
+        records = {url: store.load(url) or {} for url in feeds_by_url}
+
+        results = fetch_feeds(
+            list(feeds_by_url),
+            max_workers=current_app.config.get("RSS_FETCH_WORKERS", 8),
+            feed_timeout=current_app.config.get("RSS_FEED_TIMEOUT", 10),
+            overall_timeout=current_app.config.get("RSS_FETCH_DEADLINE", 30),
+            validators={
+                url: {"etag": r.get("etag"), "last_modified": r.get("last_modified")}
+                for url, r in records.items()
+            },
+        )
+
+        for result in results:
+            url = result["url"]
+            feed_items = records[url].get("entries", [])
+
+            if result["error"]:
+                # Fall back to the last stored copy of the feed
+                logger.error(f"Failed to fetch feed {url}: {result['error']}")
+            elif result["status"] == 304:
+                logger.info(f"RSS feed {url} not modified ({len(feed_items)} stored items)")
+            else:
+                try:
+                    feed = feedparser.parse(result["content"])
+                    logger.info(f"Fetched RSS feed {url} in {result['elapsed']:.2f}s")
+
+                    feed_items = [
+                        _entry_to_item(entry, feeds_by_url[url])
+                        for entry in feed.entries[:MAX_ITEMS_PER_FEED]
+                    ]
+                    store.save(url, feed_items, result["etag"], result["last_modified"])
+
+                except Exception as e:
+                    logger.error(f"Failed to parse feed {url}: {e}")
+
+            for item in feed_items:
+                # Deduplicate by URL
+                if item["link"] in seen_urls:
+                    continue
+                seen_urls.add(item["link"])
+
+                all_entries.append(item)
 
         # Sort by published date (newest first)
         all_entries.sort(
@@ -115,15 +164,85 @@ def fetch_news(max_items: int = 5, cache_hours: int = 12, fetch_all: bool = Fals
             reverse=True
         )
 
-        # Cache results
-        with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump(all_entries, f, ensure_ascii=False, indent=2)
+        # Cache results (atomic replace, readers never see a partial file)
+        atomic_write_json(cache_file, all_entries)
 
-        logger.info(f"Fetched {len(all_entries)} news items from {len(feeds)} feeds")
-        return all_entries[:max_items] if not fetch_all else all_entries
+        logger.info(f"Refreshed news cache: {len(all_entries)} items from {len(feeds)} feeds")
+        return all_entries
 
     except Exception as e:
-        logger.error(f"Failed to fetch news: {e}")
+        logger.error(f"Failed to refresh news: {e}")
+        return []
+
+    finally:
+        lock.release()
+
+
+def _refresh_in_background(app):
+    """Run refresh_news in a daemon thread unless one is already running."""
+    if not _refresh_lock.acquire(blocking=False):
+        return
+
+    def run():
+        try:
+            with app.app_context():
+                refresh_news()
+        finally:
+            _refresh_lock.release()
+
+    threading.Thread(target=run, name="news-revalidate", daemon=True).start()
+
+
+def select_headlines(news_items: List[Dict[str, str]], max_items: int = 5) -> List[Dict[str, str]]:
+    """Pick the newest headlines, at most HEADLINES_PER_FEED from each source."""
+    per_source = {}
+    headlines = []
+    for item in news_items:
+        source = item.get("source", "")
+        if per_source.get(source, 0) >= HEADLINES_PER_FEED:
+            continue
+        per_source[source] = per_source.get(source, 0) + 1
+        headlines.append(item)
+        if len(headlines) >= max_items:
+            break
+    return headlines
+
+
+def fetch_news(max_items: int = 5, cache_hours: int = 12, fetch_all: bool = False) -> List[Dict[str, str]]:
+    """
+    Read news from the warm cache.
+
+    Never blocks on the network: when the cache is missing or older than
+    cache_hours, the cached items (if any) are returned as they are and a
+    refresh is started in the background (stale-while-revalidate).
+
+    Args:
+        max_items: Maximum number of news items to return
+        cache_hours: Cache validity in hours
+        fetch_all: If True, return every cached item for AI processing
+
+    Returns:
+        List of news items with title, summary, link, published
+    """
+    try:
+        cache_file = Path(current_app.config.get("RSS_CACHE_FILE"))
+
+        cached = []
+        is_stale = True
+        if cache_file.exists():
+            cache_age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
+            is_stale = cache_age >= timedelta(hours=cache_hours)
+            cached = read_json(cache_file, default=[])
+
+        if is_stale and current_app.config.get("NEWS_REVALIDATE_ON_READ", True):
+            logger.info("News cache is stale, refreshing in background")
+            _refresh_in_background(current_app._get_current_object())
+
+        logger.info(f"Using cached news ({len(cached)} items)")
+        return cached if fetch_all else select_headlines(cached, max_items)
+
+    except Exception as e:
+        logger.error(f"Failed to read news cache: {e}")
         return []
 
 
@@ -160,6 +279,33 @@ def summarize_news_with_ai(news_items: List[Dict[str, str]], max_summary_items:
         return summarize_news_simple(news_items[:max_summary_items])
 
 
+def _openai_client(api_key: str):
+    """
+    OpenAI client of the current app for the configured endpoint (created on first use).
+
+    One client, and its HTTP connection pool, serves all completions until
+    the key or OPENAI_BASE_URL (default api.openai.com) changes. The HTTP
+    client is passed explicitly: openai 1.12 builds its default one with a
+    `proxies` argument that httpx 0.28 no longer accepts.
+
+    Raises:
+        ImportError: If the openai library is not installed
+    """
+    settings = (api_key, current_app.config.get("OPENAI_BASE_URL") or None)
+    cached = current_app.extensions.get("openai_client")
+    if cached is not None and cached[0] == settings:
+        return cached[1]
+
+    import httpx
+    import openai
+
+    client = openai.OpenAI(api_key=settings[0], base_url=settings[1], http_client=httpx.Client(timeout=60.0))
+    if cached is not None:
+        cached[1].close()
+    current_app.extensions["openai_client"] = (settings, client)
+    return client
+
+
 def rank_news_by_importance(titles: List[str], news_items: List[Dict]) -> List[Dict]:
     """
     Use AI to rank news by importance based on titles.
@@ -172,14 +318,19 @@ def rank_news_by_importance(titles: List[str], news_items: List[Dict]) -> List[D
         Ranked list of news items
     """
     try:
-        import openai
-
         api_key = current_app.config.get("OPENAI_API_KEY")
         if not api_key:
             logger.warning("OpenAI API key not configured, using simple ranking")
             return news_items[:10]  # Return first 10 as fallback
 
-        client = openai.OpenAI(api_key=api_key)
+        # Same headlines and prompt -> same ranking
+        cache = get_ai_cache(RANKING)
+        cache_key = content_key(RANKING_PROMPT_VERSION, RANKING_MODEL, titles)
+        indices = cache.get(cache_key)
+        if indices is not None:
+            return [news_items[i] for i in indices if i < len(news_items)]
+
+        client = _openai_client(api_key)
 
         prompt = f"""
         Here are news headlines from today. Rank them by importance/relevance for a Slovak user.
@@ -196,7 +347,7 @@ def rank_news_by_importance(titles: List[str], news_items: List[Dict]) -> List[D
         """
 
         response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
+            model=RANKING_MODEL,
             messages=[{"role": "user", "content": prompt}],
             max_tokens=200,
             temperature=0.3
@@ -209,6 +360,7 @@ def rank_news_by_importance(titles: List[str], news_items: List[Dict]) -> List[D
             indices = json.loads(result)
             if isinstance(indices, list):
                 ranked_items = [news_items[i] for i in indices if i < len(news_items)]
+                cache.put(cache_key, indices)
                 return ranked_items
         except json.JSONDecodeError:
             logger.error(f"Failed to parse AI ranking response: {result}")
@@ -235,14 +387,22 @@ def generate_news_summary(news_items: List[Dict]) -> str:
         Formatted summary text
     """
     try:
-        import openai
-
         api_key = current_app.config.get("OPENAI_API_KEY")
         if not api_key:
             logger.warning("OpenAI API key not configured, using simple summary")
             return summarize_news_simple(news_items)
 
-        client = openai.OpenAI(api_key=api_key)
+        # Same ranked stories and prompt -> same summary
+        cache = get_ai_cache(SUMMARY)
+        cache_key = content_key(SUMMARY_PROMPT_VERSION, SUMMARY_MODEL, [
+            [item['title'], item.get('source'), item.get('summary'), (item.get('content') or '')[:2000]]
+            for item in news_items
+        ])
+        summary = cache.get(cache_key)
+        if summary is not None:
+            return summary
+
+        client = _openai_client(api_key)
 
         # Prepare content for AI
         news_text = ""
@@ -271,13 +431,14 @@ def generate_news_summary(news_items: List[Dict]) -> str:
         """
 
         response = client.chat.completions.create(
-            model="gpt-4o-mini",  # Better model for richer, more comprehensive summaries
+            model=SUMMARY_MODEL,
             messages=[{"role": "user", "content": prompt}],
             max_tokens=1200,  # Increased for richer summaries
             temperature=0.4
         )
 
         summary = response.choices[0].message.content.strip()
+        cache.put(cache_key, summary)
         return summary
 
     except ImportError:
@@ -0,0 +1,231 @@
+"""Materialized occurrence index for (recurring) events."""
+import logging
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from flask import current_app
+from sqlalchemy import delete, func, insert
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app import db
+from app.models.event import Event
+from app.models.event_occurrence import EventOccurrence, EventOccurrenceState
+from app.services.calendar import (
+    expand_recurring_events,
+    get_today,
+    occurrence_dates,
+    occurring_between,
+)
+
+logger = logging.getLogger(__name__)
+
+INSERT_CHUNK_SIZE = 1000
+
+# Primary key of the single event_occurrence_state row
+STATE_ID = 1
+
+
+def occurrences_enabled() -> bool:
+    """Whether the event_occurrences table is maintained and used for reads."""
+    return current_app.config.get("EVENT_OCCURRENCES_ENABLED", False)
+
+
+def materialized_window(today: date = None) -> Tuple[date, date]:
+    """
+    Date range kept in event_occurrences.
+    
+    Starts at the first day of the current month (so "this month" views are
+    covered) and ends EVENT_OCCURRENCE_HORIZON_DAYS after today.
+    """
+    if today is None:
+        today = get_today()
+    horizon = current_app.config.get("EVENT_OCCURRENCE_HORIZON_DAYS", 365)
+    return today.replace(day=1), today + timedelta(days=horizon)
+
+
+def materialized_range() -> Optional[Tuple[date, date]]:
+    """(first, last) date event_occurrences is complete for, or None if it must be rebuilt."""
+    state = db.session.get(EventOccurrenceState, STATE_ID)
+    if state is None:
+        return None
+    return state.materialized_from, state.materialized_through
+
+
+def _mark_stale():
+    """Drop the watermark: an event changed while the table was not maintained."""
+    db.session.execute(delete(EventOccurrenceState))
+
+
+def _rows(event: Event, start_date: date, end_date: date) -> List[Dict]:
+    """Occurrence rows of one event within [start_date, end_date]."""
+    start_time = event.start_at.time()
+    return [
+        {
+            "event_id": event.id,
+            "user_id": event.user_id,
+            "occurrence_date": day,
+            "starts_at": datetime.combine(day, start_time),
+        }
+        for day in occurrence_dates(event.start_at.date(), event.repeat_rule, start_date, end_date)
+    ]
+
+
+def _insert_statement():
+    """
+    INSERT that skips rows already materialized by a concurrent writer
+    (another worker's refresh or a sync_event racing with it).
+    """
+    dialect = db.session.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(EventOccurrence).on_conflict_do_nothing()
+    if dialect == "sqlite":
+        return sqlite.insert(EventOccurrence).on_conflict_do_nothing()
+    return insert(EventOccurrence)
+
+
+def _insert(rows: List[Dict]):
+    """Bulk insert occurrence rows in chunks."""
+    if not rows:
+        return
+    statement = _insert_statement()
+    for i in range(0, len(rows), INSERT_CHUNK_SIZE):
+        db.session.execute(statement, rows[i:i + INSERT_CHUNK_SIZE])
+
+
+def remove_event(event_id: int):
+    """Drop all materialized occurrences of an event (or mark the table stale if it is off)."""
+    if not occurrences_enabled():
+        _mark_stale()
+        return
+    db.session.execute(delete(EventOccurrence).where(EventOccurrence.event_id == event_id))
+
+
+def sync_event(event: Event, today: date = None):
+    """
+    Re-materialize one event after it was created or changed.
+    
+    Runs in the caller's session; the caller commits. The event must have
+    been flushed so it has an id. With the feature off the table is only
+    marked stale, so the next refresh after enabling it rebuilds it.
+    """
+    if not occurrences_enabled():
+        _mark_stale()
+        return
+    remove_event(event.id)
+    _insert(_rows(event, *materialized_window(today)))
+
+
+def refresh_occurrences(today: date = None, full: bool = None) -> Dict:
+    """
+    Roll the materialized window forward and record it as the watermark.
+    
+    Drops occurrences before the window and appends occurrences up to the
+    new horizon for every event that can occur in it, starting after the
+    last materialized date of each event.
+    
+    The incremental mode trusts existing rows, which sync_event keeps up to
+    date only while the feature is enabled. A full rebuild drops every row
+    and materializes the whole window again. It runs when there is no
+    watermark: the table was never filled, or events changed while the
+    feature was off.
+    
+    Args:
+        today: Reference date for the window
+        full: Rebuild all rows instead of appending (default: only without a watermark)
+    
+    Returns:
+        Dictionary with deleted, inserted and events counts and whether it was a full rebuild
+    """
+    window_start, window_end = materialized_window(today)
+    state = db.session.get(EventOccurrenceState, STATE_ID)
+    if full is None:
+        full = state is None
+    
+    if full:
+        deleted = db.session.execute(delete(EventOccurrence)).rowcount
+        last_dates = {}
+    else:
+        deleted = db.session.execute(
+            delete(EventOccurrence).where(EventOccurrence.occurrence_date < window_start)
+        ).rowcount
+        last_dates = dict(
+            db.session.query(EventOccurrence.event_id, func.max(EventOccurrence.occurrence_date))
+            .group_by(EventOccurrence.event_id)
+            .all()
+        )
+    
+    rows = []
+    events = inserted = 0
+    for event in Event.query.filter(occurring_between(window_start, window_end)).yield_per(500):
+        last = last_dates.get(event.id)
+        start = window_start if last is None else max(window_start, last + timedelta(days=1))
+        if start > window_end:
+            continue
+        new_rows = _rows(event, start, window_end)
+        if new_rows:
+            events += 1
+            inserted += len(new_rows)
+            rows.extend(new_rows)
+        if len(rows) >= INSERT_CHUNK_SIZE:
+            _insert(rows)
+            rows = []
+    _insert(rows)
+    
+    # Same transaction as the rows, so readers never see a watermark without them
+    if state is None:
+        state = EventOccurrenceState(id=STATE_ID)
+        db.session.add(state)
+    state.materialized_from, state.materialized_through = window_start, window_end
+    state.refreshed_at = datetime.utcnow()
+    db.session.commit()
+    return {"deleted": deleted, "inserted": inserted, "events": events, "full": full}
+
+
+def load_occurrences(user_ids: List[int], start_date: date, end_date: date) -> Dict[int, List[dict]]:
+    """
+    Occurrences of the users' events within [start_date, end_date].
+    
+    When the materialized index is enabled and its watermark covers the
+    range this is a single range scan on (user_id, occurrence_date);
+    otherwise (including before the first refresh finished) the events are
+    loaded and expanded in memory.
+    
+    Args:
+        user_ids: Users to load occurrences for
+        start_date: Start of date range
+        end_date: End of date range (inclusive)
+    
+    Returns:
+        Dictionary mapping user id to a chronological list of
+        {"event": Event, "occurrence_date": date} dictionaries
+    """
+    grouped = {user_id: [] for user_id in user_ids}
+    
+    if occurrences_enabled():
+        materialized = materialized_range()
+        if materialized is not None and materialized[0] <= start_date and end_date <= materialized[1]:
+            rows = (
+                db.session.query(EventOccurrence.user_id, EventOccurrence.occurrence_date, Event)
+                .join(Event, Event.id == EventOccurrence.event_id)
+                .filter(EventOccurrence.user_id.in_(user_ids))
+                .filter(EventOccurrence.occurrence_date >= start_date)
+                .filter(EventOccurrence.occurrence_date <= end_date)
+                .order_by(EventOccurrence.user_id, EventOccurrence.starts_at, Event.id)
+                .all()
+            )
+            for user_id, occurrence_date, event in rows:
+                grouped[user_id].append({"event": event, "occurrence_date": occurrence_date})
+            return grouped
+    
+    events = (
+        Event.query.filter(Event.user_id.in_(user_ids))
+        .filter(occurring_between(start_date, end_date))
+        .order_by(Event.user_id, Event.start_at.asc())
+        .all()
+    )
+    for event in events:
+        grouped[event.user_id].append(event)
+    return {
+        user_id: expand_recurring_events(user_events, start_date, end_date)
+        for user_id, user_events in grouped.items()
+    }
@@ -0,0 +1,110 @@
+"""Keyset (cursor) pagination for list endpoints."""
+import base64
+import json
+from datetime import datetime
+from typing import List, NamedTuple, Optional
+
+from flask import current_app, request, url_for
+from sqlalchemy import and_, or_, tuple_
+
+
+class Page(NamedTuple):
+    """One page of rows and the cursor of the next page (None on the last page)."""
+
+    items: List
+    next_cursor: Optional[str]
+
+
+def page_size(requested: Optional[int] = None) -> int:
+    """Requested page size clamped to 1..PAGE_SIZE_MAX (PAGE_SIZE_DEFAULT if omitted)."""
+    if not requested:
+        return current_app.config.get("PAGE_SIZE_DEFAULT", 50)
+    return max(1, min(requested, current_app.config.get("PAGE_SIZE_MAX", 200)))
+
+
+def encode_cursor(value, last_id: int) -> str:
+    """Opaque cursor for the position after (value, last_id)."""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([value, last_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, column) -> tuple:
+    """
+    Decode a cursor made by encode_cursor for a sort column.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        value, last_id = json.loads(raw)
+        if value is not None and column.type.python_type is datetime:
+            value = datetime.fromisoformat(value)
+        return value, int(last_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {e}") from e
+
+
+def keyset_paginate(query, column, id_column, cursor: str = None, limit: int = None, nullable: bool = False) -> Page:
+    """
+    Fetch one page of a query ordered by (column, id).
+
+    Instead of OFFSET, the next page starts after the last row seen, so
+    every page is an index range scan no matter how deep the client goes.
+    A nullable sort column is ordered NULLS LAST.
+
+    Args:
+        query: Filtered query (must not be ordered yet)
+        column: Sort column
+        id_column: Unique tie-breaker (primary key)
+        cursor: Cursor from the previous page
+        limit: Requested page size (clamped by page_size)
+        nullable: Whether column can be NULL
+
+    Returns:
+        Page with the rows and the next cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    limit = page_size(limit)
+
+    if cursor:
+        value, last_id = decode_cursor(cursor, column)
+        if value is None:
+            # Already in the NULL tail
+            query = query.filter(column.is_(None), id_column > last_id)
+        elif nullable:
+            query = query.filter(
+                or_(column > value, and_(column == value, id_column > last_id), column.is_(None))
+            )
+        else:
+            query = query.filter(tuple_(column, id_column) > tuple_(value, last_id))
+
+    order = column.asc().nulls_last() if nullable else column.asc()
+    rows = query.order_by(order, id_column.asc()).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, column.key), getattr(last, id_column.key))
+    return Page(rows, next_cursor)
+
+
+def next_page_url(page: Page) -> Optional[str]:
+    """URL of the next page for the current endpoint, keeping the other query args."""
+    if page.next_cursor is None:
+        return None
+    args = {**request.view_args, **request.args.to_dict(), "cursor": page.next_cursor}
+    return url_for(request.endpoint, **args)
+
+
+def add_page_headers(response, page: Page):
+    """Expose the next page as X-Next-Cursor and an RFC 8288 Link header."""
+    if page.next_cursor is not None:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+        response.headers["Link"] = f'<{next_page_url(page)}>; rel="next"'
+    return response
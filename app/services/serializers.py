@@ -0,0 +1,92 @@
+"""Column-projected serializers for list endpoints."""
+from datetime import date
+from typing import Dict, Iterable, List, Sequence
+
+from flask import Response
+
+from app import db
+from app.models.contact import Contact
+from app.models.event import Event
+from app.models.task import Task
+from app.services import fastjson
+
+# orjson writes date/datetime in the same ISO format as isoformat()
+_NATIVE_DATES = fastjson.BACKEND == "orjson"
+
+
+def json_response(payload) -> Response:
+    """JSON response encoded with the fast backend."""
+    return Response(fastjson.dumps(payload), mimetype="application/json")
+
+
+class RowSerializer:
+    """
+    Select only the listed columns of a model as tuples and turn them into
+    the same dictionaries as the model's to_dict(), without hydrating ORM
+    objects.
+
+    The selected rows also support attribute access (row.title,
+    row.due_at), so templates and keyset pagination work on them
+    unchanged.
+    """
+
+    def __init__(self, model, fields: Sequence[str]):
+        self.model = model
+        self.fields = tuple(fields)
+        self.columns = [getattr(model, field) for field in self.fields]
+        self._dates = [
+            i for i, column in enumerate(self.columns)
+            if issubclass(column.type.python_type, date)
+        ]
+
+    def query(self):
+        """Query selecting the projected columns."""
+        return db.session.query(*self.columns)
+
+    def to_dict(self, row) -> Dict:
+        """One row as a JSON-ready dictionary."""
+        values = list(row)
+        for i in self._dates:
+            if values[i] is not None:
+                values[i] = values[i].isoformat()
+        return dict(zip(self.fields, values, strict=True))
+
+    def to_dicts(self, rows: Iterable) -> List[Dict]:
+        """Rows as JSON-ready dictionaries."""
+        fields = self.fields
+        dates = self._dates
+        result = []
+        for row in rows:
+            values = list(row)
+            for i in dates:
+                if values[i] is not None:
+                    values[i] = values[i].isoformat()
+            result.append(dict(zip(fields, values, strict=True)))
+        return result
+
+    def dumps(self, rows: Iterable) -> bytes:
+        """Encode rows as a JSON array with the fast backend."""
+        if _NATIVE_DATES:
+            fields = self.fields
+            return fastjson.dumps([dict(zip(fields, row, strict=True)) for row in rows])
+        return fastjson.dumps(self.to_dicts(rows))
+
+    def response(self, rows: Iterable) -> Response:
+        """JSON array response for rows."""
+        return Response(self.dumps(rows), mimetype="application/json")
+
+
+TASK_SERIALIZER = RowSerializer(Task, (
+    "id", "user_id", "project_id", "title", "notes", "due_at", "priority",
+    "status", "completed_at", "created_at", "updated_at",
+))
+
+EVENT_SERIALIZER = RowSerializer(Event, (
+    "id", "user_id", "title", "description", "location", "start_at", "end_at",
+    "repeat_rule", "created_at", "updated_at",
+))
+
+CONTACT_SERIALIZER = RowSerializer(Contact, (
+    "id", "user_id", "name", "email", "phone", "birthday_date", "name_day_date",
+    "notes", "created_at", "updated_at",
+))
@@ -0,0 +1,49 @@
+"""Streaming JSON / NDJSON responses for large listings."""
+from typing import Callable, Iterable
+
+from flask import Response, current_app, request, stream_with_context
+
+from app.services import fastjson
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+
+def wants_stream() -> bool:
+    """Whether the client asked for the whole listing as a stream (NDJSON or ?stream=1)."""
+    return request.headers.get("Accept") == NDJSON_MIMETYPE or request.args.get("stream") in ("1", "true")
+
+
+def _json_array(rows: Iterable, serialize: Callable):
+    yield b"["
+    first = True
+    for row in rows:
+        if not first:
+            yield b","
+        first = False
+        yield fastjson.dumps(serialize(row))
+    yield b"]"
+
+
+def _ndjson(rows: Iterable, serialize: Callable):
+    for row in rows:
+        yield fastjson.dumps(serialize(row)) + b"\n"
+
+
+def stream_query(query, serialize: Callable) -> Response:
+    """
+    Stream every row of an ordered query without building the full list.
+
+    Rows are fetched in batches of STREAM_YIELD_PER with yield_per and
+    written one by one, so memory per request stays flat regardless of
+    how many rows the user has. The body is NDJSON when the client sent
+    Accept: application/x-ndjson, otherwise a JSON array.
+
+    Args:
+        query: Filtered and ordered query
+        serialize: Row -> JSON-serializable dict
+    """
+    rows = query.yield_per(current_app.config.get("STREAM_YIELD_PER", 500))
+
+    if request.headers.get("Accept") == NDJSON_MIMETYPE:
+        return Response(stream_with_context(_ndjson(rows, serialize)), mimetype=NDJSON_MIMETYPE)
+    return Response(stream_with_context(_json_array(rows, serialize)), mimetype="application/json")
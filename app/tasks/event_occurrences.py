@@ -0,0 +1,42 @@
+"""Materialized event occurrence refresh task."""
+import logging
+import time
+from typing import Dict, Optional
+
+from flask import Flask
+
+from app.services.cache_files import FileLock
+from app.services.occurrences import refresh_occurrences
+
+logger = logging.getLogger(__name__)
+
+
+def refresh_event_occurrences(app: Flask) -> Optional[Dict]:
+    """
+    Extend the event_occurrences table to the rolling horizon.
+    
+    The scheduler runs in every gunicorn worker, so a file lock makes one
+    worker do the refresh while the others skip it. Whether it is a full
+    rebuild is decided from the watermark stored in the database (see
+    refresh_occurrences), so only the first run after enabling the feature
+    rebuilds, whichever worker does it.
+    
+    This function is called by APScheduler.
+    """
+    with app.app_context():
+        lock = FileLock(app.config["EVENT_OCCURRENCES_LOCK_FILE"])
+        if not lock.acquire(blocking=False):
+            logger.info("Event occurrence refresh already running in another worker, skipping")
+            return None
+        
+        try:
+            started = time.monotonic()
+            stats = refresh_occurrences()
+        finally:
+            lock.release()
+        
+        logger.info(
+            f"Event occurrence {'rebuild' if stats['full'] else 'refresh'} completed in {time.monotonic() - started:.2f}s "
+            f"(deleted {stats['deleted']}, inserted {stats['inserted']} for {stats['events']} events)"
+        )
+        return stats
@@ -0,0 +1,21 @@
+"""Background news refresh scheduled task."""
+import logging
+import time
+
+from flask import Flask
+
+from app.services.news import refresh_news
+
+logger = logging.getLogger(__name__)
+
+
+def refresh_news_cache(app: Flask):
+    """
+    Refresh the news cache ahead of readers.
+    
+    This function is called by APScheduler.
+    """
+    with app.app_context():
+        started = time.monotonic()
+        items = refresh_news()
+        logger.info(f"News refresh job completed in {time.monotonic() - started:.2f}s ({len(items)} items)")
@@ -20,6 +20,8 @@ from app.models.project import Project
 from app.models.task import Task
 from app.models.event import Event
 from app.models.contact import Contact
+from app.models.event_occurrence import EventOccurrence
+from app.models.data_version import DataVersion
 
 # this is the Alembic Config object
 config = context.config
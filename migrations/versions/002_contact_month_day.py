@@ -0,0 +1,55 @@
+"""add month/day columns to contacts
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def _month_day(column):
+    """MMDD expression for a date column (EXTRACT compiles per dialect)."""
+    return sa.cast(sa.extract('month', column) * 100 + sa.extract('day', column), sa.Integer)
+
+
+def upgrade():
+    """Add indexed MMDD columns for birthday and name day lookups."""
+    with op.batch_alter_table('contacts') as batch_op:
+        batch_op.add_column(sa.Column('birthday_md', sa.SmallInteger(), nullable=True))
+        batch_op.add_column(sa.Column('name_day_md', sa.SmallInteger(), nullable=True))
+
+    # Backfill existing rows
+    contacts = sa.table(
+        'contacts',
+        sa.column('birthday_date', sa.Date()),
+        sa.column('name_day_date', sa.Date()),
+        sa.column('birthday_md', sa.SmallInteger()),
+        sa.column('name_day_md', sa.SmallInteger()),
+    )
+    op.execute(
+        contacts.update().values(
+            birthday_md=_month_day(contacts.c.birthday_date),
+            name_day_md=_month_day(contacts.c.name_day_date),
+        )
+    )
+
+    op.create_index('ix_contacts_user_birthday_md', 'contacts', ['user_id', 'birthday_md'], unique=False)
+    op.create_index('ix_contacts_user_name_day_md', 'contacts', ['user_id', 'name_day_md'], unique=False)
+
+
+def downgrade():
+    """Drop the MMDD columns."""
+    op.drop_index('ix_contacts_user_name_day_md', table_name='contacts')
+    op.drop_index('ix_contacts_user_birthday_md', table_name='contacts')
+    with op.batch_alter_table('contacts') as batch_op:
+        batch_op.drop_column('name_day_md')
+        batch_op.drop_column('birthday_md')
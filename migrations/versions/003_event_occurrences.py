@@ -0,0 +1,46 @@
+"""create event_occurrences and event_occurrence_state tables
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create the materialized event occurrence table and its watermark row table."""
+    op.create_table('event_occurrences',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('event_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('occurrence_date', sa.Date(), nullable=False),
+        sa.Column('starts_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['event_id'], ['events.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('event_id', 'occurrence_date', name='uq_event_occurrences_event_date')
+    )
+    op.create_index('ix_event_occurrences_user_date', 'event_occurrences', ['user_id', 'occurrence_date'], unique=False)
+    op.create_table('event_occurrence_state',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('materialized_from', sa.Date(), nullable=False),
+        sa.Column('materialized_through', sa.Date(), nullable=False),
+        sa.Column('refreshed_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    """Drop the materialized event occurrence tables."""
+    op.drop_table('event_occurrence_state')
+    op.drop_index('ix_event_occurrences_user_date', table_name='event_occurrences')
+    op.drop_table('event_occurrences')
@@ -0,0 +1,28 @@
+"""add composite indexes for hot queries
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add (user_id, due_at) / (user_id, start_at) indexes."""
+    op.create_index('ix_tasks_user_due', 'tasks', ['user_id', 'due_at'], unique=False)
+    op.create_index('ix_events_user_start', 'events', ['user_id', 'start_at'], unique=False)
+
+
+def downgrade():
+    """Drop the composite indexes."""
+    op.drop_index('ix_events_user_start', table_name='events')
+    op.drop_index('ix_tasks_user_due', table_name='tasks')
@@ -0,0 +1,26 @@
+"""add contacts (user_id, name, id) index for keyset pagination
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add the contact list index."""
+    op.create_index('ix_contacts_user_name', 'contacts', ['user_id', 'name', 'id'], unique=False)
+
+
+def downgrade():
+    """Drop the contact list index."""
+    op.drop_index('ix_contacts_user_name', table_name='contacts')
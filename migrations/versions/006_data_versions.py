@@ -0,0 +1,32 @@
+"""create data_versions table for conditional GET
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create the per-user data version table with a row for every user."""
+    op.create_table('data_versions',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id')
+    )
+    op.execute("INSERT INTO data_versions (user_id, version) SELECT id, 0 FROM users")
+
+
+def downgrade():
+    """Drop the per-user data version table."""
+    op.drop_table('data_versions')
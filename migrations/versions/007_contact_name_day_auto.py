@@ -0,0 +1,28 @@
+"""add contacts.name_day_auto
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add the flag; existing empty name days may be filled automatically."""
+    op.add_column('contacts', sa.Column('name_day_auto', sa.Boolean(), nullable=False, server_default=sa.false()))
+    contacts = sa.table('contacts', sa.column('name_day_date', sa.Date), sa.column('name_day_auto', sa.Boolean))
+    op.execute(contacts.update().where(contacts.c.name_day_date.is_(None)).values(name_day_auto=True))
+
+
+def downgrade():
+    """Drop the flag."""
+    op.drop_column('contacts', 'name_day_auto')
@@ -0,0 +1,26 @@
+"""Fill empty contact name days from the name-day calendar."""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app import create_app  # noqa: E402
+from app.services.contact_name_days import backfill_name_days  # noqa: E402
+
+
+def main():
+    """Usage: python backfill_name_days.py [batch_size] [--overwrite]"""
+    args = [arg for arg in sys.argv[1:] if arg != "--overwrite"]
+    batch_size = int(args[0]) if args else 1000
+    overwrite = "--overwrite" in sys.argv
+
+    app = create_app("development")
+    with app.app_context():
+        print(f"📅 Resolving contact name days (batch size {batch_size}{', overwrite' if overwrite else ''})...")
+        stats = backfill_name_days(batch_size=batch_size, overwrite=overwrite)
+        print(f"✅ {stats['updated']} updated, {stats['unresolved']} without a known name day "
+              f"({stats['scanned']} scanned)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Micro-benchmark: ORM + to_dict + jsonify vs. column-projected serializers."""
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app import create_app, db  # noqa: E402
+from app.models.task import Task  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.services import fastjson  # noqa: E402
+from app.services.serializers import TASK_SERIALIZER  # noqa: E402
+
+
+def seed(user_id: int, rows: int):
+    """Insert rows tasks for one user."""
+    now = datetime(2025, 1, 1, 9, 0)
+    db.session.execute(
+        Task.__table__.insert(),
+        [
+            {
+                "user_id": user_id,
+                "title": f"Task {i}",
+                "notes": "Benchmark task notes",
+                "due_at": now + timedelta(hours=i),
+                "priority": ("LOW", "MEDIUM", "HIGH")[i % 3],
+                "status": "TODO",
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(rows)
+        ],
+    )
+    db.session.commit()
+
+
+def orm_path(app, user_id: int) -> bytes:
+    """Current path: hydrate Task objects, to_dict() each, encode with Flask's JSON provider."""
+    tasks = Task.query.filter_by(user_id=user_id).order_by(Task.due_at, Task.id).all()
+    return app.json.dumps([task.to_dict() for task in tasks]).encode()
+
+
+def projected_path(app, user_id: int) -> bytes:
+    """New path: select column tuples, format in one loop, encode with the fast backend."""
+    rows = TASK_SERIALIZER.query().filter(Task.user_id == user_id).order_by(Task.due_at, Task.id).all()
+    return TASK_SERIALIZER.dumps(rows)
+
+
+def bench(name: str, func, app, user_id: int, rows: int, repeat: int):
+    """Run func repeat times and print the best rows/second."""
+    best = float("inf")
+    for _ in range(repeat):
+        db.session.expire_all()
+        started = time.perf_counter()
+        func(app, user_id)
+        best = min(best, time.perf_counter() - started)
+    print(f"{name:<12} {rows / best:>12,.0f} rows/s  ({best * 1000:.1f} ms for {rows} rows)")
+    return best
+
+
+def main():
+    """Seed an in-memory database and compare both serialization paths."""
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    app = create_app("testing")
+    with app.app_context():
+        db.create_all()
+        user = User(uid="bench_user", email="bench@plannerx.local")
+        db.session.add(user)
+        db.session.commit()
+        seed(user.id, rows)
+
+        # Both paths must produce the same payload
+        assert fastjson.loads(orm_path(app, user.id)) == fastjson.loads(projected_path(app, user.id))
+
+        print(f"📊 Serializing {rows} tasks (JSON backend: {fastjson.BACKEND}, best of {repeat})")
+        orm = bench("ORM+to_dict", orm_path, app, user.id, rows, repeat)
+        projected = bench("projected", projected_path, app, user.id, rows, repeat)
+        print(f"⚡ Speedup: {orm / projected:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
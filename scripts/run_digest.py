@@ -4,8 +4,9 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app import create_app
-from app.tasks.daily_digest import send_daily_digests
+from app import create_app  # noqa: E402
+from app.tasks.daily_digest import send_daily_digests  # noqa: E402
+from app.tasks.news_refresh import refresh_news_cache  # noqa: E402
 
 
 def main():
@@ -15,6 +16,8 @@ def main():
     print("📧 Running daily digest job manually...")
     print("=" * 50)
     
+    # The scheduler may not have warmed the news cache yet
+    refresh_news_cache(app)
     send_daily_digests(app)
     
     print("=" * 50)
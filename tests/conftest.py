@@ -1,5 +1,8 @@
 """Pytest configuration and fixtures."""
+from contextlib import contextmanager
+
 import pytest
+from sqlalchemy import event
 from app import create_app, db
 from app.models.user import User
 from app.models.task import Task
@@ -48,6 +51,38 @@ def auth_headers():
     }
 
 
+@pytest.fixture
+def api_headers(app, test_user):
+    """Dev-token headers of test_user for JSON requests (dev tokens need DEBUG)."""
+    app.config["DEBUG"] = True
+    return {"Authorization": "Bearer dev_test_user_123:test@example.com", "Accept": "application/json"}
+
+
+@pytest.fixture
+def count_queries(app):
+    """
+    Context manager collecting the SQL statements run inside its block.
+
+        with count_queries() as statements:
+            client.get("/tasks/", headers=api_headers)
+        assert not [s for s in statements if "FROM users" in s]
+    """
+    @contextmanager
+    def collect():
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+    return collect
+
+
 @pytest.fixture
 def sample_task(test_user):
     """Create a sample task."""
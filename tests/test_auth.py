@@ -1,5 +1,6 @@
 """Tests for authentication."""
 import pytest
+
 from app.auth.firebase import verify_id_token
 
 
@@ -26,8 +27,8 @@ def test_require_auth_decorator(client, auth_headers):
 
 def test_user_creation_on_first_login(client):
     """Test that user is created on first authenticated request."""
-    from app.models.user import User
     from app import db
+    from app.models.user import User
     
     headers = {
         "Authorization": "Bearer dev_newuser:newuser@example.com",
@@ -51,3 +52,229 @@ def test_invalid_token_format(client):
     
     response = client.get("/tasks/", headers=headers)
     assert response.status_code == 401
+
+
+@pytest.fixture
+def jwks_server():
+    """Serve a rotating JWKS on localhost and sign tokens with its keys."""
+    import json
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    
+    import jwt
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from jwt.algorithms import RSAAlgorithm
+    
+    state = {"keys": {}, "requests": 0, "max_age": 3600}
+    
+    def add_key(kid):
+        state["keys"][kid] = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            state["requests"] += 1
+            keys = []
+            for kid, private_key in state["keys"].items():
+                jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+                keys.append({**jwk, "kid": kid, "alg": "RS256", "use": "sig"})
+            body = json.dumps({"keys": keys}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Cache-Control", f"public, max-age={state['max_age']}, must-revalidate")
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, *args):
+            pass
+    
+    def sign(kid, **claims):
+        now = int(time.time())
+        payload = {
+            "iss": "https://securetoken.google.com/test-project",
+            "aud": "test-project",
+            "sub": "jwks_user",
+            "email": "jwks@example.com",
+            "iat": now,
+            "exp": now + 3600,
+            **claims,
+        }
+        return jwt.encode(payload, state["keys"][kid], algorithm="RS256", headers={"kid": kid})
+    
+    add_key("k1")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    state.update(url=f"http://127.0.0.1:{server.server_port}/jwks", add_key=add_key, sign=sign)
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+def test_verify_rs256_token_with_cached_jwks(app, jwks_server):
+    """Signed tokens are verified against cached keys; rotation refetches once."""
+    import time
+
+    from app.auth.certs import get_key_cache
+    
+    app.config["FIREBASE_CERTS_URL"] = jwks_server["url"]
+    app.config["FIREBASE_PROJECT_ID"] = "test-project"
+    app.config["FIREBASE_ALLOWED_ISSUER"] = "https://securetoken.google.com/test-project"
+    
+    with app.app_context():
+        token = jwks_server["sign"]("k1")
+        assert verify_id_token(token)["uid"] == "jwks_user"
+        assert verify_id_token(token)["email"] == "jwks@example.com"
+        assert jwks_server["requests"] == 1
+        
+        # Expiry follows Cache-Control max-age
+        cache = get_key_cache(jwks_server["url"])
+        assert 3500 < cache.expires_at - time.time() <= 3600
+        
+        # Rotated key: unknown kid triggers a single refetch
+        jwks_server["add_key"]("k2")
+        cache.min_refresh_interval = 0
+        assert verify_id_token(jwks_server["sign"]("k2"))["uid"] == "jwks_user"
+        assert jwks_server["requests"] == 2
+        
+        with pytest.raises(ValueError):
+            verify_id_token(jwks_server["sign"]("k1", aud="other-project"))
+        with pytest.raises(ValueError):
+            verify_id_token(jwks_server["sign"]("k1", exp=int(time.time()) - 60))
+        
+        # Signature made by another key under a known kid
+        forged = jwks_server["sign"]("k2")
+        header, payload, _ = forged.split(".")
+        with pytest.raises(ValueError):
+            verify_id_token(".".join([header, payload, token.split(".")[2]]))
+
+
+def test_emulator_accepts_unsigned_tokens_with_valid_claims(app):
+    """Auth Emulator tokens (alg: none) pass on their claims; production rejects them."""
+    import time
+
+    import jwt
+    
+    app.config["FIREBASE_PROJECT_ID"] = "test-project"
+    app.config["FIREBASE_ALLOWED_ISSUER"] = "https://securetoken.google.com/test-project"
+    
+    def unsigned(**claims):
+        now = int(time.time())
+        payload = {
+            "iss": "https://securetoken.google.com/test-project",
+            "aud": "test-project",
+            "sub": "emulator_user",
+            "email": "emu@example.com",
+            "iat": now,
+            "exp": now + 3600,
+            **claims,
+        }
+        return jwt.encode(payload, None, algorithm="none")
+    
+    app.config["FIREBASE_AUTH_EMULATOR_HOST"] = "127.0.0.1:9099"
+    assert verify_id_token(unsigned())["uid"] == "emulator_user"
+    with pytest.raises(ValueError):
+        verify_id_token(unsigned(aud="other-project"))
+    with pytest.raises(ValueError):
+        verify_id_token(unsigned(iss="https://evil.example.com"))
+    with pytest.raises(ValueError):
+        verify_id_token(unsigned(exp=int(time.time()) - 60))
+    
+    app.config["FIREBASE_AUTH_EMULATOR_HOST"] = ""
+    with pytest.raises(ValueError, match="Unsupported algorithm"):
+        verify_id_token(unsigned())
+
+
+def test_certs_refresh_in_background_before_expiry(jwks_server):
+    """Keys close to expiry are refreshed without blocking the reader."""
+    import time
+
+    from app.auth.certs import PublicKeyCache
+    
+    jwks_server["max_age"] = 60
+    cache = PublicKeyCache(jwks_server["url"], refresh_margin=120)
+    assert cache.get_key("k1") is not None
+    assert jwks_server["requests"] == 1
+    
+    # Within the refresh margin: old key is returned and a refresh starts
+    assert cache.get_key("k1") is not None
+    deadline = time.time() + 5
+    while jwks_server["requests"] < 2 and time.time() < deadline:
+        time.sleep(0.05)
+    assert jwks_server["requests"] == 2
+    assert cache.stats["background_refreshes"] == 1
+
+
+def test_verified_token_cache(app, client, monkeypatch):
+    """Repeated bearer tokens skip verification until the user is deleted."""
+    import app.auth.firebase as firebase
+    from app import db
+    from app.auth.token_cache import get_token_cache
+    from app.models.user import User
+    
+    app.config["DEBUG"] = True
+    calls = []
+    verify = firebase.verify_id_token
+    monkeypatch.setattr(firebase, "verify_id_token", lambda token: calls.append(token) or verify(token))
+    
+    headers = {"Authorization": "Bearer dev_cached:cached@example.com", "Accept": "application/json"}
+    for _ in range(3):
+        assert client.get("/tasks/", headers=headers).status_code == 200
+    assert len(calls) == 1
+    
+    # Statistics are only exposed when enabled
+    assert client.get("/health/auth").get_json() == {"status": "ok"}
+    app.config["HEALTH_DETAILS_ENABLED"] = True
+    stats = client.get("/health/auth").get_json()
+    assert stats["hits"] == 2 and stats["misses"] == 1 and stats["size"] == 1
+    assert stats["hit_rate"] == pytest.approx(2 / 3)
+    
+    db.session.delete(User.query.filter_by(uid="cached").one())
+    db.session.commit()
+    assert get_token_cache().get_stats()["size"] == 0
+    
+    # Deleted user is recreated through a fresh verification
+    assert client.get("/tasks/", headers=headers).status_code == 200
+    assert len(calls) == 2
+
+
+def test_token_cache_lru_and_expiry():
+    """Entries are evicted by size and expire at the token's exp."""
+    import time
+
+    from app.auth.token_cache import TokenCache
+    
+    cache = TokenCache(max_size=2, max_ttl=300)
+    cache.put("a", {"uid": "a"}, 1)
+    cache.put("b", {"uid": "b"}, 2)
+    assert cache.get("a") == ({"uid": "a"}, 1)  # a is now most recent
+    cache.put("c", {"uid": "c"}, 3)
+    assert cache.get("b") is None
+    assert cache.stats["evictions"] == 1
+    
+    cache.put("expired", {"uid": "x", "exp": time.time() - 1}, 4)
+    assert cache.get("expired") is None
+
+
+def test_principal_skips_users_table(app, client, count_queries):
+    """Cached principals serve requests without loading the users row."""
+    from app.auth.principal import get_principal_cache
+    
+    app.config["DEBUG"] = True
+    headers = {"Authorization": "Bearer dev_lazy:lazy@example.com", "Accept": "application/json"}
+    assert client.get("/tasks/", headers=headers).status_code == 200
+    
+    with count_queries() as statements:
+        assert client.get("/tasks/", headers=headers).status_code == 200
+        assert not [s for s in statements if "FROM users" in s]
+        
+        # Settings fields load the ORM user lazily
+        settings = client.get("/settings/", headers=headers).get_json()
+        assert settings["email"] == "lazy@example.com"
+    
+    # Updating settings invalidates the cached principal
+    misses = get_principal_cache().stats["misses"]
+    response = client.post("/settings/update", json={"digest_enabled": False}, headers=headers)
+    assert response.get_json()["digest_enabled"] is False
+    assert client.get("/tasks/", headers=headers).status_code == 200
+    assert get_principal_cache().stats["misses"] == misses + 1
@@ -0,0 +1,168 @@
+"""Tests for the recurrence engine."""
+from datetime import date, datetime, timedelta
+
+from app import db
+from app.models.event import Event
+from app.services.calendar import expand_recurring_events, occurrence_dates, occurring_between
+
+
+def test_occurrences_jump_to_window():
+    """Old series produce only the occurrences inside the window."""
+    origin = date(2022, 3, 15)  # a Tuesday
+
+    daily = list(occurrence_dates(origin, "DAILY", date(2025, 6, 1), date(2025, 6, 3)))
+    assert daily == [date(2025, 6, 1), date(2025, 6, 2), date(2025, 6, 3)]
+
+    weekly = list(occurrence_dates(origin, "WEEKLY", date(2025, 6, 2), date(2025, 6, 15)))
+    assert weekly == [date(2025, 6, 3), date(2025, 6, 10)]
+
+    # Window before the series starts
+    assert list(occurrence_dates(origin, "DAILY", date(2022, 3, 1), date(2022, 3, 14))) == []
+    assert list(occurrence_dates(origin, "NONE", date(2022, 3, 15), date(2022, 3, 15))) == [origin]
+
+
+def test_monthly_keeps_day_of_month():
+    """Monthly series clamp short months without drifting."""
+    origin = date(2025, 1, 31)
+    months = list(occurrence_dates(origin, "MONTHLY", date(2025, 1, 1), date(2025, 4, 30)))
+    assert months == [date(2025, 1, 31), date(2025, 2, 28), date(2025, 3, 31), date(2025, 4, 30)]
+
+    leap = list(occurrence_dates(origin, "MONTHLY", date(2028, 2, 1), date(2028, 2, 29)))
+    assert leap == [date(2028, 2, 29)]
+
+
+def test_query_selects_series_started_before_window(app, test_user):
+    """Recurring series from the past are loaded and expanded for today."""
+    today = date(2025, 6, 4)
+    with app.app_context():
+        db.session.add_all([
+            Event(user_id=test_user.id, title="Standup", repeat_rule="DAILY",
+                  start_at=datetime(2022, 1, 3, 9, 0)),
+            Event(user_id=test_user.id, title="Dentist", repeat_rule="NONE",
+                  start_at=datetime(2025, 6, 4, 8, 0)),
+            Event(user_id=test_user.id, title="Old one-off", repeat_rule="NONE",
+                  start_at=datetime(2025, 6, 1, 8, 0)),
+            Event(user_id=test_user.id, title="Future", repeat_rule="DAILY",
+                  start_at=datetime(2025, 6, 5, 8, 0)),
+        ])
+        db.session.commit()
+
+        events = Event.query.filter(occurring_between(today, today)).all()
+        assert sorted(e.title for e in events) == ["Dentist", "Standup"]
+
+        expanded = expand_recurring_events(events, today, today + timedelta(days=1))
+        assert [(e["event"].title, e["occurrence_date"]) for e in expanded] == [
+            ("Dentist", today),
+            ("Standup", today),
+            ("Standup", today + timedelta(days=1)),
+        ]
+
+
+def test_materialized_occurrences_match_expansion(app, test_user):
+    """The event_occurrences index returns the same rows as in-memory expansion."""
+    from app.models.event_occurrence import EventOccurrence
+    from app.services.occurrences import (
+        load_occurrences,
+        refresh_occurrences,
+        remove_event,
+        sync_event,
+    )
+
+    today = date(2025, 6, 4)
+    with app.app_context():
+        app.config["EVENT_OCCURRENCES_ENABLED"] = True
+        app.config["EVENT_OCCURRENCE_HORIZON_DAYS"] = 30
+
+        weekly = Event(user_id=test_user.id, title="Gym", repeat_rule="WEEKLY",
+                       start_at=datetime(2024, 1, 1, 18, 0))
+        monthly = Event(user_id=test_user.id, title="Rent", repeat_rule="MONTHLY",
+                        start_at=datetime(2025, 1, 31, 8, 0))
+        db.session.add_all([weekly, monthly])
+        db.session.commit()
+
+        stats = refresh_occurrences(today=today)
+        assert stats["events"] == 2
+        assert stats["inserted"] == EventOccurrence.query.count()
+        # Rolling again is a no-op until the horizon moves
+        assert refresh_occurrences(today=today)["inserted"] == 0
+
+        # Incremental update of one series
+        weekly.start_at = datetime(2024, 1, 2, 7, 0)
+        sync_event(weekly, today=today)
+        db.session.commit()
+
+        window = (date(2025, 6, 1), date(2025, 6, 30))
+        materialized = load_occurrences([test_user.id], *window)[test_user.id]
+
+        app.config["EVENT_OCCURRENCES_ENABLED"] = False
+        expanded = load_occurrences([test_user.id], *window)[test_user.id]
+
+        assert [(o["event"].id, o["occurrence_date"]) for o in materialized] == [
+            (o["event"].id, o["occurrence_date"]) for o in expanded
+        ]
+        assert [o["occurrence_date"] for o in materialized if o["event"] is weekly][0] == date(2025, 6, 3)
+
+        app.config["EVENT_OCCURRENCES_ENABLED"] = True
+        remove_event(monthly.id)
+        db.session.commit()
+        assert EventOccurrence.query.filter_by(event_id=monthly.id).count() == 0
+
+
+def test_occurrence_job_single_worker_and_watermark(app, test_user, tmp_path):
+    """Reads expand events until a refresh records its watermark; one worker refreshes at a time."""
+    from app.models.event_occurrence import EventOccurrence
+    from app.services.cache_files import FileLock
+    from app.services.calendar import get_today
+    from app.services.occurrences import _insert, load_occurrences, materialized_range, sync_event
+    from app.tasks.event_occurrences import refresh_event_occurrences
+
+    app.config["EVENT_OCCURRENCES_ENABLED"] = True
+    app.config["EVENT_OCCURRENCE_HORIZON_DAYS"] = 30
+    app.config["EVENT_OCCURRENCES_LOCK_FILE"] = tmp_path / "occurrences.lock"
+    today = get_today()
+
+    gym = Event(user_id=test_user.id, title="Daily gym", repeat_rule="DAILY", start_at=datetime(2024, 1, 1, 18, 0))
+    db.session.add(gym)
+    db.session.commit()
+
+    # Just enabled, nothing materialized yet: events still show
+    assert materialized_range() is None
+    assert [o["event"].title for o in load_occurrences([test_user.id], today, today)[test_user.id]] == ["Daily gym"]
+
+    # Another worker holds the lock: skip
+    other_worker = FileLock(tmp_path / "occurrences.lock")
+    assert other_worker.acquire(blocking=False)
+    try:
+        assert refresh_event_occurrences(app) is None
+    finally:
+        other_worker.release()
+
+    stats = refresh_event_occurrences(app)
+    assert stats["full"] and stats["inserted"] > 0
+    assert materialized_range()[0] <= today < materialized_range()[1]
+
+    # The watermark lives in the database: a run from any worker is incremental
+    assert refresh_event_occurrences(app)["full"] is False
+
+    # Edited while the feature was off: rows are stale, so reads and the next run stop trusting them
+    app.config["EVENT_OCCURRENCES_ENABLED"] = False
+    gym.start_at = datetime(2024, 1, 1, 7, 0)
+    sync_event(gym)
+    db.session.commit()
+    app.config["EVENT_OCCURRENCES_ENABLED"] = True
+    assert materialized_range() is None
+    assert {o.starts_at.hour for o in EventOccurrence.query.all()} == {18}
+    assert load_occurrences([test_user.id], today, today)[test_user.id][0]["event"].start_at.hour == 7
+
+    stats = refresh_event_occurrences(app)
+    assert stats["full"] and stats["deleted"] > 0
+    assert {o.starts_at.hour for o in EventOccurrence.query.all()} == {7}
+
+    # Re-inserting existing rows (a racing writer) is a no-op
+    rows = [
+        {"event_id": o.event_id, "user_id": o.user_id, "occurrence_date": o.occurrence_date, "starts_at": o.starts_at}
+        for o in EventOccurrence.query.all()
+    ]
+    _insert(rows)
+    db.session.commit()
+    assert EventOccurrence.query.count() == len(rows)
@@ -0,0 +1,92 @@
+"""Tests for filling contact name days from the name-day calendar."""
+import json
+from datetime import date
+
+import pytest
+
+from app import db
+from app.models.contact import Contact
+from app.models.data_version import DataVersion
+from app.services.celebrations import celebrants_query
+from app.services.contact_name_days import backfill_name_days
+from app.services.meniny import NAME_DAY_YEAR, first_name, resolve_name_day
+
+
+@pytest.fixture
+def calendar(app, tmp_path):
+    """Small name-day calendar including 29 February."""
+    path = tmp_path / "name_days.json"
+    path.write_text(json.dumps({"02-29": ["Horymír"], "05-15": ["Žofia"], "06-24": ["Ján"]}), encoding="utf-8")
+    app.config["NAME_DAYS_FILE"] = path
+    return path
+
+
+def test_resolve_name_day_from_first_name(calendar):
+    """The first name is looked up case- and accent-insensitively."""
+    assert first_name("Novák, Ján") == "Ján"
+    assert first_name("  zofia  Kováčová ") == "zofia"
+    assert resolve_name_day("Ján Novák") == date(NAME_DAY_YEAR, 6, 24)
+    assert resolve_name_day("ZOFIA Malá") == date(NAME_DAY_YEAR, 5, 15)
+    # Leap-day name days fit the leap NAME_DAY_YEAR
+    assert resolve_name_day("Horymir") == date(NAME_DAY_YEAR, 2, 29)
+    assert resolve_name_day("Xaver") is None
+    assert resolve_name_day("") is None
+
+
+def test_backfill_in_batches(calendar, test_user, count_queries):
+    """Empty name days are filled with one UPDATE per batch, including name_day_md."""
+    manual = date(1990, 1, 2)
+    db.session.add_all(
+        [Contact(user_id=test_user.id, name=f"Ján {i}") for i in range(5)]
+        + [Contact(user_id=test_user.id, name="Žofia"), Contact(user_id=test_user.id, name="Xaver")]
+        + [Contact(user_id=test_user.id, name="Ján Manual", name_day_date=manual)]
+        + [Contact(user_id=test_user.id, name="Ján Cleared", name_day_auto=False)]
+    )
+    db.session.commit()
+    version = db.session.get(DataVersion, test_user.id).version
+
+    with count_queries() as statements:
+        stats = backfill_name_days(batch_size=3)
+    updates = [sql for sql in statements if sql.startswith("UPDATE contacts")]
+
+    assert stats == {"scanned": 7, "updated": 6, "unresolved": 1}
+    # Batches [Ján 0-2], [Ján 3-4, Žofia], [Xaver]: one executemany UPDATE for
+    # each of the first two, the last has nothing to write
+    assert len(updates) == 2
+
+    db.session.expire_all()
+    assert Contact.query.filter_by(name="Ján Manual").one().name_day_date == manual
+    assert Contact.query.filter_by(name="Xaver").one().name_day_date is None
+    assert Contact.query.filter_by(name="Ján Cleared").one().name_day_date is None
+    assert {c.name for c in celebrants_query([test_user.id], date(2025, 6, 24))} == {f"Ján {i}" for i in range(5)}
+    assert db.session.get(DataVersion, test_user.id).version > version
+
+    assert backfill_name_days()["updated"] == 0
+
+
+def test_create_and_rename_fill_name_day(calendar, client, api_headers):
+    """Contacts get a name day on create and follow renames unless it was set or cleared by hand."""
+    headers = api_headers
+
+    created = client.post("/contacts/create", json={"name": "Ján Novák"}, headers=headers).get_json()
+    assert created["name_day_date"] == f"{NAME_DAY_YEAR}-06-24"
+
+    renamed = client.put(f"/contacts/{created['id']}", json={"name": "Žofia Nováková"}, headers=headers).get_json()
+    assert renamed["name_day_date"] == f"{NAME_DAY_YEAR}-05-15"
+
+    manual = client.post("/contacts/create", json={"name": "Ján Malý", "name_day_date": "2024-07-01"},
+                         headers=headers).get_json()
+    renamed = client.put(f"/contacts/{manual['id']}", json={"name": "Žofia Malá"}, headers=headers).get_json()
+    assert renamed["name_day_date"] == "2024-07-01"
+
+    # An explicit empty name day is kept empty on create, later edits and renames
+    empty = client.post("/contacts/create", json={"name": "Ján Prázdny", "name_day_date": ""},
+                        headers=headers).get_json()
+    assert empty["name_day_date"] is None
+    cleared = client.patch(f"/contacts/{created['id']}", json={"name_day_date": None}, headers=headers).get_json()
+    assert cleared["name_day_date"] is None
+    for contact_id in (empty["id"], created["id"]):
+        edited = client.patch(f"/contacts/{contact_id}", json={"notes": "x"}, headers=headers).get_json()
+        assert edited["name_day_date"] is None
+        renamed = client.patch(f"/contacts/{contact_id}", json={"name": "Ján Iný"}, headers=headers).get_json()
+        assert renamed["name_day_date"] is None
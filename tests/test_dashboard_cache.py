@@ -0,0 +1,121 @@
+"""Tests for the dashboard day snapshot cache."""
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app import db
+from app.models.task import Task
+from app.services.calendar import get_timezone, get_today
+from app.services.dashboard_cache import (
+    DashboardCache,
+    FileSnapshotBackend,
+    dashboard_tasks,
+    get_dashboard_cache,
+    next_local_midnight,
+)
+
+
+def count_task_queries(client, count_queries, url, headers):
+    with count_queries() as statements:
+        response = client.get(url, headers=headers)
+    assert response.status_code == 200
+    return response, len([sql for sql in statements if "FROM tasks" in sql])
+
+
+def test_snapshot_hit_and_write_invalidation(app, client, test_user, api_headers, count_queries):
+    """Repeated views are served from the snapshot until the user writes."""
+    due = datetime.combine(get_today(), datetime.min.time()) + timedelta(hours=12)
+    db.session.add(Task(user_id=test_user.id, title="Lunch", due_at=due))
+    db.session.commit()
+
+    response, queries = count_task_queries(client, count_queries, "/dashboard/", api_headers)
+    assert queries > 0
+    assert "Lunch" in response.get_data(as_text=True)
+
+    response, queries = count_task_queries(client, count_queries, "/dashboard/", api_headers)
+    assert queries == 0
+    assert "Lunch" in response.get_data(as_text=True)
+
+    response = client.post("/tasks/create", json={"title": "Dinner", "due_at": (due + timedelta(hours=6)).isoformat()},
+                           headers=api_headers)
+    assert response.status_code == 201
+
+    response, queries = count_task_queries(client, count_queries, "/dashboard/", api_headers)
+    assert queries > 0
+    assert "Dinner" in response.get_data(as_text=True)
+
+    app.config["HEALTH_DETAILS_ENABLED"] = True
+    stats = client.get("/health/dashboard").get_json()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["invalidations"] == 1
+    assert stats["hit_rate"] == pytest.approx(1 / 3)
+
+
+def test_file_backend_is_shared_and_versioned(tmp_path):
+    """Workers share snapshots on disk; stale versions and days miss."""
+    today = get_today()
+    data = {"tasks_today": [{"id": 1, "title": "Shared", "due_at": datetime.combine(today, datetime.min.time())}]}
+
+    writer = DashboardCache(FileSnapshotBackend(tmp_path))
+    reader = DashboardCache(FileSnapshotBackend(tmp_path))
+    writer.put(7, today, 3, data)
+
+    assert reader.get(7, today, 3) == data
+    assert reader.get(7, today, 4) is None
+    assert reader.get(7, today + timedelta(days=1), 3) is None
+
+    writer.invalidate(7)
+    assert reader.get(7, today, 3) is None
+    assert reader.get_stats()["hits"] == 1
+    assert reader.get_stats()["misses"] == 3
+
+
+def test_snapshot_expires_at_local_midnight(app):
+    """Snapshots end at midnight in the configured timezone."""
+    today = date(2025, 3, 30)  # DST change in Europe/Prague
+    midnight = datetime.fromtimestamp(next_local_midnight(today), get_timezone())
+    assert (midnight.date(), midnight.hour, midnight.minute) == (date(2025, 3, 31), 0, 0)
+
+    cache = get_dashboard_cache()
+    cache.put(1, get_today(), 0, {})
+    assert cache.get(1, get_today(), 0) == {}
+    cache.backend.get(1)["expires_at"] = 0
+    assert cache.get(1, get_today(), 0) is None
+
+
+def test_dashboard_tasks_single_scan(app, test_user, count_queries):
+    """One query fills all three task lists with the previous ordering and limits."""
+    app.config["DASHBOARD_OVERDUE_LOOKBACK_DAYS"] = 30
+    today = date(2025, 6, 4)  # Wednesday
+    day = datetime(2025, 6, 4)
+
+    def add(title, due_at, priority="MEDIUM", status="TODO"):
+        db.session.add(Task(user_id=test_user.id, title=title, due_at=due_at, priority=priority, status=status))
+
+    add("ancient", day - timedelta(days=31))
+    for i in range(12):
+        add(f"overdue {i}", day - timedelta(days=20 - i))
+    add("monday", day - timedelta(days=2) + timedelta(hours=9))
+    add("today low", day + timedelta(hours=8), priority="LOW")
+    add("today high", day + timedelta(hours=10), priority="HIGH")
+    add("today medium", day + timedelta(hours=9))
+    add("today done", day + timedelta(hours=9), status="DONE")
+    add("sunday", datetime(2025, 6, 8, 20, 0))
+    add("next week", datetime(2025, 6, 9, 8, 0))
+    add("undated", None)
+    db.session.commit()
+
+    with count_queries() as statements:
+        tasks = dashboard_tasks(test_user.id, today)
+    assert len([sql for sql in statements if "FROM tasks" in sql]) == 1
+
+    titles = {name: [task["title"] for task in rows] for name, rows in tasks.items()}
+    # Same string ordering as ORDER BY priority DESC, due_at
+    assert titles["tasks_today"] == ["today medium", "today low", "today high"]
+    assert titles["tasks_week"] == ["monday", "today low", "today medium", "today high", "sunday"]
+    # Oldest ten within the lookback window; "ancient" is before the cutoff
+    assert titles["overdue_tasks"] == [f"overdue {i}" for i in range(10)]
+
+    app.config["DASHBOARD_OVERDUE_LOOKBACK_DAYS"] = 0
+    assert dashboard_tasks(test_user.id, today)["overdue_tasks"][0]["title"] == "ancient"
@@ -1,10 +1,12 @@
 """Tests for digest functionality."""
-import pytest
 from datetime import date, datetime, timedelta
-from app.services.digest import generate_digest_data, should_send_digest
-from app.models.task import Task
-from app.models.event import Event
+
+import pytest
+
 from app.models.contact import Contact
+from app.models.event import Event
+from app.models.task import Task
+from app.services.digest import generate_digest_data, should_send_digest
 
 
 def test_generate_digest_data(app, test_user):
@@ -103,3 +105,133 @@ def test_overdue_tasks_in_digest(app, test_user):
     
     assert len(digest_data["overdue_tasks"]) >= 1
     assert digest_data["overdue_tasks"][0].title == "Overdue Task"
+
+
+def test_news_bundle_shared_across_users(app, test_user):
+    """Test that one digest run fetches and summarizes news only once."""
+    from unittest.mock import patch
+
+    from app import db
+    from app.models.user import User
+    from app.tasks.daily_digest import send_daily_digests
+    
+    db.session.add(User(uid="second_user", email="second@example.com", digest_enabled=True))
+    db.session.commit()
+    
+    news = [{"title": "Headline", "summary": "Text", "link": "https://example.com/1", "source": "Test"}]
+    
+    with patch("app.services.digest.fetch_news", return_value=news) as mock_fetch, \
+         patch("app.services.digest.summarize_news_with_ai", return_value="Summary") as mock_summary, \
+         patch("app.services.delivery.send_email", return_value=True) as mock_send:
+        stats = send_daily_digests(app)
+    
+    assert mock_fetch.call_count == 1
+    assert mock_summary.call_count == 1
+    assert mock_send.call_count == 2
+    assert stats["success"] == 2
+    assert stats["rendered"] == 2
+
+
+def test_digest_delivery_pool_counts(tmp_path, monkeypatch):
+    """Test that the threaded delivery pool keeps success and error counts correct."""
+    from unittest.mock import patch
+
+    from app import create_app, db
+    from app.config import TestingConfig
+    from app.models.user import User
+    from app.services.delivery import DigestDelivery
+    
+    # File-backed database so each worker thread gets its own connection
+    monkeypatch.setattr(TestingConfig, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{tmp_path / 'digest.sqlite3'}")
+    app = create_app("testing")
+    
+    with app.app_context():
+        for i in range(12):
+            db.session.add(User(uid=f"user{i}", email=f"user{i}@example.com", digest_enabled=True))
+        db.session.add(User(uid="off", email="off@example.com", digest_enabled=False))
+        db.session.commit()
+        user_ids = [user.id for user in User.query.order_by(User.id)]
+    
+    bundle = {"news_items": [], "news_summary": "", "build_seconds": 0.0}
+    
+    def fake_send(to, subject, html, pool=None):
+        return not to.startswith("user1")  # user1, user10, user11 fail
+    
+    with patch("app.services.delivery.send_email", side_effect=fake_send):
+        engine = DigestDelivery(app, bundle, workers=4, render_concurrency=2, send_concurrency=3)
+        stats = engine.run(user_ids)
+    
+    assert stats["total"] == 13
+    assert stats["success"] == 9
+    assert stats["errors"] == 3
+    assert stats["skipped"] == 1
+    assert stats["digests_per_second"] > 0
+    
+    # A failed batch load counts its recipients as errors, not the skipped user too
+    with patch("app.services.delivery.generate_digest_batch", side_effect=RuntimeError("db down")):
+        stats = DigestDelivery(app, bundle, workers=1).run(user_ids)
+    assert (stats["success"], stats["errors"], stats["skipped"]) == (0, 12, 1)
+
+
+def test_digest_batch_uses_one_query_per_table(app, count_queries):
+    """Test that batch loading groups rows per user with a fixed number of queries."""
+    from app import db
+    from app.models.user import User
+    from app.services.digest import generate_digest_batch
+    
+    today = date.today()
+    day = datetime.combine(today, datetime.min.time())
+    users = []
+    for i in range(3):
+        user = User(uid=f"batch{i}", email=f"batch{i}@example.com")
+        db.session.add(user)
+        db.session.flush()
+        users.append(user)
+        db.session.add(Task(user_id=user.id, title=f"Today {i}", due_at=day + timedelta(hours=9), status="TODO"))
+        for d in range(1, 8):
+            db.session.add(Task(user_id=user.id, title=f"Late {i}-{d}", due_at=day - timedelta(days=d), status="TODO"))
+        db.session.add(Contact(user_id=user.id, name=f"Birthday {i}", birthday_date=date(1990, today.month, today.day)))
+        db.session.add(Contact(user_id=user.id, name=f"Other {i}", birthday_date=today + timedelta(days=40)))
+    db.session.commit()
+    for user in users:
+        db.session.refresh(user)
+    
+    bundle = {"news_items": [], "news_summary": ""}
+    with count_queries() as statements:
+        digests = generate_digest_batch(users, news_bundle=bundle, today=today)
+    
+    assert len(statements) == 4  # tasks today, overdue, events, contacts
+    for i, user in enumerate(users):
+        data = digests[user.id]
+        assert [t.title for t in data["tasks_today"]] == [f"Today {i}"]
+        assert [t.title for t in data["overdue_tasks"]] == [f"Late {i}-{d}" for d in range(7, 2, -1)]
+        assert [c.name for c in data["birthdays_today"]] == [f"Birthday {i}"]
+
+
+def test_contact_month_day_columns_and_upcoming(app, test_user):
+    """MMDD columns are kept in sync on write and drive the celebration queries."""
+    from app import db
+    from app.services.celebrations import celebrants_query, upcoming_celebrations
+
+    with app.app_context():
+        anna = Contact(user_id=test_user.id, name="Anna", birthday_date=date(1990, 12, 30))
+        boris = Contact(user_id=test_user.id, name="Boris", name_day_date=date(2000, 1, 2))
+        cyril = Contact(user_id=test_user.id, name="Cyril", birthday_date=date(1985, 6, 1))
+        db.session.add_all([anna, boris, cyril])
+        db.session.commit()
+        assert (anna.birthday_md, boris.name_day_md) == (1230, 102)
+
+        cyril.birthday_date = date(1985, 12, 31)
+        db.session.commit()
+        assert cyril.birthday_md == 1231
+
+        today = celebrants_query([test_user.id], date(2025, 12, 31)).all()
+        assert [c.name for c in today] == ["Cyril"]
+
+        # Window wraps over New Year
+        upcoming = upcoming_celebrations(test_user.id, days=3, today=date(2025, 12, 30))
+        assert [(u["contact"].name, u["kind"], u["date"]) for u in upcoming] == [
+            ("Anna", "birthday", date(2025, 12, 30)),
+            ("Cyril", "birthday", date(2025, 12, 31)),
+            ("Boris", "name_day", date(2026, 1, 2)),
+        ]
@@ -0,0 +1,124 @@
+"""Tests for the email service."""
+import asyncio
+import smtplib
+import socket
+
+import pytest
+
+from app.services.emailer import SMTPPool, build_message, send_email
+
+aiosmtpd_controller = pytest.importorskip("aiosmtpd.controller")
+
+
+class RecordingHandler:
+    """aiosmtpd handler that keeps received messages and client peers."""
+    
+    def __init__(self):
+        self.messages = []
+        self.peers = set()
+        self.reply_delay = 0
+    
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append(envelope)
+        self.peers.add(session.peer)
+        if self.reply_delay:
+            await asyncio.sleep(self.reply_delay)
+        return "250 OK"
+
+
+@pytest.fixture
+def smtp_server():
+    """Run a local SMTP server."""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    
+    handler = RecordingHandler()
+    controller = aiosmtpd_controller.Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    yield handler, port
+    controller.stop()
+
+
+def _message(i):
+    return build_message(f"user{i}@example.com", f"Digest {i}", "<p>Hi</p>", email_from="test@example.com")
+
+
+def test_pool_reuses_connection(smtp_server):
+    """Test that many messages go over one authenticated session."""
+    handler, port = smtp_server
+    
+    with SMTPPool("127.0.0.1", port, starttls=False, size=1) as pool:
+        for i in range(5):
+            pool.send(_message(i))
+    
+    assert len(handler.messages) == 5
+    assert len(handler.peers) == 1
+    assert pool.stats["connections"] == 1
+
+
+def test_pool_rotates_at_message_limit(smtp_server):
+    """Test that sessions are replaced after max_messages."""
+    handler, port = smtp_server
+    
+    with SMTPPool("127.0.0.1", port, starttls=False, size=1, max_messages=2) as pool:
+        for i in range(5):
+            pool.send(_message(i))
+    
+    assert len(handler.messages) == 5
+    assert pool.stats["connections"] == 3
+
+
+def test_pool_reconnects_after_disconnect(smtp_server):
+    """Test that a dropped session is replaced and the message retried."""
+    handler, port = smtp_server
+    
+    with SMTPPool("127.0.0.1", port, starttls=False, size=1) as pool:
+        pool.send(_message(0))
+        # Simulate the server dropping the idle session
+        pool._idle.queue[0].close()
+        pool.send(_message(1))
+    
+    assert len(handler.messages) == 2
+    assert pool.stats["reconnects"] == 1
+
+
+def test_pool_retries_reset_session(smtp_server):
+    """Test that a session reset before DATA is replaced and the message retried."""
+    handler, port = smtp_server
+    
+    with SMTPPool("127.0.0.1", port, starttls=False, size=1) as pool:
+        pool.send(_message(0))
+        pool._idle.queue[0].sock.shutdown(socket.SHUT_RDWR)
+        pool.send(_message(1))
+    
+    assert len(handler.messages) == 2
+    assert pool.stats["reconnects"] == 1
+
+
+def test_pool_does_not_retry_timeout_after_data(smtp_server):
+    """Test that a timeout waiting for the DATA reply is raised, not resent."""
+    handler, port = smtp_server
+    handler.reply_delay = 1
+    
+    with SMTPPool("127.0.0.1", port, starttls=False, size=1, timeout=0.2) as pool:
+        # smtplib reports the read timeout as a disconnect
+        with pytest.raises(smtplib.SMTPServerDisconnected, match="timed out"):
+            pool.send(_message(0))
+    
+    assert len(handler.messages) == 1
+    assert pool.stats["reconnects"] == 0
+
+
+def test_send_email_through_pool(app, smtp_server):
+    """Test that send_email delivers through a shared pool."""
+    handler, port = smtp_server
+    app.config.update(SMTP_HOST="127.0.0.1", SMTP_PORT=port, SMTP_USER="user", SMTP_PASSWORD="secret")
+    
+    # The local server has no AUTH, so the pool itself logs in without credentials
+    with SMTPPool("127.0.0.1", port, starttls=False, size=2) as pool:
+        assert send_email("a@example.com", "Hi", "<p>Hi</p>", pool=pool) is True
+        assert send_email("b@example.com", "Hi", "<p>Hi</p>", pool=pool) is True
+    
+    assert [m.rcpt_tos for m in handler.messages] == [["a@example.com"], ["b@example.com"]]
+    assert pool.stats["connections"] == 1
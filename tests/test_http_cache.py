@@ -0,0 +1,79 @@
+"""Tests for per-user data versions and conditional GET."""
+from datetime import datetime
+
+from app import db
+from app.models.data_version import DataVersion
+from app.models.task import Task
+from app.services.bulk_tasks import apply_bulk_operations
+
+
+def data_version(user_id):
+    return db.session.query(DataVersion.version).filter(DataVersion.user_id == user_id).scalar()
+
+
+def test_writes_bump_data_version(app, test_user):
+    """ORM writes and bulk operations of tracked rows bump the owner's version."""
+    assert data_version(test_user.id) == 0
+
+    task = Task(user_id=test_user.id, title="Write", due_at=datetime(2025, 6, 4, 9, 0))
+    db.session.add(task)
+    db.session.commit()
+    assert data_version(test_user.id) == 1
+
+    task.title = "Rewrite"
+    db.session.commit()
+    assert data_version(test_user.id) == 2
+
+    apply_bulk_operations(test_user.id, [{"action": "status", "ids": [task.id], "status": "DONE"}])
+    db.session.commit()
+    assert data_version(test_user.id) == 3
+
+    # Nothing matched, nothing changed
+    apply_bulk_operations(test_user.id, [{"action": "delete", "ids": [task.id + 100]}])
+    db.session.commit()
+    assert data_version(test_user.id) == 3
+
+
+def test_conditional_get_returns_304_until_a_write(app, client, test_user, api_headers, count_queries):
+    """A matching If-None-Match is answered without running the view's queries."""
+    db.session.add(Task(user_id=test_user.id, title="Cached", due_at=datetime(2025, 6, 4, 9, 0)))
+    db.session.commit()
+
+    first = client.get("/tasks/?filter=all", headers=api_headers)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    with count_queries() as statements:
+        second = client.get("/tasks/?filter=all", headers={**api_headers, "If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.headers["ETag"] == etag
+    assert not any("FROM tasks" in sql for sql in statements)
+
+    # Another representation of the same URL has its own ETag
+    html = client.get("/tasks/?filter=all", headers={**api_headers, "Accept": "text/html", "If-None-Match": etag})
+    assert html.status_code == 200
+
+    response = client.post(
+        "/tasks/create", json={"title": "New"}, headers=api_headers
+    )
+    assert response.status_code == 201
+
+    third = client.get("/tasks/?filter=all", headers={**api_headers, "If-None-Match": etag})
+    assert third.status_code == 200
+    assert third.headers["ETag"] != etag
+    assert {t["title"] for t in third.get_json()} == {"Cached", "New"}
+
+
+def test_dashboard_etag(app, client, test_user, api_headers):
+    """The dashboard revalidates with 304 until the user's data changes."""
+    headers = {"Authorization": api_headers["Authorization"]}
+    first = client.get("/dashboard/", headers=headers)
+    assert first.status_code == 200
+
+    etag = first.headers["ETag"]
+    assert client.get("/dashboard/", headers={**headers, "If-None-Match": etag}).status_code == 304
+
+    db.session.add(Task(user_id=test_user.id, title="Changed"))
+    db.session.commit()
+    assert client.get("/dashboard/", headers={**headers, "If-None-Match": etag}).status_code == 200
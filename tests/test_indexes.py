@@ -0,0 +1,130 @@
+"""Check that hot queries are served by indexes (EXPLAIN)."""
+import os
+import uuid
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import func
+
+from app import db
+from app.models.contact import Contact
+from app.models.event import Event
+from app.models.task import Task
+from app.services.calendar import occurring_between
+from app.services.celebrations import celebrants_query
+from app.services.dashboard_cache import open_tasks_query
+
+
+def hot_queries(user_id):
+    """(name, query, indexes the plan must use) for the dashboard/digest/list query shapes."""
+    today = date(2025, 6, 4)
+    day_start = datetime.combine(today, datetime.min.time())
+    day_end = day_start + timedelta(days=1)
+    week_end = day_start + timedelta(days=7)
+
+    open_tasks = Task.query.filter(Task.user_id == user_id).filter(Task.status != "DONE")
+    overdue_ranked = (
+        db.session.query(
+            Task.id,
+            func.row_number().over(partition_by=Task.user_id, order_by=Task.due_at).label("rank"),
+        )
+        .filter(Task.user_id.in_([user_id, user_id + 1]))
+        .filter(Task.status != "DONE")
+        .filter(Task.due_at < day_start)
+    )
+
+    return [
+        ("tasks today", open_tasks.filter(Task.due_at >= day_start, Task.due_at < day_end)
+            .order_by(Task.priority.desc(), Task.due_at.asc()), {"ix_tasks_user_due"}),
+        ("overdue", open_tasks.filter(Task.due_at < day_start).order_by(Task.due_at.asc()).limit(10),
+            {"ix_tasks_user_due"}),
+        ("dashboard tasks", open_tasks_query(user_id, day_start - timedelta(days=90), week_end),
+            {"ix_tasks_user_due"}),
+        ("digest overdue", overdue_ranked, {"ix_tasks_user_due"}),
+        ("task list week", Task.query.filter_by(user_id=user_id)
+            .filter(Task.due_at >= day_start, Task.due_at < week_end)
+            .order_by(Task.due_at.asc()), {"ix_tasks_user_due"}),
+        ("events today", Event.query.filter_by(user_id=user_id).filter(occurring_between(today, today))
+            .order_by(Event.start_at.asc()), {"ix_events_user_start"}),
+        ("celebrants", celebrants_query([user_id], today),
+            {"ix_contacts_user_birthday_md", "ix_contacts_user_name_day_md"}),
+    ]
+
+
+def explain(query, prefix):
+    """Run EXPLAIN on a query with its bound parameters; return the plan text."""
+    connection = db.session.connection()
+    compiled = query.statement.compile(dialect=connection.dialect, compile_kwargs={"render_postcompile": True})
+    params = compiled.params
+    if compiled.positional:
+        params = tuple(params[name] for name in compiled.positiontup)
+    rows = connection.exec_driver_sql(f"{prefix} {compiled}", params).fetchall()
+    return "\n".join(str(row[-1]) for row in rows)
+
+
+def seed(user_id):
+    """A few rows so planners have something to look at."""
+    now = datetime(2025, 6, 4, 9, 0)
+    db.session.add_all(
+        [Task(user_id=user_id, title=f"t{i}", due_at=now + timedelta(days=i - 5),
+              status="DONE" if i % 3 == 0 else "TODO") for i in range(20)]
+        + [Event(user_id=user_id, title=f"e{i}", start_at=now + timedelta(days=i)) for i in range(10)]
+        + [Contact(user_id=user_id, name=f"c{i}", birthday_date=date(1990, 6, i + 1)) for i in range(10)]
+    )
+    db.session.commit()
+
+
+def test_hot_queries_use_indexes_sqlite(app, test_user):
+    """Every hot query searches a composite index instead of scanning."""
+    seed(test_user.id)
+    for name, query, indexes in hot_queries(test_user.id):
+        plan = explain(query, "EXPLAIN QUERY PLAN")
+        assert all(f"INDEX {index}" in plan for index in indexes), f"{name}: {plan}"
+        assert "SCAN tasks\n" not in plan + "\n" and "SCAN events\n" not in plan + "\n", f"{name}: {plan}"
+
+
+@pytest.mark.skipif(not os.getenv("TEST_POSTGRES_URL"), reason="set TEST_POSTGRES_URL to run against PostgreSQL")
+def test_hot_queries_use_indexes_postgres(monkeypatch):
+    """
+    Same check on PostgreSQL (sequential scans disabled so tiny tables still show the index).
+
+    Tables live in a throwaway schema that is dropped afterwards, so the
+    database behind TEST_POSTGRES_URL is left untouched.
+    """
+    from sqlalchemy import create_engine
+
+    from app import create_app
+    from app.config import TestingConfig
+    from app.models.user import User
+
+    url = os.environ["TEST_POSTGRES_URL"]
+    schema = f"explain_{uuid.uuid4().hex[:12]}"
+    admin = create_engine(url)
+    with admin.begin() as connection:
+        connection.exec_driver_sql(f'CREATE SCHEMA "{schema}"')
+
+    monkeypatch.setattr(TestingConfig, "SQLALCHEMY_DATABASE_URI", url)
+    monkeypatch.setattr(TestingConfig, "SQLALCHEMY_ENGINE_OPTIONS",
+                        {"connect_args": {"options": f"-csearch_path={schema}"}}, raising=False)
+    try:
+        app = create_app("testing")
+        with app.app_context():
+            try:
+                db.create_all()
+                user = User(uid="explain_pg", email="pg@example.com")
+                db.session.add(user)
+                db.session.commit()
+                seed(user.id)
+                db.session.execute(db.text("ANALYZE"))
+                db.session.execute(db.text("SET enable_seqscan = off"))
+                for name, query, indexes in hot_queries(user.id):
+                    plan = explain(query, "EXPLAIN")
+                    assert all(index in plan for index in indexes), f"{name}: {plan}"
+            finally:
+                db.session.rollback()
+                db.session.remove()
+                db.engine.dispose()
+    finally:
+        with admin.begin() as connection:
+            connection.exec_driver_sql(f'DROP SCHEMA "{schema}" CASCADE')
+        admin.dispose()
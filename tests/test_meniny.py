@@ -0,0 +1,48 @@
+"""Tests for the name-day registry."""
+import json
+import os
+from datetime import date
+
+from app.services.meniny import find_name_day, get_name_day, get_registry, normalize_name
+
+
+def write_calendar(path, data, mtime=None):
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+def test_lookups_fold_case_and_diacritics(app):
+    """Names are found regardless of case and accents; dates map back to names."""
+    assert normalize_name("  ŽOFIA ") == normalize_name("zofia")
+
+    year = date.today().year
+    assert find_name_day("Žofia") == date(year, 5, 15)
+    assert find_name_day("zofia") == date(year, 5, 15)
+    assert find_name_day("MONIKA") == date(year, 5, 4)
+    # Listed twice: first day in the file wins, as before
+    assert find_name_day("maria") == date(year, 3, 25)
+    assert find_name_day("Nobody") is None
+
+    assert get_name_day(date(2025, 6, 24)) == ["Ján"]
+    assert get_name_day(date(2025, 6, 25)) == []
+
+
+def test_registry_reads_file_once_until_it_changes(app, tmp_path):
+    """Repeated lookups reuse the parsed file; a modified file is reloaded."""
+    path = tmp_path / "name_days.json"
+    write_calendar(path, {"06-24": ["Ján"]}, mtime=1_700_000_000)
+    app.config["NAME_DAYS_FILE"] = path
+
+    for _ in range(50):
+        assert get_name_day(date(2025, 6, 24)) == ["Ján"]
+    registry = get_registry()
+    assert registry.loads == 1
+
+    write_calendar(path, {"06-24": ["Ján", "Jana"]}, mtime=1_700_000_100)
+    assert get_name_day(date(2025, 6, 24)) == ["Ján", "Jana"]
+    assert find_name_day("jana") == date(date.today().year, 6, 24)
+    assert registry.loads == 2
+
+    path.unlink()
+    assert get_name_day(date(2025, 6, 24)) == []
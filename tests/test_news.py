@@ -1,6 +1,6 @@
 """Tests for news service."""
 import pytest
-from app.services.news import fetch_news, summarize_news
+from app.services.news import fetch_news, refresh_news, summarize_news
 from unittest.mock import patch, MagicMock
 
 
@@ -69,3 +69,265 @@ def test_fetch_news_from_feeds(mock_feedparser, app):
         
         # Verify structure
         assert isinstance(news, list)
+
+
+RSS_BODY = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Local</title>
+<item><title>Local News</title><link>https://example.com/local</link>
+<description>Local feed item. Second sentence.</description></item>
+</channel></rss>"""
+
+
+@pytest.fixture
+def feed_server():
+    """Serve a fast RSS feed and a hanging endpoint on localhost."""
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/slow":
+                time.sleep(3)
+            if self.path == "/etag" and self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "application/rss+xml")
+            if self.path == "/etag":
+                self.send_header("ETag", '"v1"')
+            self.end_headers()
+            self.wfile.write(RSS_BODY)
+        
+        def log_message(self, *args):
+            pass
+    
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_fetch_feeds_parallel_with_deadline(feed_server):
+    """Test that a hanging feed only costs its own deadline."""
+    import time
+
+    from app.services.feeds import fetch_feeds, get_feed_stats
+    
+    started = time.monotonic()
+    results = {
+        r["url"]: r
+        for r in fetch_feeds([f"{feed_server}/fast", f"{feed_server}/slow"], feed_timeout=0.5)
+    }
+    elapsed = time.monotonic() - started
+    
+    assert elapsed < 2
+    assert results[f"{feed_server}/fast"]["content"] == RSS_BODY
+    assert results[f"{feed_server}/slow"]["error"]
+    
+    stats = get_feed_stats()
+    assert stats[f"{feed_server}/slow"]["failures"] >= 1
+    assert stats[f"{feed_server}/fast"]["last_latency_ms"] is not None
+
+
+def test_refresh_news_parses_downloaded_feeds(app, tmp_path, feed_server):
+    """Test that refresh_news parses feeds downloaded by the fetch engine."""
+    feeds_file = tmp_path / "feeds.yaml"
+    feeds_file.write_text(f"feeds:\n  - name: Local\n    url: {feed_server}/fast\n")
+    app.config["RSS_FEEDS_FILE"] = feeds_file
+    app.config["RSS_CACHE_FILE"] = tmp_path / "news_cache.json"
+    app.config["RSS_FEED_STORE_DIR"] = tmp_path / "feed_cache"
+    
+    news = refresh_news()
+    
+    assert [item["title"] for item in news] == ["Local News"]
+    assert fetch_news(max_items=5) == news
+    assert news[0]["summary"] == "Local feed item."
+    assert news[0]["source"] == "Local"
+
+
+def test_fetch_news_conditional_revalidation(app, tmp_path, feed_server):
+    """Test that unchanged feeds are revalidated with ETag and served from the store."""
+    feeds_file = tmp_path / "feeds.yaml"
+    feeds_file.write_text(f"feeds:\n  - name: Local\n    url: {feed_server}/etag\n")
+    app.config["RSS_FEEDS_FILE"] = feeds_file
+    app.config["RSS_CACHE_FILE"] = tmp_path / "news_cache.json"
+    app.config["RSS_FEED_STORE_DIR"] = tmp_path / "feed_cache"
+    
+    first = refresh_news()
+    
+    with patch("app.services.news.feedparser") as mock_feedparser:
+        second = refresh_news()
+        mock_feedparser.parse.assert_not_called()
+    
+    assert [item["title"] for item in first] == ["Local News"]
+    assert second == first
+
+
+def test_fetch_news_stale_while_revalidate(app, tmp_path):
+    """Test that a stale cache is served immediately and refreshed in background."""
+    import json
+    import os
+    import time
+    
+    cache_file = tmp_path / "news_cache.json"
+    items = [
+        {"title": f"News {i}", "summary": "", "link": f"https://example.com/{i}", "source": "A" if i < 4 else "B"}
+        for i in range(6)
+    ]
+    cache_file.write_text(json.dumps(items))
+    old = time.time() - 24 * 3600
+    os.utime(cache_file, (old, old))
+    app.config["RSS_CACHE_FILE"] = cache_file
+    app.config["NEWS_REVALIDATE_ON_READ"] = True
+    
+    with patch("app.services.news._refresh_in_background") as mock_refresh, \
+         patch("app.services.feeds.requests") as mock_requests:
+        news = fetch_news(max_items=5)
+        everything = fetch_news(fetch_all=True)
+    
+    # At most 3 headlines per source, no network on the read path
+    assert [item["title"] for item in news] == ["News 0", "News 1", "News 2", "News 4", "News 5"]
+    assert len(everything) == 6
+    assert mock_refresh.call_count == 2
+    mock_requests.get.assert_not_called()
+
+
+def test_refresh_news_single_flight(app, tmp_path):
+    """Test that only the lock holder refreshes; others serve the current cache."""
+    from app.services.cache_files import FileLock, atomic_write_json
+    
+    cache_file = tmp_path / "news_cache.json"
+    atomic_write_json(cache_file, [{"title": "Cached", "link": "https://example.com/c", "source": "A"}])
+    app.config["RSS_CACHE_FILE"] = cache_file
+    
+    lock = FileLock(cache_file.with_suffix(".lock"))
+    assert lock.acquire(blocking=False)
+    try:
+        with patch("app.services.news.fetch_feeds") as mock_fetch:
+            news = refresh_news()
+            mock_fetch.assert_not_called()
+    finally:
+        lock.release()
+    
+    assert [item["title"] for item in news] == ["Cached"]
+
+
+def test_atomic_write_leaves_no_temp_files(tmp_path):
+    """Test that atomic writes replace the target and clean up."""
+    from app.services.cache_files import atomic_write_json, read_json
+    
+    target = tmp_path / "cache.json"
+    atomic_write_json(target, {"a": 1})
+    atomic_write_json(target, {"a": 2, "text": "Žilina"})
+    
+    assert read_json(target) == {"a": 2, "text": "Žilina"}
+    assert [p.name for p in tmp_path.iterdir()] == ["cache.json"]
+    assert read_json(tmp_path / "missing.json", default=[]) == []
+
+
+@pytest.fixture
+def fake_openai(app, tmp_path):
+    """Local OpenAI-compatible chat completions endpoint that counts calls per model."""
+    import json
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    
+    calls = {"gpt-3.5-turbo": 0, "gpt-4o-mini": 0}
+    
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            model = request["model"]
+            calls[model] += 1
+            content = "[1, 0]" if model == "gpt-3.5-turbo" else f"Súhrn {calls[model]}"
+            body = json.dumps({
+                "id": "chatcmpl-test",
+                "object": "chat.completion",
+                "created": 0,
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }],
+            }).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, *args):
+            pass
+    
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    
+    app.config["OPENAI_API_KEY"] = "test-key"
+    app.config["OPENAI_BASE_URL"] = f"http://127.0.0.1:{server.server_port}/v1"
+    app.config["AI_CACHE_DIR"] = tmp_path / "ai_cache"
+    yield calls
+    server.shutdown()
+    server.server_close()
+
+
+def test_ai_summary_cached_by_content(app, fake_openai):
+    """Ranking and summary completions are reused until the headlines change."""
+    from app.services.news import summarize_news_with_ai
+    
+    items = [{"title": f"News {i}", "summary": f"Item {i}.", "source": "Local"} for i in range(3)]
+    
+    assert summarize_news_with_ai(items, max_summary_items=2) == "Súhrn 1"
+    assert fake_openai == {"gpt-3.5-turbo": 1, "gpt-4o-mini": 1}
+    
+    # Repeated digest: both tiers hit
+    assert summarize_news_with_ai(items, max_summary_items=2) == "Súhrn 1"
+    assert fake_openai == {"gpt-3.5-turbo": 1, "gpt-4o-mini": 1}
+    
+    # Misses reuse the app's client instead of opening a new connection pool
+    from app.services.news import _openai_client
+    assert _openai_client("test-key") is _openai_client("test-key")
+    
+    # New headline below the top two: new ranking, same ranked input -> cached summary
+    items.append({"title": "News 3", "summary": "Item 3.", "source": "Local"})
+    assert summarize_news_with_ai(items, max_summary_items=2) == "Súhrn 1"
+    assert fake_openai == {"gpt-3.5-turbo": 2, "gpt-4o-mini": 1}
+    
+    # Different top stories need a new summary
+    items[0]["summary"] = "Updated."
+    assert summarize_news_with_ai(items, max_summary_items=2) == "Súhrn 2"
+    assert fake_openai == {"gpt-3.5-turbo": 2, "gpt-4o-mini": 2}
+
+
+def test_ai_cache_ttl_and_size_bound(tmp_path):
+    """Entries expire after the TTL and the oldest are evicted beyond max_entries."""
+    import os
+    import time
+
+    from app.services.ai_cache import AICache, content_key
+    
+    cache = AICache(tmp_path, ttl=60, max_entries=2)
+    keys = [content_key("1", "model", [f"headline {i}"]) for i in range(3)]
+    assert content_key("2", "model", ["headline 0"]) != keys[0]
+    
+    for i, key in enumerate(keys):
+        cache.put(key, f"value {i}")
+        old = time.time() - 30 + i
+        os.utime(tmp_path / f"{key}.json", (old, old))
+    
+    # Third write evicted the oldest entry
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[2]) == "value 2"
+    assert cache.stats["evictions"] == 1
+    
+    # Expiry reads the same clock as eviction (the file's mtime)
+    old = time.time() - 120
+    os.utime(tmp_path / f"{keys[2]}.json", (old, old))
+    assert cache.get(keys[2]) is None
@@ -0,0 +1,123 @@
+"""Tests for keyset pagination of list endpoints."""
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app import db
+from app.models.contact import Contact
+from app.models.event import Event
+from app.models.task import Task
+
+
+def walk(client, url, headers):
+    """Follow X-Next-Cursor until the last page; return pages of ids."""
+    pages = []
+    cursor = None
+    while True:
+        response = client.get(url + (f"&cursor={cursor}" if cursor else ""), headers=headers)
+        assert response.status_code == 200
+        pages.append([item["id"] for item in response.get_json()])
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return pages
+        assert 'rel="next"' in response.headers["Link"]
+
+
+def test_tasks_keyset_pages_nulls_last(client, test_user, api_headers):
+    """Tasks are paged by (due_at, id) with undated tasks last."""
+    due = datetime(2025, 6, 4, 9, 0)
+    tasks = [
+        Task(user_id=test_user.id, title="later", due_at=due + timedelta(days=1)),
+        Task(user_id=test_user.id, title="undated 1"),
+        Task(user_id=test_user.id, title="tie 1", due_at=due),
+        Task(user_id=test_user.id, title="tie 2", due_at=due),
+        Task(user_id=test_user.id, title="undated 2"),
+    ]
+    db.session.add_all(tasks)
+    db.session.commit()
+    
+    pages = walk(client, "/tasks/?limit=2", api_headers)
+    expected = [tasks[2].id, tasks[3].id, tasks[0].id, tasks[1].id, tasks[4].id]
+    assert pages == [expected[0:2], expected[2:4], expected[4:]]
+    
+    assert client.get("/tasks/?cursor=not-a-cursor", headers=api_headers).status_code == 400
+    
+    # HTML view links to the next page
+    html = client.get("/tasks/?filter=all&limit=2", headers={"Authorization": api_headers["Authorization"]})
+    assert b"cursor=" in html.data and b"filter=all" in html.data
+
+
+def test_contacts_and_events_keyset_pages(app, client, test_user, api_headers):
+    """Contacts page by (name, id) and the event list by (start_at, id); size is capped."""
+    app.config["PAGE_SIZE_MAX"] = 3
+    db.session.add_all(
+        [Contact(user_id=test_user.id, name=name) for name in ["Eva", "Adam", "Eva", "Cyril", "Boris"]]
+        + [Event(user_id=test_user.id, title=f"e{i}", start_at=datetime(2025, 6, 1 + i % 3, 9)) for i in range(7)]
+    )
+    db.session.commit()
+    
+    pages = walk(client, "/contacts/?limit=100", api_headers)
+    assert [len(page) for page in pages] == [3, 2]
+    names = [db.session.get(Contact, contact_id).name for page in pages for contact_id in page]
+    assert names == ["Adam", "Boris", "Cyril", "Eva", "Eva"]
+    
+    pages = walk(client, "/events/?view=list&limit=100", api_headers)
+    events = [db.session.get(Event, event_id) for page in pages for event_id in page]
+    assert len(events) == 7
+    assert [(e.start_at, e.id) for e in events] == sorted((e.start_at, e.id) for e in events)
+
+
+def test_streamed_listings(app, client, test_user, api_headers):
+    """?stream=1 and NDJSON return every row incrementally, in list order."""
+    import json
+    
+    app.config["STREAM_YIELD_PER"] = 7
+    db.session.add_all(
+        [Task(user_id=test_user.id, title=f"t{i}", due_at=datetime(2025, 6, 1) + timedelta(hours=i % 5))
+         for i in range(30)]
+        + [Contact(user_id=test_user.id, name=f"c{i:02d}") for i in range(12)]
+    )
+    db.session.commit()
+    
+    response = client.get("/tasks/?stream=1", headers=api_headers)
+    assert response.is_streamed
+    tasks = json.loads(response.get_data())
+    assert len(tasks) == 30
+    assert [(t["due_at"], t["id"]) for t in tasks] == sorted((t["due_at"], t["id"]) for t in tasks)
+    
+    response = client.get("/contacts/", headers={**api_headers, "Accept": "application/x-ndjson"})
+    assert response.mimetype == "application/x-ndjson"
+    names = [json.loads(line)["name"] for line in response.get_data(as_text=True).splitlines()]
+    assert names == [f"c{i:02d}" for i in range(12)]
+    
+    response = client.get("/contacts/?stream=1", headers=api_headers)
+    assert [c["name"] for c in json.loads(response.get_data())] == names
+
+
+@pytest.mark.parametrize("native_dates", [True, False])
+def test_projected_serializers_match_to_dict(app, client, test_user, sample_task, sample_event, sample_contact,
+                                             api_headers, monkeypatch, native_dates):
+    """Column-projected rows encode exactly like the models' to_dict()."""
+    import app.services.serializers as serializers
+    from app.services import fastjson
+    
+    if native_dates and fastjson.BACKEND != "orjson":
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(serializers, "_NATIVE_DATES", native_dates)
+    sample_task.completed_at = datetime(2025, 6, 4, 9, 30, 15, 123456)
+    sample_contact.name_day_date = date(2000, 6, 4)
+    db.session.commit()
+    
+    for serializer, obj in [
+        (serializers.TASK_SERIALIZER, sample_task),
+        (serializers.EVENT_SERIALIZER, sample_event),
+        (serializers.CONTACT_SERIALIZER, sample_contact),
+    ]:
+        rows = serializer.query().filter(serializer.model.id == obj.id).all()
+        assert fastjson.loads(serializer.dumps(rows)) == [obj.to_dict()]
+    
+    assert client.get("/tasks/", headers=api_headers).get_json() == [sample_task.to_dict()]
+    html = client.get("/contacts/", headers={"Authorization": api_headers["Authorization"]})
+    assert b"Test Contact" in html.data
+    html = client.get("/events/?view=list", headers={"Authorization": api_headers["Authorization"]})
+    assert b"Test Event" in html.data
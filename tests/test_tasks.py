@@ -2,6 +2,9 @@
 import json
 from datetime import datetime, timedelta
 
+from app import db
+from app.models.task import Task
+
 
 def test_create_task(client, auth_headers, test_user):
     """Test creating a new task."""
@@ -114,3 +117,77 @@ def test_user_isolation(client, auth_headers, sample_task):
     )
     
     assert response.status_code == 404
+
+
+def test_bulk_task_operations(app, client, test_user, api_headers, count_queries):
+    """Bulk endpoint applies set-based operations in one transaction."""
+    from app.models.project import Project
+    
+    headers = api_headers
+    now = datetime.now()
+    project = Project(user_id=test_user.id, name="Inbox")
+    overdue = [Task(user_id=test_user.id, title=f"late {i}", due_at=now - timedelta(days=2 + i)) for i in range(3)]
+    undated = Task(user_id=test_user.id, title="undated")
+    other = Task(user_id=test_user.id, title="future", due_at=now + timedelta(days=5))
+    db.session.add_all([project, *overdue, undated, other])
+    db.session.commit()
+    overdue_due = [t.due_at for t in overdue]
+    
+    with count_queries() as statements:
+        response = client.post("/tasks/bulk", headers=headers, json={"operations": [
+            {"action": "snooze", "filter": "overdue", "days": 3},
+            {"action": "status", "ids": [other.id], "status": "DONE"},
+            {"action": "move", "ids": [undated.id, other.id], "project_id": project.id},
+        ]})
+    
+    assert response.status_code == 200
+    assert [r["matched"] for r in response.get_json()["results"]] == [3, 1, 2]
+    assert len([s for s in statements if s.startswith("UPDATE tasks")]) == 3
+    
+    db.session.expire_all()
+    assert [t.due_at for t in overdue] == [d + timedelta(days=3) for d in overdue_due]
+    assert other.status == "DONE" and other.completed_at is not None
+    assert undated.project_id == other.project_id == project.id
+    
+    # Snoozed tasks still match date-range filters
+    tomorrow_tasks = Task.query.filter(Task.due_at >= overdue[0].due_at, Task.due_at <= overdue[0].due_at).all()
+    assert tomorrow_tasks == [overdue[0]]
+    
+    # Invalid operation: nothing is applied
+    response = client.post("/tasks/bulk", headers=headers, json={"operations": [
+        {"action": "delete", "ids": [undated.id]},
+        {"action": "status", "ids": [other.id], "status": "LATER"},
+    ]})
+    assert response.status_code == 400
+    assert db.session.get(Task, undated.id) is not None
+    
+    for operation in ({"action": "delete", "ids": [True]}, {"action": "snooze", "ids": [other.id], "days": True}):
+        response = client.post("/tasks/bulk", headers=headers, json={"operations": [operation]})
+        assert response.status_code == 400
+    
+    undated_id = undated.id
+    response = client.post("/tasks/bulk", headers=headers, json={"operations": [{"action": "delete", "ids": [undated_id]}]})
+    assert response.get_json()["results"][0]["matched"] == 1
+    db.session.expire_all()
+    assert db.session.get(Task, undated_id) is None
+
+
+def test_task_filters_use_configured_timezone(app, test_user, monkeypatch):
+    """today/overdue and bulk operations read the configured timezone's clock, not the server's."""
+    from zoneinfo import ZoneInfo
+
+    from app.services import calendar
+    from app.services.bulk_tasks import apply_bulk_operations, filter_tasks
+
+    # UTC+14: hours ahead of any server clock
+    monkeypatch.setattr(calendar, "get_timezone", lambda: ZoneInfo("Pacific/Kiritimati"))
+    local_now = calendar.get_now()
+    due_at = max(local_now - timedelta(minutes=1), datetime.combine(local_now.date(), datetime.min.time()))
+    task = Task(user_id=test_user.id, title="Local", due_at=due_at)
+    db.session.add(task)
+    db.session.commit()
+
+    query = Task.query.filter_by(user_id=test_user.id)
+    assert filter_tasks(query, "overdue").all() == [task]
+    assert filter_tasks(query, "today").all() == [task]
+    assert apply_bulk_operations(test_user.id, [{"action": "snooze", "filter": "overdue", "days": 1}])[0]["matched"] == 1